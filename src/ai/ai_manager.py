@@ -5,6 +5,7 @@ Handles provider selection, configuration, and polishing operations.
 
 import json
 import os
+from dataclasses import dataclass, field
 from typing import Optional, List, Dict, Any
 from pathlib import Path
 
@@ -14,6 +15,17 @@ from src.utils.logger import get_logger
 logger = get_logger("ai.manager")
 
 
+@dataclass(frozen=True)
+class AISettingsSnapshot:
+    """Read-only view of the persisted AI settings."""
+    provider: Optional[str] = None
+    api_keys: Dict[str, str] = field(default_factory=dict)
+    models: Dict[str, str] = field(default_factory=dict)
+    ollama_url: str = "http://localhost:11434"
+    temperature: float = 0.3
+    max_tokens: int = 2000
+
+
 class AIManager:
     """Manages AI providers and polishing operations."""
     
@@ -23,6 +35,7 @@ class AIManager:
         self._provider: Optional[BaseAIProvider] = None
         self._config: Optional[AIConfig] = None
         self._settings: Dict[str, Any] = {}
+        self._snapshot: Optional[AISettingsSnapshot] = None
         self._load_settings()
     
     def _get_config_path(self) -> Path:
@@ -52,10 +65,12 @@ class AIManager:
                 self._settings = {}
         else:
             self._settings = {}
+        self._snapshot = None
     
     def _save_settings(self):
         """Save AI settings to config file."""
         config_path = self._get_config_path()
+        self._snapshot = None
         
         try:
             with open(config_path, "w") as f:
@@ -64,14 +79,29 @@ class AIManager:
         except Exception as e:
             logger.error(f"Failed to save AI settings: {e}")
     
+    def snapshot(self) -> AISettingsSnapshot:
+        """Get a cached snapshot of the current settings.
+        
+        The snapshot is rebuilt lazily after settings are loaded or saved.
+        """
+        if self._snapshot is None:
+            self._snapshot = AISettingsSnapshot(
+                provider=self._settings.get("provider"),
+                api_keys=dict(self._settings.get("api_keys", {})),
+                models=dict(self._settings.get("models", {})),
+                ollama_url=self._settings.get("ollama_url", "http://localhost:11434"),
+                temperature=self._settings.get("temperature", 0.3),
+                max_tokens=self._settings.get("max_tokens", 2000),
+            )
+        return self._snapshot
+    
     def get_configured_provider(self) -> Optional[str]:
         """Get the currently configured provider name."""
-        return self._settings.get("provider")
+        return self.snapshot().provider
     
     def get_api_key(self, provider: str) -> Optional[str]:
         """Get API key for a provider."""
-        keys = self._settings.get("api_keys", {})
-        return keys.get(provider)
+        return self.snapshot().api_keys.get(provider)
     
     def set_api_key(self, provider: str, api_key: str):
         """Set API key for a provider."""
@@ -83,8 +113,7 @@ class AIManager:
     
     def get_model(self, provider: str) -> Optional[str]:
         """Get selected model for a provider."""
-        models = self._settings.get("models", {})
-        return models.get(provider)
+        return self.snapshot().models.get(provider)
     
     def set_model(self, provider: str, model: str):
         """Set model for a provider."""
@@ -95,7 +124,7 @@ class AIManager:
     
     def get_ollama_url(self) -> str:
         """Get Ollama base URL."""
-        return self._settings.get("ollama_url", "http://localhost:11434")
+        return self.snapshot().ollama_url
     
     def set_ollama_url(self, url: str):
         """Set Ollama base URL."""
@@ -104,13 +133,14 @@ class AIManager:
     
     def configure_provider(self, provider: AIProvider) -> AIConfig:
         """Create configuration for a provider."""
+        snap = self.snapshot()
         config = AIConfig(
             provider=provider,
-            api_key=self.get_api_key(provider.value),
-            base_url=self.get_ollama_url() if provider == AIProvider.OLLAMA else None,
-            model=self.get_model(provider.value) or self._default_model(provider),
-            temperature=self._settings.get("temperature", 0.3),
-            max_tokens=self._settings.get("max_tokens", 2000)
+            api_key=snap.api_keys.get(provider.value),
+            base_url=snap.ollama_url if provider == AIProvider.OLLAMA else None,
+            model=snap.models.get(provider.value) or self._default_model(provider),
+            temperature=snap.temperature,
+            max_tokens=snap.max_tokens
         )
         return config
     
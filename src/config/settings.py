@@ -3,10 +3,11 @@ Settings manager for PersonalTranscribe.
 Handles application preferences, theme settings, and persistent configuration.
 """
 
+import base64
 import json
 import os
 from dataclasses import dataclass, field, asdict
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 
 
@@ -29,10 +30,13 @@ class Settings:
     font_size: int = 14
     show_confidence: bool = True
     gap_threshold: float = 0.5  # seconds
+    file_dialog_use_native: bool = True  # False uses Qt's faster built-in dialog
     
     # Editor settings
     auto_save_enabled: bool = False
     auto_save_interval: int = 60  # seconds
+    auto_save_fsync: bool = False  # flush each autosave to disk (slower)
+    undo_limit: int = 500  # edits kept on the undo stack, 0 = unlimited
     
     # Export settings
     pdf_include_gaps: bool = True
@@ -43,7 +47,10 @@ class Settings:
     window_width: int = 1400
     window_height: int = 900
     window_maximized: bool = False
-    splitter_sizes: list = field(default_factory=lambda: [300, 600])
+    # Qt saveState()/saveGeometry() blobs, base64 encoded (see get_bytes)
+    window_geometry: str = ""
+    window_state: str = ""
+    splitter_state: str = ""
     
     # Recent files
     recent_files: list = field(default_factory=list)
@@ -71,6 +78,9 @@ class SettingsManager:
             self.config_path = Path(config_path)
         
         self.settings = self.load()
+        
+        # Display names for recent files, filled in as entries are added
+        self._recent_names: Dict[str, str] = {}
     
     def load(self) -> Settings:
         """Load settings from config file."""
@@ -93,8 +103,36 @@ class SettingsManager:
         except IOError as e:
             print(f"Error saving settings: {e}")
     
+    def get_bytes(self, name: str) -> bytes:
+        """Get a binary setting stored as base64 text.
+        
+        Args:
+            name: Settings field name
+            
+        Returns:
+            Decoded bytes, or b"" if unset or invalid
+        """
+        value = getattr(self.settings, name, "")
+        if not value:
+            return b""
+        try:
+            return base64.b64decode(value)
+        except (ValueError, TypeError):
+            return b""
+    
+    def set_bytes(self, name: str, data: bytes) -> None:
+        """Store a binary setting as base64 text (not saved until save()).
+        
+        Args:
+            name: Settings field name
+            data: Bytes to store
+        """
+        setattr(self.settings, name, base64.b64encode(bytes(data)).decode("ascii"))
+    
     def add_recent_file(self, file_path: str) -> None:
         """Add a file to recent files list."""
+        self._recent_names[file_path] = os.path.basename(file_path)
+        
         # Remove if already exists
         if file_path in self.settings.recent_files:
             self.settings.recent_files.remove(file_path)
@@ -107,13 +145,30 @@ class SettingsManager:
         
         self.save()
     
-    def get_recent_files(self) -> list:
-        """Get list of recent files that still exist."""
-        existing = [f for f in self.settings.recent_files if os.path.exists(f)]
-        if len(existing) != len(self.settings.recent_files):
-            self.settings.recent_files = existing
+    def get_recent_files(self) -> List[Tuple[str, str]]:
+        """Get recent files with their display names.
+        
+        The filesystem is not touched, so building the menu never wakes a
+        sleeping disk or waits on an unavailable network share. Missing files
+        are dropped with remove_recent_file() when the user tries to open them.
+        
+        Returns:
+            List of (path, file name) tuples, most recent first
+        """
+        names = self._recent_names
+        recent = []
+        for path in self.settings.recent_files:
+            name = names.get(path)
+            if name is None:
+                name = names[path] = os.path.basename(path)
+            recent.append((path, name))
+        return recent
+    
+    def remove_recent_file(self, file_path: str) -> None:
+        """Remove a file from the recent files list."""
+        if file_path in self.settings.recent_files:
+            self.settings.recent_files.remove(file_path)
             self.save()
-        return existing
 
 
 # Global settings instance
@@ -5,14 +5,20 @@ Handles saving and loading project files (.ptproj).
 
 import json
 import os
+import tempfile
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, Dict, Any, Sequence
 from pathlib import Path
 
 from src.models.transcript import Transcript
 from src.models.metadata import RecordingMetadata
 
+# Read once at import: os.umask() can only be queried by setting it, which
+# would race with saves running on worker threads
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
 
 @dataclass
 class Project:
@@ -20,7 +26,7 @@ class Project:
     
     audio_file: str = ""
     transcript: Optional[Transcript] = None
-    vocabulary: List[str] = field(default_factory=list)
+    vocabulary: Sequence[str] = field(default_factory=list)  # may be a shared tuple
     file_path: Optional[str] = None
     created_at: datetime = field(default_factory=datetime.now)
     modified_at: datetime = field(default_factory=datetime.now)
@@ -97,12 +103,17 @@ class ProjectManager:
     PROJECT_EXTENSION = ".ptproj"
     
     @classmethod
-    def save(cls, project: Project, file_path: str) -> None:
+    def save(cls, project: Project, file_path: str, fsync: bool = True) -> None:
         """Save project to file.
         
+        The file is written to a temporary name and renamed over the
+        target, so a crash mid-write never leaves a truncated project.
+        
         Args:
             project: Project to save
             file_path: Path to save to
+            fsync: Flush the file and its directory to disk before returning.
+                Frequent autosaves can skip this; the rename is still atomic.
         """
         # Ensure correct extension
         if not file_path.endswith(cls.PROJECT_EXTENSION):
@@ -115,9 +126,42 @@ class ProjectManager:
         # Convert to JSON
         data = project.to_dict()
         
-        # Write file
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        # Write to a uniquely named temporary file and swap it in, so
+        # overlapping writers never share a temp file
+        fd, tmp_path = tempfile.mkstemp(
+            prefix=os.path.basename(file_path) + ".",
+            suffix=".tmp",
+            dir=os.path.dirname(os.path.abspath(file_path))
+        )
+        try:
+            with open(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+                if fsync:
+                    f.flush()
+                    os.fsync(f.fileno())
+            
+            # mkstemp creates the file as 0600; keep the project's permissions
+            try:
+                mode = os.stat(file_path).st_mode & 0o7777
+            except FileNotFoundError:
+                mode = 0o666 & ~_UMASK
+            os.chmod(tmp_path, mode)
+            
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+        
+        if fsync and os.name != "nt":
+            # Make the rename itself durable (directories can't be opened on Windows)
+            dir_fd = os.open(os.path.dirname(os.path.abspath(file_path)), os.O_RDONLY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
     
     @classmethod
     def load(cls, file_path: str) -> Project:
@@ -5,8 +5,8 @@ Contains Word, Segment, and Transcript classes with JSON serialization.
 
 import json
 import uuid
-from dataclasses import dataclass, field, asdict
-from typing import List, Optional, Dict, Any, Tuple
+from dataclasses import dataclass, field, asdict, replace
+from typing import List, Optional, Dict, Any, Tuple, Iterator
 from datetime import datetime
 
 
@@ -151,6 +151,23 @@ class Transcript:
         self.created_at = created_at or datetime.now()
         self.modified_at = modified_at or datetime.now()
     
+    def snapshot(self) -> "Transcript":
+        """Copy the transcript so it can be saved from another thread.
+        
+        Segments are copied so later edits don't leak into the copy; Word
+        objects are shared since they are never edited in place.
+        
+        Returns:
+            A new Transcript with copied segments
+        """
+        return Transcript(
+            segments=[replace(s, words=list(s.words)) for s in self.segments],
+            audio_duration=self.audio_duration,
+            audio_file=self.audio_file,
+            created_at=self.created_at,
+            modified_at=self.modified_at
+        )
+    
     @property
     def total_speech_duration(self) -> float:
         """Calculate total duration of speech (excluding gaps)."""
@@ -286,14 +303,26 @@ class Transcript:
         Returns:
             Full transcript text
         """
-        lines = []
+        return "\n".join(self.iter_lines(include_timestamps=include_timestamps))
+    
+    def iter_lines(self, include_timestamps: bool = False) -> Iterator[str]:
+        """Yield the transcript as plain text, one line per segment.
+        
+        Lines carry no trailing newline, so joining them with "\n" gives
+        the same text as get_full_text().
+        
+        Args:
+            include_timestamps: If True, prefix each line with timestamp
+            
+        Returns:
+            Iterator over the text lines
+        """
         for segment in self.segments:
             if include_timestamps:
                 timestamp = format_timestamp(segment.start_time)
-                lines.append(f"[{timestamp}] {segment.display_text}")
+                yield f"[{timestamp}] {segment.display_text}"
             else:
-                lines.append(segment.display_text)
-        return "\n".join(lines)
+                yield segment.display_text
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
@@ -5,7 +5,7 @@ Wraps faster-whisper with word-level timestamps and progress reporting.
 
 import os
 import warnings
-from typing import Optional, Callable, List
+from typing import Optional, Callable, List, Union
 from pathlib import Path
 
 # Suppress HuggingFace symlink warning on Windows
@@ -35,7 +35,9 @@ class WhisperEngine:
         self,
         model_size: str = "large-v3",
         device: str = "auto",
-        compute_type: str = "auto"
+        compute_type: str = "auto",
+        num_workers: int = 1,
+        device_index: Union[int, List[int]] = 0
     ):
         """Initialize the Whisper engine.
         
@@ -43,10 +45,16 @@ class WhisperEngine:
             model_size: Model size (tiny, base, small, medium, large-v2, large-v3)
             device: Device to use (cuda, cpu, auto). Auto will try CUDA first.
             compute_type: Compute type (float16, int8, int8_float16, auto)
+            num_workers: Number of transcribe() calls the model can run in
+                parallel when called from several threads
+            device_index: CUDA device, or list of devices to spread the
+                workers over (ignored on CPU)
         """
         self.model_size = model_size
         self.requested_device = device
         self.requested_compute_type = compute_type
+        self.num_workers = max(1, num_workers)
+        self.device_index = device_index
         self.actual_device: str = "cpu"
         self.actual_compute_type: str = "int8"
         self.model: Optional[WhisperModel] = None
@@ -107,7 +115,9 @@ class WhisperEngine:
             self.model = WhisperModel(
                 self.model_size,
                 device=self.actual_device,
-                compute_type=self.actual_compute_type
+                device_index=self.device_index if self.actual_device == "cuda" else 0,
+                compute_type=self.actual_compute_type,
+                num_workers=self.num_workers
             )
             self._is_loaded = True
             
@@ -127,7 +137,8 @@ class WhisperEngine:
                 self.model = WhisperModel(
                     self.model_size,
                     device="cpu",
-                    compute_type="int8"
+                    compute_type="int8",
+                    num_workers=self.num_workers
                 )
                 self._is_loaded = True
                 
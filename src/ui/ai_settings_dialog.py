@@ -3,23 +3,32 @@ AI Settings dialog for PersonalTranscribe.
 Configure AI providers, API keys, and models.
 """
 
+import functools
 from typing import Optional
+from urllib.parse import urlparse
 
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QGroupBox, QLabel,
     QComboBox, QLineEdit, QPushButton, QTabWidget, QWidget,
-    QFormLayout, QMessageBox, QSpinBox, QDoubleSpinBox,
+    QFormLayout, QGridLayout, QMessageBox, QSpinBox, QDoubleSpinBox,
     QDialogButtonBox
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QSignalBlocker, QTimer
 
-from src.ai.provider_base import AIProvider
+from src.ai.provider_base import AIProvider, AIConfig
 from src.ai.ai_manager import get_ai_manager
 from src.utils.logger import get_logger
 
 logger = get_logger("ui.ai_settings")
 
 
+@functools.lru_cache(maxsize=None)
+def _get_ollama_provider_cls():
+    """Import and cache the Ollama provider class on first use."""
+    from src.ai.ollama_provider import OllamaProvider
+    return OllamaProvider
+
+
 class AISettingsDialog(QDialog):
     """Dialog for configuring AI providers."""
     
@@ -33,6 +42,10 @@ class AISettingsDialog(QDialog):
         
         self._init_ui()
         self._load_current_settings()
+        
+        # Warm the Ollama provider import once the dialog is up so the
+        # first "Refresh Models" click doesn't pay for it
+        QTimer.singleShot(0, _get_ollama_provider_cls)
     
     def _init_ui(self):
         """Initialize the UI."""
@@ -51,6 +64,15 @@ class AISettingsDialog(QDialog):
             "Deepseek"
         ])
         self.provider_combo.currentIndexChanged.connect(self._on_provider_changed)
+        
+        # Debounce tab switching so arrowing through providers only lays
+        # out the final selection
+        self._switch_timer = QTimer(self)
+        self._switch_timer.setSingleShot(True)
+        self._switch_timer.setInterval(75)
+        self._switch_timer.timeout.connect(
+            lambda: self.tabs.setCurrentIndex(self.provider_combo.currentIndex())
+        )
         provider_layout.addRow("Provider:", self.provider_combo)
         
         layout.addWidget(provider_group)
@@ -60,12 +82,13 @@ class AISettingsDialog(QDialog):
         
         # OpenAI tab
         openai_tab = QWidget()
-        openai_layout = QFormLayout(openai_tab)
+        openai_layout = QGridLayout(openai_tab)
         
         self.openai_key_edit = QLineEdit()
         self.openai_key_edit.setEchoMode(QLineEdit.EchoMode.Password)
         self.openai_key_edit.setPlaceholderText("sk-...")
-        openai_layout.addRow("API Key:", self.openai_key_edit)
+        openai_layout.addWidget(QLabel("API Key:"), 0, 0)
+        openai_layout.addWidget(self.openai_key_edit, 0, 1)
         
         self.openai_model_combo = QComboBox()
         self.openai_model_combo.setEditable(True)  # Allow typing custom model names
@@ -79,17 +102,20 @@ class AISettingsDialog(QDialog):
             "o1-mini"
         ])
         self.openai_model_combo.setToolTip("Select a model or type a custom model name")
-        openai_layout.addRow("Model:", self.openai_model_combo)
+        openai_layout.addWidget(QLabel("Model:"), 1, 0)
+        openai_layout.addWidget(self.openai_model_combo, 1, 1)
+        openai_layout.setRowStretch(2, 1)
         
         self.tabs.addTab(openai_tab, "OpenAI")
         
         # Ollama tab
         ollama_tab = QWidget()
-        ollama_layout = QFormLayout(ollama_tab)
+        ollama_layout = QGridLayout(ollama_tab)
         
         self.ollama_url_edit = QLineEdit()
         self.ollama_url_edit.setPlaceholderText("http://localhost:11434")
-        ollama_layout.addRow("Ollama URL:", self.ollama_url_edit)
+        ollama_layout.addWidget(QLabel("Ollama URL:"), 0, 0)
+        ollama_layout.addWidget(self.ollama_url_edit, 0, 1)
         
         self.ollama_model_combo = QComboBox()
         self.ollama_model_combo.setEditable(True)
@@ -101,21 +127,24 @@ class AISettingsDialog(QDialog):
             "qwen2.5",
             "phi3"
         ])
-        ollama_layout.addRow("Model:", self.ollama_model_combo)
+        ollama_layout.addWidget(QLabel("Model:"), 1, 0)
+        ollama_layout.addWidget(self.ollama_model_combo, 1, 1)
         
         refresh_btn = QPushButton("Refresh Models")
         refresh_btn.clicked.connect(self._refresh_ollama_models)
-        ollama_layout.addRow("", refresh_btn)
+        ollama_layout.addWidget(refresh_btn, 2, 1)
+        ollama_layout.setRowStretch(3, 1)
         
         self.tabs.addTab(ollama_tab, "Ollama")
         
         # Gemini tab
         gemini_tab = QWidget()
-        gemini_layout = QFormLayout(gemini_tab)
+        gemini_layout = QGridLayout(gemini_tab)
         
         self.gemini_key_edit = QLineEdit()
         self.gemini_key_edit.setEchoMode(QLineEdit.EchoMode.Password)
-        gemini_layout.addRow("API Key:", self.gemini_key_edit)
+        gemini_layout.addWidget(QLabel("API Key:"), 0, 0)
+        gemini_layout.addWidget(self.gemini_key_edit, 0, 1)
         
         self.gemini_model_combo = QComboBox()
         self.gemini_model_combo.setEditable(True)
@@ -125,17 +154,20 @@ class AISettingsDialog(QDialog):
             "gemini-1.5-pro",
             "gemini-1.0-pro"
         ])
-        gemini_layout.addRow("Model:", self.gemini_model_combo)
+        gemini_layout.addWidget(QLabel("Model:"), 1, 0)
+        gemini_layout.addWidget(self.gemini_model_combo, 1, 1)
+        gemini_layout.setRowStretch(2, 1)
         
         self.tabs.addTab(gemini_tab, "Gemini")
         
         # Anthropic tab
         anthropic_tab = QWidget()
-        anthropic_layout = QFormLayout(anthropic_tab)
+        anthropic_layout = QGridLayout(anthropic_tab)
         
         self.anthropic_key_edit = QLineEdit()
         self.anthropic_key_edit.setEchoMode(QLineEdit.EchoMode.Password)
-        anthropic_layout.addRow("API Key:", self.anthropic_key_edit)
+        anthropic_layout.addWidget(QLabel("API Key:"), 0, 0)
+        anthropic_layout.addWidget(self.anthropic_key_edit, 0, 1)
         
         self.anthropic_model_combo = QComboBox()
         self.anthropic_model_combo.setEditable(True)
@@ -146,17 +178,20 @@ class AISettingsDialog(QDialog):
             "claude-3-sonnet-20240229",
             "claude-3-haiku-20240307"
         ])
-        anthropic_layout.addRow("Model:", self.anthropic_model_combo)
+        anthropic_layout.addWidget(QLabel("Model:"), 1, 0)
+        anthropic_layout.addWidget(self.anthropic_model_combo, 1, 1)
+        anthropic_layout.setRowStretch(2, 1)
         
         self.tabs.addTab(anthropic_tab, "Anthropic")
         
         # Deepseek tab
         deepseek_tab = QWidget()
-        deepseek_layout = QFormLayout(deepseek_tab)
+        deepseek_layout = QGridLayout(deepseek_tab)
         
         self.deepseek_key_edit = QLineEdit()
         self.deepseek_key_edit.setEchoMode(QLineEdit.EchoMode.Password)
-        deepseek_layout.addRow("API Key:", self.deepseek_key_edit)
+        deepseek_layout.addWidget(QLabel("API Key:"), 0, 0)
+        deepseek_layout.addWidget(self.deepseek_key_edit, 0, 1)
         
         self.deepseek_model_combo = QComboBox()
         self.deepseek_model_combo.setEditable(True)
@@ -165,7 +200,9 @@ class AISettingsDialog(QDialog):
             "deepseek-coder",
             "deepseek-reasoner"
         ])
-        deepseek_layout.addRow("Model:", self.deepseek_model_combo)
+        deepseek_layout.addWidget(QLabel("Model:"), 1, 0)
+        deepseek_layout.addWidget(self.deepseek_model_combo, 1, 1)
+        deepseek_layout.setRowStretch(2, 1)
         
         self.tabs.addTab(deepseek_tab, "Deepseek")
         
@@ -222,43 +259,54 @@ class AISettingsDialog(QDialog):
     
     def _on_provider_changed(self, index: int):
         """Handle provider selection change."""
-        self.tabs.setCurrentIndex(index)
+        self._switch_timer.start()
+    
+    def reload_settings(self):
+        """Discard unsaved edits and show the saved settings again."""
+        self._load_current_settings()
     
     def _load_current_settings(self):
         """Load current settings into the dialog."""
-        # Load API keys
-        openai_key = self.ai_manager.get_api_key("openai")
-        if openai_key:
-            self.openai_key_edit.setText(openai_key)
-        
-        gemini_key = self.ai_manager.get_api_key("gemini")
-        if gemini_key:
-            self.gemini_key_edit.setText(gemini_key)
-        
-        anthropic_key = self.ai_manager.get_api_key("anthropic")
-        if anthropic_key:
-            self.anthropic_key_edit.setText(anthropic_key)
-        
-        deepseek_key = self.ai_manager.get_api_key("deepseek")
-        if deepseek_key:
-            self.deepseek_key_edit.setText(deepseek_key)
-        
-        # Load Ollama URL
-        ollama_url = self.ai_manager.get_ollama_url()
-        self.ollama_url_edit.setText(ollama_url)
-        
-        # Load current provider
-        current_provider = self.ai_manager.get_configured_provider()
-        if current_provider:
-            providers = ["openai", "ollama", "gemini", "anthropic", "deepseek"]
-            if current_provider in providers:
-                self.provider_combo.setCurrentIndex(providers.index(current_provider))
+        snap = self.ai_manager.snapshot()
+        
+        # Block signals so bulk population does not cascade into slots
+        blockers = [
+            QSignalBlocker(widget) for widget in (
+                self.provider_combo,
+                self.openai_key_edit,
+                self.gemini_key_edit,
+                self.anthropic_key_edit,
+                self.deepseek_key_edit,
+                self.ollama_url_edit,
+            )
+        ]
+        try:
+            # Load API keys
+            self.openai_key_edit.setText(snap.api_keys.get("openai") or "")
+            self.gemini_key_edit.setText(snap.api_keys.get("gemini") or "")
+            self.anthropic_key_edit.setText(snap.api_keys.get("anthropic") or "")
+            self.deepseek_key_edit.setText(snap.api_keys.get("deepseek") or "")
+        
+            # Load Ollama URL
+            self.ollama_url_edit.setText(snap.ollama_url)
+        
+            # Load current provider
+            current_provider = snap.provider
+            if current_provider:
+                providers = ["openai", "ollama", "gemini", "anthropic", "deepseek"]
+                if current_provider in providers:
+                    self.provider_combo.setCurrentIndex(providers.index(current_provider))
+        finally:
+            for blocker in blockers:
+                blocker.unblock()
+        
+        # provider_combo was blocked, so sync the tab explicitly
+        self.tabs.setCurrentIndex(self.provider_combo.currentIndex())
     
     def _refresh_ollama_models(self):
         """Refresh the list of Ollama models."""
         try:
-            from src.ai.ollama_provider import OllamaProvider
-            from src.ai.provider_base import AIConfig
+            OllamaProvider = _get_ollama_provider_cls()
             
             config = AIConfig(
                 provider=AIProvider.OLLAMA,
@@ -269,6 +317,7 @@ class AISettingsDialog(QDialog):
             
             if models:
                 current = self.ollama_model_combo.currentText()
+                blocker = QSignalBlocker(self.ollama_model_combo)
                 self.ollama_model_combo.clear()
                 self.ollama_model_combo.addItems(models)
                 
@@ -276,6 +325,7 @@ class AISettingsDialog(QDialog):
                 idx = self.ollama_model_combo.findText(current)
                 if idx >= 0:
                     self.ollama_model_combo.setCurrentIndex(idx)
+                blocker.unblock()
                 
                 QMessageBox.information(
                     self, 
@@ -291,10 +341,42 @@ class AISettingsDialog(QDialog):
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to refresh models: {e}")
     
+    def _validate_for_test(self, provider: AIProvider) -> Optional[str]:
+        """Check that the inputs required to test a provider are present.
+        
+        Returns:
+            A human-readable error message, or None if the inputs look valid
+        """
+        if provider == AIProvider.OLLAMA:
+            url = self.ollama_url_edit.text().strip() or "http://localhost:11434"
+            parsed = urlparse(url)
+            if parsed.scheme not in ("http", "https") or not parsed.netloc:
+                return f"Invalid Ollama URL: {url}"
+            return None
+        
+        key_edits = {
+            AIProvider.OPENAI: self.openai_key_edit,
+            AIProvider.GEMINI: self.gemini_key_edit,
+            AIProvider.ANTHROPIC: self.anthropic_key_edit,
+            AIProvider.DEEPSEEK: self.deepseek_key_edit,
+        }
+        key_edit = key_edits.get(provider)
+        if key_edit is not None and not key_edit.text().strip():
+            # A key saved earlier is still usable even if the field is blank
+            if not self.ai_manager.get_api_key(provider.value):
+                return "API key is required"
+        return None
+    
     def _test_connection(self):
         """Test the current provider connection."""
         provider = self._get_current_provider()
         
+        error = self._validate_for_test(provider)
+        if error:
+            self.test_result_label.setText(f"Failed: {error}")
+            self.test_result_label.setStyleSheet("color: red;")
+            return
+        
         # Save current settings temporarily
         self._save_current_tab_settings(provider)
         
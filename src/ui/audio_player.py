@@ -8,14 +8,230 @@ from pathlib import Path
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QSlider,
-    QLabel, QComboBox, QFrame, QSizePolicy
+    QLabel, QComboBox, QFrame, QSizePolicy, QGraphicsItem
 )
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QUrl
+from PyQt6.QtCore import Qt, QTimer, QThread, pyqtSignal, QUrl
+from PyQt6.QtGui import QTransform
 from PyQt6.QtMultimedia import QMediaPlayer, QAudioOutput
 
 import soundfile as sf
 import pyqtgraph as pg
 
+from src.models.transcript import format_timestamp
+from src.utils.logger import get_logger
+
+logger = get_logger("audio_player")
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+
+# Coarsest pyramid level stops once it holds fewer points than this
+PYRAMID_MIN_POINTS = 512
+
+# Pyramid levels are stored as int16 scaled by this factor; plenty of
+# dynamic range for pixel display at half the size of float32 samples
+PEAK_SCALE = 32767
+
+# Upper bound on the number of points in the finest pyramid level
+PYRAMID_MAX_BASE_POINTS = 1 << 20
+
+# Number of base bins reduced per block read from disk
+BINS_PER_BLOCK = 4096
+
+# Seekable formats whose peaks are sampled with partial reads once a file is
+# long enough that decoding every sample would dominate load time
+SEEKABLE_FORMATS = {'WAV', 'WAVEX', 'RF64', 'W64', 'AIFF', 'FLAC'}
+SPARSE_MIN_FRAMES = 1 << 28  # ~1.7 hours at 44.1kHz
+SPARSE_BINS = 1 << 16
+SPARSE_READ_FRAMES = 2048
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=True, parallel=True)
+    def _peak_reduce_jit(data, bin_size, out_min, out_max):
+        """Fused single-pass min/max per bin."""
+        for i in prange(out_min.shape[0]):
+            start = i * bin_size
+            lo = data[start]
+            hi = data[start]
+            for j in range(start + 1, start + bin_size):
+                v = data[j]
+                if v < lo:
+                    lo = v
+                elif v > hi:
+                    hi = v
+            out_min[i] = lo
+            out_max[i] = hi
+else:
+    _peak_reduce_jit = None
+
+
+def _peak_reduce(data: np.ndarray, bin_size: int, out_min: np.ndarray, out_max: np.ndarray):
+    """Write the min and max of each full bin of data into out_min/out_max.
+    
+    Uses a fused Numba kernel when numba is installed, otherwise two NumPy
+    reductions over a reshaped view.
+    """
+    n_bins = len(out_min)
+    if _peak_reduce_jit is not None:
+        _peak_reduce_jit(np.ascontiguousarray(data[:n_bins * bin_size]), bin_size, out_min, out_max)
+    else:
+        bins = data[:n_bins * bin_size].reshape(n_bins, bin_size)
+        bins.min(axis=1, out=out_min)
+        bins.max(axis=1, out=out_max)
+
+
+def _downmix(block: np.ndarray, mix: Optional[np.ndarray]) -> np.ndarray:
+    """Downmix a (frames, channels) float32 block to mono.
+    
+    Stereo is summed into the preallocated mix buffer rather than through a
+    temporary array.
+    """
+    channels = block.shape[1]
+    if channels == 1:
+        return block[:, 0]
+    if channels == 2:
+        mono = mix[:len(block)]
+        np.add(block[:, 0], block[:, 1], out=mono)
+        mono *= 0.5
+        return mono
+    return block.mean(axis=1, dtype=np.float32)
+
+
+def _sparse_peaks(f: sf.SoundFile, frames: int) -> tuple:
+    """Sample per-bin peaks by seeking and reading only part of each bin.
+    
+    Touches SPARSE_BINS * SPARSE_READ_FRAMES frames regardless of file
+    length, at the cost of possibly missing peaks between read windows.
+    
+    Returns:
+        Tuple of (mins, maxs, bin_size)
+    """
+    bin_size = -(-frames // SPARSE_BINS)
+    n_bins = -(-frames // bin_size)
+    read_frames = min(bin_size, SPARSE_READ_FRAMES)
+    
+    mins = np.empty(n_bins, dtype=np.float32)
+    maxs = np.empty(n_bins, dtype=np.float32)
+    mix = np.empty(read_frames, dtype=np.float32) if f.channels == 2 else None
+    
+    pos = 0
+    for i in range(n_bins):
+        f.seek(i * bin_size)
+        block = f.read(read_frames, dtype='float32', always_2d=True)
+        if not len(block):
+            break
+        mono = _downmix(block, mix)
+        mins[pos] = mono.min()
+        maxs[pos] = mono.max()
+        pos += 1
+    
+    return mins[:pos], maxs[:pos], bin_size
+
+
+def _stream_peaks(file_path: str) -> tuple:
+    """Compute per-bin min/max peaks by streaming the audio file.
+    
+    Only the peak arrays are kept in memory; the decoded samples are read
+    block by block and discarded. Very long seekable files are sampled with
+    partial reads instead (see _sparse_peaks).
+    
+    Args:
+        file_path: Path to the audio file
+        
+    Returns:
+        Tuple of (mins, maxs, bin_size, sample_rate, frames)
+    """
+    with sf.SoundFile(file_path) as f:
+        frames = len(f)
+        sample_rate = f.samplerate
+        
+        if f.seekable() and f.format in SEEKABLE_FORMATS and frames >= SPARSE_MIN_FRAMES:
+            mins, maxs, bin_size = _sparse_peaks(f, frames)
+            return mins, maxs, bin_size, sample_rate, frames
+        
+        bin_size = max(1, -(-frames // PYRAMID_MAX_BASE_POINTS))
+        n_bins = -(-frames // bin_size)
+        
+        blocksize = bin_size * BINS_PER_BLOCK
+        
+        mins = np.empty(n_bins, dtype=np.float32)
+        maxs = np.empty(n_bins, dtype=np.float32)
+        mix = np.empty(blocksize, dtype=np.float32) if f.channels == 2 else None
+        
+        pos = 0
+        for block in f.blocks(blocksize=blocksize, dtype='float32', always_2d=True):
+            mono = _downmix(block, mix)
+            
+            n_full = len(mono) // bin_size
+            if n_full:
+                _peak_reduce(mono, bin_size, mins[pos:pos + n_full], maxs[pos:pos + n_full])
+                pos += n_full
+            
+            tail = mono[n_full * bin_size:]
+            if len(tail):
+                mins[pos] = tail.min()
+                maxs[pos] = tail.max()
+                pos += 1
+    
+    return mins[:pos], maxs[:pos], bin_size, sample_rate, frames
+
+
+def _to_int16_peaks(values: np.ndarray) -> np.ndarray:
+    """Quantise float peaks in [-1, 1] to int16."""
+    scaled = np.clip(values, -1.0, 1.0) * PEAK_SCALE
+    return scaled.astype(np.int16)
+
+
+def _build_peak_pyramid(mins: np.ndarray, maxs: np.ndarray) -> list:
+    """Build a log-2 min/max decimation pyramid for waveform display.
+    
+    Each level halves the resolution of the previous one, keeping the min
+    and max of every pair of points so no peak is lost when zoomed out.
+    
+    Args:
+        mins: Finest-level minimum per bin
+        maxs: Finest-level maximum per bin
+        
+    Returns:
+        List of (mins, maxs) int16 array tuples, finest level first
+    """
+    mins = _to_int16_peaks(mins)
+    maxs = _to_int16_peaks(maxs)
+    pyramid = [(mins, maxs)]
+    while len(mins) >= PYRAMID_MIN_POINTS * 2:
+        n = len(mins) // 2 * 2
+        mins = mins[:n].reshape(-1, 2).min(axis=1)
+        maxs = maxs[:n].reshape(-1, 2).max(axis=1)
+        pyramid.append((mins, maxs))
+    return pyramid
+
+
+class WaveformLoader(QThread):
+    """Worker thread that reads an audio file into a peak pyramid."""
+    
+    loaded = pyqtSignal(object, int, int, int)  # pyramid, base_bin, sample_rate, frames
+    error = pyqtSignal(str)
+    
+    def __init__(self, file_path: str):
+        super().__init__()
+        self.file_path = file_path
+    
+    def run(self):
+        try:
+            # Stream the file into per-bin peaks instead of decoding it whole
+            mins, maxs, base_bin, sample_rate, frames = _stream_peaks(self.file_path)
+            
+            # Precompute peaks at every zoom level; the view range handler
+            # picks the level matching the visible span
+            pyramid = _build_peak_pyramid(mins, maxs)
+            self.loaded.emit(pyramid, base_bin, sample_rate, frames)
+        except Exception as e:
+            self.error.emit(str(e))
+
 
 class WaveformWidget(pg.PlotWidget):
     """Widget to display audio waveform with click and drag seeking."""
@@ -26,7 +242,12 @@ class WaveformWidget(pg.PlotWidget):
     def __init__(self):
         super().__init__()
         
-        self.audio_data: Optional[np.ndarray] = None
+        self._pyramid: list = []
+        self._base_bin: int = 1  # Samples per point in the finest level
+        self._px_per_sec: float = 0.0
+        self._last_playhead_px: int = -1
+        self._loader: Optional[WaveformLoader] = None  # Most recent request
+        self._running_loaders: set = set()  # Keep threads alive until done
         self.sample_rate: int = 44100
         self.duration: float = 0.0
         self._is_dragging: bool = False
@@ -35,6 +256,7 @@ class WaveformWidget(pg.PlotWidget):
         self.setBackground('#fafafa')
         self.showGrid(x=True, y=False, alpha=0.3)
         self.setMouseEnabled(x=False, y=False)
+        self.plotItem.vb.setAutoVisible(y=False)
         self.hideButtons()
         self.setMenuEnabled(False)
         
@@ -45,6 +267,10 @@ class WaveformWidget(pg.PlotWidget):
         
         # Waveform plot
         self.waveform_plot = self.plot(pen=pg.mkPen('#1976d2', width=1))
+        # Rasterise the curve once so dragging the playhead or regions over
+        # it doesn't repaint the whole path
+        self.waveform_plot.curve.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
+        self.plotItem.vb.sigXRangeChanged.connect(self._on_view_range_changed)
         
         # Playhead line
         self.playhead = pg.InfiniteLine(
@@ -52,7 +278,9 @@ class WaveformWidget(pg.PlotWidget):
             angle=90,
             pen=pg.mkPen('#d32f2f', width=2)
         )
-        self.addItem(self.playhead)
+        # Overlays don't contribute to the view's data bounds, so moving them
+        # doesn't invalidate the cached bounds of every item
+        self.addItem(self.playhead, ignoreBounds=True)
         
         # Segment highlight region
         self.segment_region = pg.LinearRegionItem(
@@ -62,11 +290,16 @@ class WaveformWidget(pg.PlotWidget):
             movable=False
         )
         self.segment_region.setVisible(False)
-        self.addItem(self.segment_region)
+        self.addItem(self.segment_region, ignoreBounds=True)
         
         # Gap regions
         self.gap_regions = []
         
+        # Placeholder shown while a file is loading in the background
+        self.loading_text = pg.TextItem("Loading waveform...", color='#757575', anchor=(0.5, 0.5))
+        self.loading_text.setVisible(False)
+        self.addItem(self.loading_text, ignoreBounds=True)
+        
         # Taller for better visibility
         self.setFixedHeight(150)
         
@@ -75,39 +308,122 @@ class WaveformWidget(pg.PlotWidget):
         self.setCursor(Qt.CursorShape.PointingHandCursor)
     
     def load_audio(self, file_path: str):
-        """Load and display audio waveform."""
-        try:
-            # Read audio file
-            data, self.sample_rate = sf.read(file_path)
-            
-            # Convert to mono if stereo
-            if len(data.shape) > 1:
-                data = np.mean(data, axis=1)
-            
-            self.audio_data = data
-            self.duration = len(data) / self.sample_rate
-            
-            # Downsample for display (max 10000 points for performance)
-            target_points = min(10000, len(data))
-            step = max(1, len(data) // target_points)
-            display_data = data[::step]
-            
-            # Create time axis
-            time_axis = np.linspace(0, self.duration, len(display_data))
-            
-            # Update plot
-            self.waveform_plot.setData(time_axis, display_data)
-            self.setXRange(0, self.duration)
-            self.setYRange(-1, 1)
-            
-            # Reset playhead
-            self.playhead.setPos(0)
-            
-        except Exception as e:
-            print(f"Error loading audio for waveform: {e}")
+        """Load and display audio waveform.
+        
+        Decoding runs on a worker thread; the plot is filled in by
+        _on_waveform_ready once the peaks are available.
+        """
+        self._pyramid = []
+        self.duration = 0.0
+        self.waveform_plot.setData([])
+        
+        vb_x, vb_y = self.plotItem.vb.viewRange()
+        self.loading_text.setPos((vb_x[0] + vb_x[1]) / 2, (vb_y[0] + vb_y[1]) / 2)
+        self.loading_text.setVisible(True)
+        
+        loader = WaveformLoader(file_path)
+        loader.loaded.connect(self._on_waveform_ready)
+        loader.error.connect(self._on_waveform_error)
+        loader.finished.connect(lambda: self._running_loaders.discard(loader))
+        self._loader = loader
+        self._running_loaders.add(loader)
+        loader.start()
+    
+    def _on_waveform_ready(self, pyramid: list, base_bin: int, sample_rate: int, frames: int):
+        """Display a pyramid produced by the background loader."""
+        if self.sender() is not self._loader:
+            return  # A newer file was requested meanwhile
+        self._loader = None
+        self.loading_text.setVisible(False)
+        
+        self._pyramid = pyramid
+        self._base_bin = base_bin
+        self.sample_rate = sample_rate
+        self.duration = frames / sample_rate
+        
+        # Update plot; ranges are fixed, so skip auto-range bookkeeping
+        self.setXRange(0, self.duration)
+        self._update_display()
+        self.setYRange(-1, 1)
+        self.plotItem.vb.disableAutoRange()
+        
+        # Reset playhead
+        self.playhead.setPos(0)
+        self._last_playhead_px = 0
+    
+    def _on_waveform_error(self, error_msg: str):
+        """Handle a failed background load."""
+        if self.sender() is not self._loader:
+            return
+        self._loader = None
+        self.loading_text.setVisible(False)
+        logger.error(f"Error loading audio for waveform: {error_msg}")
+    
+    def _on_view_range_changed(self, _view_box, _x_range):
+        """Re-select the pyramid level when the visible range changes."""
+        self._update_px_per_sec()
+        self._update_display()
+    
+    def _update_px_per_sec(self):
+        """Cache the horizontal scale used to dirty-check the playhead."""
+        x0, x1 = self.plotItem.vb.viewRange()[0]
+        span = x1 - x0
+        self._px_per_sec = self.plotItem.vb.width() / span if span > 0 else 0.0
+        self._last_playhead_px = -1
+    
+    def resizeEvent(self, event):
+        """Recompute the playhead scale when the widget is resized."""
+        super().resizeEvent(event)
+        self._update_px_per_sec()
+    
+    def _update_display(self):
+        """Plot the pyramid level closest to one min/max pair per pixel."""
+        if not self._pyramid or self.duration <= 0:
+            return
+        
+        x0, x1 = self.plotItem.vb.viewRange()[0]
+        x0 = max(0.0, x0)
+        x1 = min(self.duration, x1)
+        if x1 <= x0:
+            return
+        
+        width_px = max(1, int(self.plotItem.vb.width()) or 1000)
+        bins_per_px = (x1 - x0) * self.sample_rate / (width_px * self._base_bin)
+        level = int(np.clip(np.floor(np.log2(max(bins_per_px, 1.0))), 0, len(self._pyramid) - 1))
+        
+        mins, maxs = self._pyramid[level]
+        step = self._base_bin * 2 ** level  # Samples per point at this level
+        i0 = max(0, int(x0 * self.sample_rate / step))
+        i1 = min(len(mins), int(np.ceil(x1 * self.sample_rate / step)) + 1)
+        
+        # Points are evenly spaced, so x is left implicit (0..N-1) and mapped
+        # to seconds by the item transform instead of a time axis array
+        bin_seconds = step / self.sample_rate
+        if step == 1:
+            display_data = mins[i0:i1].astype(np.float32)
+            x_offset = i0 * bin_seconds
+            x_scale = bin_seconds
+        else:
+            # Min at the first quarter of each bin, max at the third
+            display_data = np.empty((i1 - i0) * 2, dtype=np.float32)
+            display_data[0::2] = mins[i0:i1]
+            display_data[1::2] = maxs[i0:i1]
+            x_offset = (i0 + 0.25) * bin_seconds
+            x_scale = bin_seconds / 2
+        display_data *= 1.0 / PEAK_SCALE
+        
+        self.waveform_plot.setData(display_data)
+        self.waveform_plot.setTransform(QTransform(x_scale, 0, 0, 1, x_offset, 0))
     
     def set_position(self, seconds: float):
-        """Update playhead position."""
+        """Update playhead position.
+        
+        Skips the repaint when the playhead would land on the same pixel.
+        """
+        new_px = int(seconds * self._px_per_sec)
+        if new_px == self._last_playhead_px and self._px_per_sec > 0:
+            return
+        self._last_playhead_px = new_px
         self.playhead.setPos(seconds)
     
     def highlight_segment(self, start: float, end: float):
@@ -122,33 +438,41 @@ class WaveformWidget(pg.PlotWidget):
     def show_gaps(self, gaps: list):
         """Display gaps on the waveform.
         
+        Regions are pooled and reused across calls; only the surplus is
+        hidden, so repeated reanalysis doesn't churn the scene graph.
+        
         Args:
             gaps: List of tuples (start, end) or Gap objects
         """
-        self.clear_gaps()
-        
-        for gap in gaps:
+        for i, gap in enumerate(gaps):
             # Handle both Gap objects and tuples
             if hasattr(gap, 'start_time') and hasattr(gap, 'end_time'):
                 start, end = gap.start_time, gap.end_time
             else:
                 start, end = gap
-                
-            region = pg.LinearRegionItem(
-                values=[start, end],
-                brush=pg.mkBrush('#ffcdd280'),  # Light red, semi-transparent
-                pen=pg.mkPen('#ef5350', width=0),  # No border or thin border
-                movable=False
-            )
-            region.setZValue(-10)  # Behind other items
-            self.addItem(region)
-            self.gap_regions.append(region)
+            
+            if i < len(self.gap_regions):
+                region = self.gap_regions[i]
+                region.setRegion([start, end])
+            else:
+                region = pg.LinearRegionItem(
+                    values=[start, end],
+                    brush=pg.mkBrush('#ffcdd280'),  # Light red, semi-transparent
+                    pen=pg.mkPen('#ef5350', width=0),  # No border or thin border
+                    movable=False
+                )
+                region.setZValue(-10)  # Behind other items
+                self.addItem(region, ignoreBounds=True)
+                self.gap_regions.append(region)
+            region.setVisible(True)
+        
+        for region in self.gap_regions[len(gaps):]:
+            region.setVisible(False)
 
     def clear_gaps(self):
-        """Remove all gap regions."""
+        """Hide all gap regions."""
         for region in self.gap_regions:
-            self.removeItem(region)
-        self.gap_regions = []
+            region.setVisible(False)
     
     def mousePressEvent(self, event):
         """Handle mouse click to start seeking."""
@@ -171,7 +495,7 @@ class WaveformWidget(pg.PlotWidget):
             pos = self.plotItem.vb.mapSceneToView(pos_f)
             drag_time = max(0, min(pos.x(), self.duration))
             self.dragging.emit(drag_time)
-            self.playhead.setPos(drag_time)
+            self.set_position(drag_time)
         super().mouseMoveEvent(event)
     
     def mouseReleaseEvent(self, event):
@@ -195,6 +519,8 @@ class AudioPlayer(QWidget):
         self.player.setAudioOutput(self.audio_output)
         
         self.duration_seconds: float = 0.0
+        self._duration_str: str = format_timestamp(0)
+        self._last_int_pos: int = -1
         self.is_looping: bool = False
         self.loop_start: float = 0.0
         self.loop_end: float = 0.0
@@ -206,6 +532,14 @@ class AudioPlayer(QWidget):
         self.position_timer = QTimer()
         self.position_timer.setInterval(50)  # 50ms updates
         self.position_timer.timeout.connect(self._update_position)
+        
+        # Scrub seeks are coalesced so QMediaPlayer only ever works on the
+        # latest drag position instead of queueing every intermediate one
+        self._pending_scrub: float = 0.0
+        self.scrub_timer = QTimer()
+        self.scrub_timer.setSingleShot(True)
+        self.scrub_timer.setInterval(30)
+        self.scrub_timer.timeout.connect(self._apply_scrub)
     
     def _init_ui(self):
         """Initialize the UI."""
@@ -284,12 +618,12 @@ class AudioPlayer(QWidget):
         self._set_controls_enabled(False)
         
         self._slider_being_dragged = False
+        self._last_slider_val = -1
     
     def _connect_signals(self):
         """Connect player signals."""
         self.player.durationChanged.connect(self._on_duration_changed)
         self.player.playbackStateChanged.connect(self._on_playback_state_changed)
-        self.player.positionChanged.connect(self._on_position_changed_internal)
         self.waveform.clicked.connect(self._on_waveform_clicked)
         self.waveform.dragging.connect(self._on_waveform_dragged)
     
@@ -383,6 +717,8 @@ class AudioPlayer(QWidget):
     def _on_duration_changed(self, duration_ms: int):
         """Handle duration change."""
         self.duration_seconds = duration_ms / 1000.0
+        self._duration_str = format_timestamp(self.duration_seconds)
+        self._last_int_pos = -1
         self.duration_changed.emit(self.duration_seconds)
         self._update_time_label()
     
@@ -393,41 +729,58 @@ class AudioPlayer(QWidget):
         else:
             self.play_button.setText("Play")
     
-    def _on_position_changed_internal(self, position_ms: int):
-        """Handle internal position change."""
-        position_seconds = position_ms / 1000.0
+    def _check_loop_boundary(self, position_seconds: float) -> bool:
+        """Enforce loop/segment boundaries.
         
+        Returns:
+            True if playback jumped back to the loop start
+        """
         # Check loop
         if self.is_looping and position_seconds >= self.loop_end:
             self.seek(self.loop_start)
-            return
+            return True
         
         # Check segment end (non-looping)
         if not self.is_looping and self.loop_end > 0 and position_seconds >= self.loop_end:
             self.pause()
             self.loop_end = 0
             self.waveform.clear_highlight()
+        return False
     
     def _update_position(self):
-        """Update position display."""
+        """Update position display.
+        
+        Driven by the 50ms timer; this is the only per-tick path, so the
+        player's own positionChanged signal is left unconnected.
+        """
         position_ms = self.player.position()
         position_seconds = position_ms / 1000.0
         
+        if self._check_loop_boundary(position_seconds):
+            return
+        
         self.waveform.set_position(position_seconds)
         self.position_changed.emit(position_seconds)
         self._update_time_label()
         
         if not self._slider_being_dragged and self.duration_seconds > 0:
             slider_pos = int((position_seconds / self.duration_seconds) * 1000)
-            self.position_slider.setValue(slider_pos)
+            if slider_pos != self._last_slider_val:
+                self._last_slider_val = slider_pos
+                self.position_slider.setValue(slider_pos)
     
     def _update_time_label(self):
-        """Update the time display label."""
-        from src.models.transcript import format_timestamp
+        """Update the time display label.
+        
+        The label shows whole seconds, so it is only rebuilt when the
+        second changes.
+        """
         position = self.player.position() / 1000.0
-        self.time_label.setText(
-            f"{format_timestamp(position)} / {format_timestamp(self.duration_seconds)}"
-        )
+        int_pos = int(position)
+        if int_pos == self._last_int_pos:
+            return
+        self._last_int_pos = int_pos
+        self.time_label.setText(f"{format_timestamp(position)} / {self._duration_str}")
     
     def _on_slider_moved(self, value: int):
         """Handle slider movement."""
@@ -442,6 +795,7 @@ class AudioPlayer(QWidget):
     def _on_slider_released(self):
         """Handle slider release."""
         self._slider_being_dragged = False
+        self._last_slider_val = -1
         if self.duration_seconds > 0:
             value = self.position_slider.value()
             position = (value / 1000.0) * self.duration_seconds
@@ -462,8 +816,15 @@ class AudioPlayer(QWidget):
     
     def _on_waveform_dragged(self, position: float):
         """Handle waveform drag for scrubbing."""
-        # Update position while dragging (real-time scrubbing)
-        self.seek(position)
+        # The playhead follows the mouse immediately; the media seek is
+        # deferred until the drag pauses for a moment
+        self._pending_scrub = position
+        if not self.scrub_timer.isActive():
+            self.scrub_timer.start()
+    
+    def _apply_scrub(self):
+        """Seek the player to the latest scrub position."""
+        self.player.setPosition(int(self._pending_scrub * 1000))
     
     def jump_to_time(self, seconds: float):
         """Jump to a specific time in seconds."""
@@ -13,15 +13,16 @@ class AutosaveWorker(QThread):
     
     finished = pyqtSignal(bool, str)  # success, file_path_or_error
     
-    def __init__(self, project: Project, save_path: str):
+    def __init__(self, project: Project, save_path: str, fsync: bool = True):
         super().__init__()
         self.project = project
         self.save_path = save_path
+        self.fsync = fsync
         
     def run(self):
         try:
             logger.info(f"Starting background autosave to: {self.save_path}")
-            ProjectManager.save(self.project, self.save_path)
+            ProjectManager.save(self.project, self.save_path, fsync=self.fsync)
             self.finished.emit(True, self.save_path)
             logger.info("Background autosave complete")
         except Exception as e:
@@ -4,18 +4,176 @@ Allows processing multiple files in sequence.
 """
 
 import os
-import time
-from typing import List, Optional
+import json
+import queue
+from typing import Dict, List, Optional, Set
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, 
     QListWidget, QPushButton, QProgressBar, 
     QFileDialog, QComboBox, QMessageBox, QGroupBox
 )
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal
+from PyQt6.QtCore import Qt, QObject, QThread, pyqtSignal, QRunnable, QThreadPool
 
 from src.ui.transcription_dialog import TranscriptionWorkerV2
-from src.utils.logger import logger
-from src.transcription.whisper_engine import get_available_models
+from src.utils.logger import get_logger
+from src.transcription.whisper_engine import WhisperEngine, get_available_models
+
+logger = get_logger("batch_dialog")
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _cuda_device_count() -> int:
+    """Number of CUDA devices CTranslate2 can use (0 if none)."""
+    try:
+        import ctranslate2
+        return ctranslate2.get_cuda_device_count()
+    except Exception:
+        return 0
+
+
+def _detect_max_parallel(gpu_count: int) -> int:
+    """Number of files to transcribe concurrently.
+    
+    One worker per CUDA device when available, otherwise one per four CPU
+    cores since each CPU worker is itself multi-threaded. The shared model
+    is loaded with this many workers so the calls really run in parallel.
+    """
+    if gpu_count > 0:
+        return gpu_count
+    return max(1, (os.cpu_count() or 1) // 4)
+
+
+class EngineLoadWorker(QThread):
+    """Loads the shared Whisper model once before a batch starts."""
+    
+    finished = pyqtSignal(bool, str)  # success, error message
+    
+    def __init__(self, engine: WhisperEngine):
+        super().__init__()
+        self.engine = engine
+    
+    def run(self):
+        try:
+            self.engine.load_model()
+            self.finished.emit(True, "")
+        except Exception as e:
+            logger.error(f"Batch model load failed: {e}", exc_info=True)
+            self.finished.emit(False, str(e))
+
+
+class BatchWorkerThread(QThread):
+    """Long-lived thread that transcribes files from a shared job queue.
+    
+    One TranscriptionWorkerV2 is created per thread and reused for every
+    file it picks up; its run() is called directly on this thread.
+    """
+    
+    job_started = pyqtSignal(int)  # file index
+    job_finished = pyqtSignal(int, object)  # file index, Transcript
+    job_error = pyqtSignal(int, str)  # file index, error message
+    progress = pyqtSignal(int, float)  # file index, percent
+    
+    def __init__(self, jobs: queue.Queue, model_size: str, language: Optional[str], engine):
+        super().__init__()
+        self.jobs = jobs
+        self.worker = TranscriptionWorkerV2(
+            audio_path="",
+            vocabulary=[],
+            model_size=model_size,
+            device="auto",
+            language=language,
+            engine=engine
+        )
+        self._stopped = False
+        self._index = -1
+        self._result = None
+        self._error: Optional[str] = None
+        
+        # Direct connections: the worker emits on this thread, and the
+        # outcome must be captured before the next job starts
+        direct = Qt.ConnectionType.DirectConnection
+        self.worker.progress.connect(self._forward_progress, direct)
+        self.worker.finished.connect(self._capture_result, direct)
+        self.worker.error.connect(self._capture_error, direct)
+    
+    def _forward_progress(self, value: float):
+        self.progress.emit(self._index, value)
+    
+    def _capture_result(self, transcript):
+        self._result = transcript
+    
+    def _capture_error(self, error_msg: str):
+        self._error = error_msg
+    
+    def stop(self):
+        """Stop after the current file."""
+        self._stopped = True
+        self.worker.cancel()
+    
+    def run(self):
+        while not self._stopped:
+            try:
+                index, file_path = self.jobs.get_nowait()
+            except queue.Empty:
+                return
+            
+            self._index = index
+            self._result = None
+            self._error = None
+            self.worker.reset(file_path)
+            self.job_started.emit(index)
+            self.worker.run()
+            
+            if self._error is not None:
+                self.job_error.emit(index, self._error)
+            elif self._result is not None:
+                self.job_finished.emit(index, self._result)
+            else:
+                self.job_error.emit(index, "Transcription cancelled")
+
+
+class BatchSaveSignals(QObject):
+    """Signals for BatchSaveWorker (QRunnable can't emit signals itself)."""
+    
+    finished = pyqtSignal(int, bool, str)  # file index, success, error message
+
+
+class BatchSaveWorker(QRunnable):
+    """Writes a finished batch transcript to disk off the GUI thread."""
+    
+    def __init__(self, index: int, transcript, json_path: str, txt_path: str):
+        super().__init__()
+        self.index = index
+        self.transcript = transcript
+        self.json_path = json_path
+        self.txt_path = txt_path
+        self.signals = BatchSaveSignals()
+    
+    def run(self):
+        try:
+            # Save JSON (orjson is C-backed and much faster when available)
+            data = self.transcript.to_dict()
+            if orjson is not None:
+                payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(data, indent=2).encode('utf-8')
+            with open(self.json_path, 'wb') as f:
+                f.write(payload)
+            
+            # Auto-export text (text mode keeps platform line endings)
+            with open(self.txt_path, 'w', encoding='utf-8') as f:
+                f.write(self.transcript.get_full_text())
+            
+            logger.info(f"Batch saved: {self.json_path}")
+            self.signals.finished.emit(self.index, True, "")
+        
+        except Exception as e:
+            logger.error(f"Error saving batch result: {e}")
+            self.signals.finished.emit(self.index, False, str(e))
 
 class BatchDialog(QDialog):
     """Dialog for batch processing audio files."""
@@ -27,9 +185,22 @@ class BatchDialog(QDialog):
         self.setModal(True)
         
         self.files: List[str] = []
-        self.worker: Optional[TranscriptionWorkerV2] = None
-        self.current_index: int = 0
+        self.threads: List[BatchWorkerThread] = []
+        self.active: Set[int] = set()  # Indices of files being transcribed
+        self.completed: int = 0
+        self._pending_saves: int = 0
+        self._save_failures: List[str] = []  # "file: error" for failed saves
+        self._job_progress: Dict[int, int] = {}  # percent per running file
+        self._last_progress: int = -1  # displayed aggregate percent
         self.is_running: bool = False
+        self.gpu_count: int = _cuda_device_count()
+        self.max_parallel: int = _detect_max_parallel(self.gpu_count)
+        self.engine: Optional[WhisperEngine] = None  # Shared across all files
+        self.engine_loader: Optional[EngineLoadWorker] = None
+        
+        # Single writer thread keeps result files from competing for the disk
+        self.save_pool = QThreadPool(self)
+        self.save_pool.setMaxThreadCount(1)
         
         self._init_ui()
         
@@ -91,6 +262,7 @@ class BatchDialog(QDialog):
         
         self.file_progress = QProgressBar()
         self.file_progress.setRange(0, 100)
+        self.file_progress.setFormat("Current files: %p%")
         prog_layout.addWidget(self.file_progress)
         
         self.total_progress = QProgressBar()
@@ -142,7 +314,13 @@ class BatchDialog(QDialog):
             return
             
         self.is_running = True
-        self.current_index = 0
+        self.completed = 0
+        self._pending_saves = 0
+        self._save_failures.clear()
+        self.active.clear()
+        self._job_progress.clear()
+        self._last_progress = -1
+        self.threads.clear()
         
         # Lock UI
         self.file_list.setEnabled(False)
@@ -151,84 +329,154 @@ class BatchDialog(QDialog):
         self.total_progress.setRange(0, len(self.files))
         self.total_progress.setValue(0)
         
-        self._process_next()
-        
-    def _process_next(self):
-        if self.current_index >= len(self.files):
-            self._finish_batch()
-            return
-            
-        file_path = self.files[self.current_index]
-        base_name = os.path.basename(file_path)
-        self.current_file_label.setText(f"Processing: {base_name}")
-        self.file_progress.setValue(0)
+        self._ensure_model_loaded()
         
-        # Configure worker
+    def _ensure_model_loaded(self):
+        """Load the Whisper model once, then start transcribing."""
         model_size = self.model_combo.currentText()
-        language = self.lang_combo.currentData()
+        if self.engine is not None and self.engine.model_size == model_size and self.engine.is_loaded():
+            self._start_worker_threads()
+            return
         
-        self.worker = TranscriptionWorkerV2(
-            audio_path=file_path,
-            model_size=model_size,
-            language=language,
-            device="auto",
-            compute_type="int8" # Conservative for batch
+        self.current_file_label.setText(f"Loading {model_size} model...")
+        # One model worker per batch thread, spread over every GPU, so the
+        # threads' transcribe() calls actually run side by side
+        self.engine = WhisperEngine(
+            model_size, device="auto", compute_type="int8",  # Conservative for batch
+            num_workers=self.max_parallel,
+            device_index=list(range(self.gpu_count)) if self.gpu_count > 1 else 0
         )
+        self.engine_loader = EngineLoadWorker(self.engine)
+        self.engine_loader.finished.connect(self._on_engine_loaded)
+        self.engine_loader.start()
         
-        self.worker.progress.connect(self.file_progress.setValue)
-        self.worker.finished.connect(self._on_worker_finished)
-        self.worker.error.connect(self._on_worker_error)
+    def _on_engine_loaded(self, success: bool, error_msg: str):
+        if not self.is_running:
+            return
+        if not success:
+            # Each worker would load its own model; keep that to one at a time
+            logger.warning(f"Shared model load failed, loading per file: {error_msg}")
+            self.engine = None
+        self._start_worker_threads()
+        
+    def _start_worker_threads(self):
+        """Queue every file and start one pooled thread per model worker.
+        
+        Without a shared model each thread would load its own, so a
+        single thread is used instead.
+        """
+        jobs = queue.Queue()
+        for index, file_path in enumerate(self.files):
+            jobs.put((index, file_path))
         
-        self.worker.start()
+        model_size = self.model_combo.currentText()
+        language = self.lang_combo.currentData()
         
-    def _on_worker_finished(self, transcript):
+        workers = self.engine.num_workers if self.engine is not None else 1
+        for _ in range(min(workers, len(self.files))):
+            thread = BatchWorkerThread(jobs, model_size, language, self.engine)
+            thread.progress.connect(self._on_progress)
+            thread.job_started.connect(self._on_job_started)
+            thread.job_finished.connect(self._on_worker_finished)
+            thread.job_error.connect(self._on_worker_error)
+            self.threads.append(thread)
+            thread.start()
+        
+    def _on_job_started(self, index: int):
+        self.active.add(index)
+        self._job_progress[index] = 0
+        self._update_file_progress()
+        self._update_current_label()
+        
+    def _on_progress(self, index: int, value: float):
+        """Record a running file's progress and refresh the aggregate bar."""
+        if index not in self._job_progress:
+            return  # Late update from a file that already finished
+        percent = int(value)
+        if percent != self._job_progress[index]:
+            self._job_progress[index] = percent
+            self._update_file_progress()
+        
+    def _update_file_progress(self):
+        """Show the mean progress of the running files, when it changes."""
+        if not self._job_progress:
+            return
+        percent = sum(self._job_progress.values()) // len(self._job_progress)
+        if percent != self._last_progress:
+            self._last_progress = percent
+            self.file_progress.setValue(percent)
+        
+    def _update_current_label(self):
+        names = ", ".join(os.path.basename(self.files[i]) for i in sorted(self.active))
+        self.current_file_label.setText(f"Processing: {names}")
+        
+    def _on_file_done(self, index: int):
+        """Record a file as processed; pooled threads pick up the next job."""
+        self.active.discard(index)
+        self._job_progress.pop(index, None)
+        self._update_file_progress()
+        self.completed += 1
+        self.total_progress.setValue(self.completed)
+        
+        if self.completed >= len(self.files):
+            self._maybe_finish_batch()
+        
+    def _on_worker_finished(self, index: int, transcript):
         """Handle successful transcription."""
         if not self.is_running:
             return
             
-        file_path = self.files[self.current_index]
-        
-        # Save results
-        try:
-            # Save JSON
-            json_path = os.path.splitext(file_path)[0] + "_transcript.json"
-            with open(json_path, 'w', encoding='utf-8') as f:
-                f.write(transcript.to_json())
-                
-            # Auto-export text
-            txt_path = os.path.splitext(file_path)[0] + ".txt"
-            with open(txt_path, 'w', encoding='utf-8') as f:
-                f.write(transcript.get_full_text())
-                
-            logger.info(f"Batch saved: {json_path}")
-            
-        except Exception as e:
-            logger.error(f"Error saving batch result: {e}")
-            
-        self.current_index += 1
-        self.total_progress.setValue(self.current_index)
-        
-        # Schedule next
-        QTimer.singleShot(1000, self._process_next)
+        file_path = self.files[index]
+        
+        # Save results in the background and move straight on
+        base_path = os.path.splitext(file_path)[0]
+        worker = BatchSaveWorker(
+            index,
+            transcript,
+            json_path=base_path + "_transcript.json",
+            txt_path=base_path + ".txt"
+        )
+        worker.signals.finished.connect(self._on_save_finished)
+        self._pending_saves += 1
+        self.save_pool.start(worker)
+        
+        self._on_file_done(index)
+        
+    def _on_save_finished(self, index: int, success: bool, error_msg: str):
+        """Record a background save and finish once the last one reports."""
+        self._pending_saves -= 1
+        if not success:
+            self._save_failures.append(f"{os.path.basename(self.files[index])}: {error_msg}")
+        self._maybe_finish_batch()
+        
+    def _maybe_finish_batch(self):
+        """Finish once every file is transcribed and every result saved."""
+        if not self.is_running or self.completed < len(self.files):
+            return
+        if self._pending_saves > 0:
+            self.current_file_label.setText("Saving results...")
+            return
+        self._finish_batch()
         
-    def _on_worker_error(self, error_msg):
+    def _on_worker_error(self, index: int, error_msg):
         """Handle error, but allow continuing."""
-        logger.error(f"Batch error on file {self.current_index}: {error_msg}")
+        if not self.is_running:
+            return
+        
+        logger.error(f"Batch error on file {index}: {error_msg}")
         self.current_file_label.setText(f"Error: {error_msg}")
         
         # Create error log file
         try:
-            file_path = self.files[self.current_index]
+            file_path = self.files[index]
             err_path = os.path.splitext(file_path)[0] + "_error.txt"
             with open(err_path, 'w') as f:
                 f.write(error_msg)
         except:
             pass
             
-        # Continue to next
-        self.current_index += 1
-        self.total_progress.setValue(self.current_index)
-        QTimer.singleShot(2000, self._process_next)
+        # Continue with the remaining files
+        self._on_file_done(index)
         
     def _finish_batch(self):
         self.is_running = False
@@ -238,10 +486,18 @@ class BatchDialog(QDialog):
         self.start_btn.setEnabled(False)
         self.file_list.setEnabled(True)
         
-        QMessageBox.information(
-            self, "Batch Complete", 
-            f"Processed {len(self.files)} files.\nTranscripts saved to source directories."
-        )
+        if self._save_failures:
+            QMessageBox.warning(
+                self, "Batch Complete",
+                f"Processed {len(self.files)} files, but "
+                f"{len(self._save_failures)} transcript(s) could not be saved:\n\n"
+                + "\n".join(self._save_failures)
+            )
+        else:
+            QMessageBox.information(
+                self, "Batch Complete", 
+                f"Processed {len(self.files)} files.\nTranscripts saved to source directories."
+            )
         
     def closeEvent(self, event):
         if self.is_running:
@@ -252,8 +508,9 @@ class BatchDialog(QDialog):
             )
             if reply == QMessageBox.StandardButton.Yes:
                 self.is_running = False
-                if self.worker:
-                    self.worker.terminate()
+                for thread in self.threads:
+                    thread.stop()
+                    thread.terminate()
                 event.accept()
             else:
                 event.ignore()
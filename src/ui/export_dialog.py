@@ -10,17 +10,28 @@ from pathlib import Path
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QGroupBox, QCheckBox,
     QPushButton, QLineEdit, QLabel, QFileDialog, QMessageBox,
-    QDialogButtonBox, QComboBox, QSpinBox, QTextEdit
+    QDialogButtonBox, QComboBox, QSpinBox, QTextEdit, QWidget
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer
 
-from src.models.transcript import Transcript
+from src.models.transcript import Transcript, format_timestamp
 from src.models.metadata import RecordingMetadata
-from src.export.pdf_exporter import PDFExporter
-from src.export.docx_exporter import DOCXExporter
-from src.export.srt_exporter import SRTExporter, VTTExporter
 
 
+# Export format -> (file extension, file dialog filter), in combo box order
+_FORMAT_META = {
+    "PDF": (".pdf", "PDF Files (*.pdf)"),
+    "Word Document (.docx)": (".docx", "Word Documents (*.docx)"),
+    "SRT Subtitles (.srt)": (".srt", "SRT Subtitle Files (*.srt)"),
+    "WebVTT Subtitles (.vtt)": (".vtt", "WebVTT Subtitle Files (*.vtt)"),
+    "Plain Text": (".txt", "Text Files (*.txt)"),
+    "Text with Timestamps": (".txt", "Text Files (*.txt)"),
+}
+_DEFAULT_FORMAT_META = (".txt", "Text Files (*.txt)")
+
+# Formats that use the PDF options group
+_OPTION_FORMATS = ("PDF", "Word Document (.docx)")
+
 class ExportDialog(QDialog):
     """Dialog for export options."""
     
@@ -55,14 +66,7 @@ class ExportDialog(QDialog):
         format_layout.addWidget(format_label)
         
         self.format_combo = QComboBox()
-        self.format_combo.addItems([
-            "PDF", 
-            "Word Document (.docx)", 
-            "SRT Subtitles (.srt)",
-            "WebVTT Subtitles (.vtt)",
-            "Plain Text", 
-            "Text with Timestamps"
-        ])
+        self.format_combo.addItems(list(_FORMAT_META))
         self.format_combo.currentTextChanged.connect(self._on_format_changed)
         format_layout.addWidget(self.format_combo)
         
@@ -70,7 +74,100 @@ class ExportDialog(QDialog):
         
         layout.addWidget(format_group)
         
-        # PDF Options
+        # PDF Options - built on demand, see _ensure_pdf_options()
+        self.pdf_options_group: Optional[QGroupBox] = None
+        self._pdf_options_placeholder = QWidget()
+        layout.addWidget(self._pdf_options_placeholder)
+        
+        # Output file
+        output_group = QGroupBox("Output")
+        output_layout = QHBoxLayout(output_group)
+        
+        self.output_path = QLineEdit()
+        self.output_path.setPlaceholderText("Select output file...")
+        output_layout.addWidget(self.output_path, 1)
+        
+        browse_button = QPushButton("Browse...")
+        browse_button.clicked.connect(self._browse_output)
+        output_layout.addWidget(browse_button)
+        
+        layout.addWidget(output_group)
+        
+        # Preview info
+        info_group = QGroupBox("Transcript Info")
+        info_layout = QVBoxLayout(info_group)
+        
+        # Filled in by _populate_info() once the dialog is on screen
+        self._info_label = QLabel("Computing…")
+        info_layout.addWidget(self._info_label)
+        
+        layout.addWidget(info_group)
+        
+        # Dialog buttons
+        button_layout = QHBoxLayout()
+        
+        self.export_button = QPushButton("Export")
+        self.export_button.clicked.connect(self._do_export)
+        self.export_button.setEnabled(False)
+        button_layout.addWidget(self.export_button)
+        
+        cancel_button = QPushButton("Cancel")
+        cancel_button.clicked.connect(self.reject)
+        button_layout.addWidget(cancel_button)
+        
+        layout.addLayout(button_layout)
+        
+        # Set default output path
+        self._set_default_output_path()
+        
+        # PDF is the default format; fill in its options after the first paint
+        QTimer.singleShot(0, self._ensure_pdf_options)
+        QTimer.singleShot(0, self._populate_info)
+    
+    def _set_default_output_path(self):
+        """Suggest an output path next to the audio file."""
+        if self.audio_file:
+            base_name = os.path.splitext(self.audio_file)[0]
+            ext, _ = _FORMAT_META.get(self.format_combo.currentText(), _DEFAULT_FORMAT_META)
+            self.output_path.setText(f"{base_name}_transcript{ext}")
+            self.export_button.setEnabled(True)
+    
+    def set_transcript(self, transcript: Transcript):
+        """Set the transcript to export when the dialog is reused."""
+        self.transcript = transcript
+        self._info_label.setText("Computing…")
+        QTimer.singleShot(0, self._populate_info)
+    
+    def set_audio_path(self, audio_file: Optional[str]):
+        """Set the source audio file, updating the suggested output path if it changed."""
+        if audio_file != self.audio_file:
+            self.audio_file = audio_file
+            self._set_default_output_path()
+    
+    def set_metadata(self, metadata: Optional[RecordingMetadata]):
+        """Set the recording metadata included in PDF/DOCX exports."""
+        self.metadata = metadata or RecordingMetadata()
+    
+    def _populate_info(self):
+        """Fill in the transcript info label."""
+        duration_str = format_timestamp(self.transcript.audio_duration)
+        
+        self._info_label.setText(
+            f"Segments: {self.transcript.segment_count}\n"
+            f"Words: {self.transcript.word_count}\n"
+            f"Duration: {duration_str}\n"
+            f"Gaps: {len(self.transcript.get_gaps())}"
+        )
+    
+    def _ensure_pdf_options(self) -> QGroupBox:
+        """Build the PDF/DOCX options group the first time it is needed.
+        
+        Returns:
+            The options group box
+        """
+        if self.pdf_options_group is not None:
+            return self.pdf_options_group
+        
         self.pdf_options_group = QGroupBox("PDF Options")
         pdf_layout = QVBoxLayout(self.pdf_options_group)
         
@@ -127,104 +224,37 @@ class ExportDialog(QDialog):
         cert_layout.addWidget(self.certification_text)
         pdf_layout.addLayout(cert_layout)
         
-        layout.addWidget(self.pdf_options_group)
-        
-        # Output file
-        output_group = QGroupBox("Output")
-        output_layout = QHBoxLayout(output_group)
-        
-        self.output_path = QLineEdit()
-        self.output_path.setPlaceholderText("Select output file...")
-        output_layout.addWidget(self.output_path, 1)
-        
-        browse_button = QPushButton("Browse...")
-        browse_button.clicked.connect(self._browse_output)
-        output_layout.addWidget(browse_button)
-        
-        layout.addWidget(output_group)
-        
-        # Preview info
-        info_group = QGroupBox("Transcript Info")
-        info_layout = QVBoxLayout(info_group)
-        
-        from src.models.transcript import format_timestamp
-        duration_str = format_timestamp(self.transcript.audio_duration)
-        
-        info_text = (
-            f"Segments: {self.transcript.segment_count}\n"
-            f"Words: {self.transcript.word_count}\n"
-            f"Duration: {duration_str}\n"
-            f"Gaps: {len(self.transcript.get_gaps())}"
-        )
-        info_label = QLabel(info_text)
-        info_layout.addWidget(info_label)
-        
-        layout.addWidget(info_group)
-        
-        # Dialog buttons
-        button_layout = QHBoxLayout()
-        
-        self.export_button = QPushButton("Export")
-        self.export_button.clicked.connect(self._do_export)
-        self.export_button.setEnabled(False)
-        button_layout.addWidget(self.export_button)
-        
-        cancel_button = QPushButton("Cancel")
-        cancel_button.clicked.connect(self.reject)
-        button_layout.addWidget(cancel_button)
+        format_text = self.format_combo.currentText()
+        self.pdf_options_group.setEnabled(format_text in _OPTION_FORMATS)
         
-        layout.addLayout(button_layout)
+        self.layout().replaceWidget(self._pdf_options_placeholder, self.pdf_options_group)
+        self._pdf_options_placeholder.deleteLater()
+        self._pdf_options_placeholder = None
         
-        # Set default output path
-        if self.audio_file:
-            base_name = os.path.splitext(self.audio_file)[0]
-            self.output_path.setText(f"{base_name}_transcript.pdf")
-            self.export_button.setEnabled(True)
+        return self.pdf_options_group
     
     def _on_format_changed(self, format_text: str):
         """Handle format selection change."""
-        is_pdf = format_text == "PDF"
-        is_docx = format_text == "Word Document (.docx)"
-        is_srt = format_text == "SRT Subtitles (.srt)"
-        is_vtt = format_text == "WebVTT Subtitles (.vtt)"
+        has_options = format_text in _OPTION_FORMATS
         
         # Enable options for PDF and DOCX
-        self.pdf_options_group.setEnabled(is_pdf or is_docx)
+        if has_options:
+            self._ensure_pdf_options()
+        if self.pdf_options_group is not None:
+            self.pdf_options_group.setEnabled(has_options)
         
         # Update file extension
         current_path = self.output_path.text()
         if current_path:
+            ext, _ = _FORMAT_META.get(format_text, _DEFAULT_FORMAT_META)
             base = os.path.splitext(current_path)[0]
-            if is_pdf:
-                self.output_path.setText(f"{base}.pdf")
-            elif is_docx:
-                self.output_path.setText(f"{base}.docx")
-            elif is_srt:
-                self.output_path.setText(f"{base}.srt")
-            elif is_vtt:
-                self.output_path.setText(f"{base}.vtt")
-            else:
-                self.output_path.setText(f"{base}.txt")
+            self.output_path.setText(f"{base}{ext}")
     
     def _browse_output(self):
         """Browse for output file."""
         format_text = self.format_combo.currentText()
         
-        if format_text == "PDF":
-            filter_str = "PDF Files (*.pdf)"
-            default_ext = ".pdf"
-        elif format_text == "Word Document (.docx)":
-            filter_str = "Word Documents (*.docx)"
-            default_ext = ".docx"
-        elif format_text == "SRT Subtitles (.srt)":
-            filter_str = "SRT Subtitle Files (*.srt)"
-            default_ext = ".srt"
-        elif format_text == "WebVTT Subtitles (.vtt)":
-            filter_str = "WebVTT Subtitle Files (*.vtt)"
-            default_ext = ".vtt"
-        else:
-            filter_str = "Text Files (*.txt)"
-            default_ext = ".txt"
+        default_ext, filter_str = _FORMAT_META.get(format_text, _DEFAULT_FORMAT_META)
         
         # Get default filename
         default_name = ""
@@ -232,11 +262,13 @@ class ExportDialog(QDialog):
             base_name = os.path.splitext(os.path.basename(self.audio_file))[0]
             default_name = f"{base_name}_transcript{default_ext}"
         
+        # Skip per-folder custom icon lookups, which can stall on network drives
         file_path, _ = QFileDialog.getSaveFileName(
             self,
             "Export Transcript",
             default_name,
-            filter_str
+            filter_str,
+            options=QFileDialog.Option.DontUseCustomDirectoryIcons
         )
         
         if file_path:
@@ -251,6 +283,8 @@ class ExportDialog(QDialog):
             return
         
         format_text = self.format_combo.currentText()
+        if format_text in _OPTION_FORMATS:
+            self._ensure_pdf_options()
         
         try:
             if format_text == "PDF":
@@ -282,6 +316,8 @@ class ExportDialog(QDialog):
     
     def _export_pdf(self, output_path: str):
         """Export to PDF."""
+        from src.export.pdf_exporter import PDFExporter
+        
         exporter = PDFExporter()
         
         exporter.export(
@@ -300,6 +336,8 @@ class ExportDialog(QDialog):
     
     def _export_docx(self, output_path: str):
         """Export to Word document."""
+        from src.export.docx_exporter import DOCXExporter
+        
         exporter = DOCXExporter()
         
         exporter.export(
@@ -317,6 +355,8 @@ class ExportDialog(QDialog):
     
     def _export_srt(self, output_path: str):
         """Export to SRT subtitle format."""
+        from src.export.srt_exporter import SRTExporter
+        
         exporter = SRTExporter()
         exporter.export(
             transcript=self.transcript,
@@ -325,6 +365,8 @@ class ExportDialog(QDialog):
     
     def _export_vtt(self, output_path: str):
         """Export to WebVTT subtitle format."""
+        from src.export.srt_exporter import VTTExporter
+        
         exporter = VTTExporter()
         exporter.export(
             transcript=self.transcript,
@@ -333,7 +375,11 @@ class ExportDialog(QDialog):
     
     def _export_text(self, output_path: str, include_timestamps: bool):
         """Export to plain text."""
-        text = self.transcript.get_full_text(include_timestamps=include_timestamps)
-        
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(text)
+        lines = self.transcript.iter_lines(include_timestamps=include_timestamps)
+        
+        # Write segment by segment rather than building the whole text first
+        with open(output_path, "w", encoding="utf-8", buffering=1 << 20) as f:
+            first = next(lines, None)
+            if first is not None:
+                f.write(first)
+                f.writelines("\n" + line for line in lines)
@@ -3,20 +3,52 @@ Find and Replace dialog for PersonalTranscribe.
 Provides search and replace functionality for transcript text.
 """
 
+import os
+import re
+import sys
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from typing import Optional, List, Tuple
 from dataclasses import dataclass
 
 from PyQt6.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QGridLayout,
+    QDialog, QVBoxLayout, QHBoxLayout, QFormLayout,
     QLineEdit, QPushButton, QLabel, QCheckBox, QGroupBox,
     QMessageBox, QWidget
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QEvent
 
 from src.models.transcript import Transcript, Segment
 
 
-@dataclass
+# Transcripts with at least this many segments are searched in chunks
+PARALLEL_SEARCH_MIN_SEGMENTS = 2000
+
+_search_pool: Optional[ThreadPoolExecutor] = None
+
+
+def _get_search_pool() -> Optional[ThreadPoolExecutor]:
+    """Get the shared search thread pool, or None if it would not help.
+    
+    The regex engine holds the GIL while matching, so chunked searching
+    only pays off on free-threaded (no-GIL) Python builds.
+    """
+    global _search_pool
+    
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    if is_gil_enabled is None or is_gil_enabled():
+        return None
+    
+    if _search_pool is None:
+        _search_pool = ThreadPoolExecutor(
+            max_workers=os.cpu_count() or 1,
+            thread_name_prefix="find"
+        )
+    return _search_pool
+
+
+@dataclass(slots=True)
 class SearchResult:
     """Represents a search result."""
     segment_index: int
@@ -30,7 +62,7 @@ class FindReplaceDialog(QDialog):
     
     # Signals
     jump_to_segment = pyqtSignal(object)  # Segment
-    text_replaced = pyqtSignal()  # Emitted when replacement made
+    text_replaced = pyqtSignal(list)  # IDs of segments changed by a replacement
     
     def __init__(self, transcript: Transcript, parent=None):
         super().__init__(parent)
@@ -39,10 +71,24 @@ class FindReplaceDialog(QDialog):
         self.search_results: List[SearchResult] = []
         self.current_result_index: int = -1
         
+        # Flat copy of all segment texts, rebuilt only when invalidated
+        self._joined: Optional[str] = None
+        self._offsets: Optional[List[int]] = None
+        
+        # Jump bookkeeping so re-searches don't re-scroll to the same segment
+        self._suppress_jump = False
+        self._last_jumped_segment_id: Optional[str] = None
+        
         self.setWindowTitle("Find and Replace")
         self.setMinimumWidth(450)
         self.setModal(False)  # Non-modal so user can edit while open
         
+        # Collapse bursts of keystrokes/option toggles into one search
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(150)
+        self._search_timer.timeout.connect(self._perform_search)
+        
         self._init_ui()
     
     def _init_ui(self):
@@ -51,38 +97,32 @@ class FindReplaceDialog(QDialog):
         
         # Find section
         find_group = QGroupBox("Find")
-        find_layout = QGridLayout(find_group)
-        
-        find_label = QLabel("Find:")
-        find_layout.addWidget(find_label, 0, 0)
+        find_layout = QFormLayout(find_group)
         
         self.find_input = QLineEdit()
         self.find_input.setPlaceholderText("Enter text to find...")
         self.find_input.textChanged.connect(self._on_find_text_changed)
         self.find_input.returnPressed.connect(self.find_next)
-        find_layout.addWidget(self.find_input, 0, 1)
+        find_layout.addRow("Find:", self.find_input)
         
         # Options
         self.case_sensitive_cb = QCheckBox("Case sensitive")
         self.case_sensitive_cb.stateChanged.connect(self._on_options_changed)
-        find_layout.addWidget(self.case_sensitive_cb, 1, 1)
+        find_layout.addRow("", self.case_sensitive_cb)
         
         self.whole_word_cb = QCheckBox("Whole word only")
         self.whole_word_cb.stateChanged.connect(self._on_options_changed)
-        find_layout.addWidget(self.whole_word_cb, 2, 1)
+        find_layout.addRow("", self.whole_word_cb)
         
         layout.addWidget(find_group)
         
         # Replace section
         replace_group = QGroupBox("Replace")
-        replace_layout = QGridLayout(replace_group)
-        
-        replace_label = QLabel("Replace with:")
-        replace_layout.addWidget(replace_label, 0, 0)
+        replace_layout = QFormLayout(replace_group)
         
         self.replace_input = QLineEdit()
         self.replace_input.setPlaceholderText("Enter replacement text...")
-        replace_layout.addWidget(self.replace_input, 0, 1)
+        replace_layout.addRow("Replace with:", self.replace_input)
         
         layout.addWidget(replace_group)
         
@@ -125,8 +165,9 @@ class FindReplaceDialog(QDialog):
     def _on_find_text_changed(self, text: str):
         """Handle find text change."""
         if text:
-            self._perform_search()
+            self._search_timer.start()
         else:
+            self._search_timer.stop()
             self.search_results = []
             self.current_result_index = -1
             self._update_ui()
@@ -134,7 +175,38 @@ class FindReplaceDialog(QDialog):
     def _on_options_changed(self):
         """Handle search options change."""
         if self.find_input.text():
-            self._perform_search()
+            self._search_timer.start()
+    
+    def _rebuild_cache(self):
+        """Join all segment texts into one string for searching.
+        
+        Segments are separated by an ASCII unit separator so a match can
+        never span two segments. ``_offsets[i]`` is where segment ``i``
+        starts in the joined string.
+        """
+        parts = []
+        offsets = [0]
+        for segment in self.transcript.segments:
+            parts.append(segment.text)
+            parts.append("\x1f")
+            offsets.append(offsets[-1] + len(segment.text) + 1)
+        self._joined = "".join(parts)
+        self._offsets = offsets
+    
+    def _invalidate_cache(self):
+        """Drop the joined text so the next search rebuilds it."""
+        self._joined = None
+        self._offsets = None
+    
+    def changeEvent(self, event):
+        """Invalidate the search cache when the dialog regains focus.
+        
+        The transcript can only be edited elsewhere while this non-modal
+        dialog is inactive, so re-activation is when the cache may be stale.
+        """
+        if event.type() == QEvent.Type.ActivationChange and self.isActiveWindow():
+            self._invalidate_cache()
+        super().changeEvent(event)
     
     def _perform_search(self):
         """Perform the search."""
@@ -145,47 +217,63 @@ class FindReplaceDialog(QDialog):
         case_sensitive = self.case_sensitive_cb.isChecked()
         whole_word = self.whole_word_cb.isChecked()
         
-        self.search_results = []
+        pattern = re.escape(search_text)
+        if whole_word:
+            # Match must not touch another letter or digit on either side
+            pattern = rf"(?<![^\W_]){pattern}(?![^\W_])"
+        flags = 0 if case_sensitive else re.IGNORECASE
+        regex = re.compile(pattern, flags)
         
-        for i, segment in enumerate(self.transcript.segments):
-            text = segment.text
-            search_in = text if case_sensitive else text.lower()
-            find_text = search_text if case_sensitive else search_text.lower()
-            
-            # Find all occurrences
-            pos = 0
-            while True:
-                pos = search_in.find(find_text, pos)
-                if pos == -1:
-                    break
-                
-                # Check whole word if required
-                if whole_word:
-                    # Check character before
-                    if pos > 0 and search_in[pos - 1].isalnum():
-                        pos += 1
-                        continue
-                    # Check character after
-                    end_pos = pos + len(find_text)
-                    if end_pos < len(search_in) and search_in[end_pos].isalnum():
-                        pos += 1
-                        continue
-                
-                self.search_results.append(SearchResult(
-                    segment_index=i,
-                    segment=segment,
-                    position=pos,
-                    length=len(search_text)
-                ))
-                pos += 1
+        if self._joined is None:
+            self._rebuild_cache()
+        
+        segment_count = len(self.transcript.segments)
+        pool = None
+        if segment_count >= PARALLEL_SEARCH_MIN_SEGMENTS:
+            pool = _get_search_pool()
+        
+        if pool is None:
+            self.search_results = self._scan_range(regex, 0, len(self._joined))
+        else:
+            # Split on segment boundaries so no match straddles two chunks
+            chunks = os.cpu_count() or 1
+            bounds = [
+                self._offsets[segment_count * k // chunks]
+                for k in range(chunks + 1)
+            ]
+            parts = pool.map(
+                lambda span: self._scan_range(regex, *span),
+                zip(bounds, bounds[1:])
+            )
+            self.search_results = list(chain.from_iterable(parts))
         
         self.current_result_index = 0 if self.search_results else -1
         self._update_ui()
         
-        # Jump to first result
-        if self.search_results:
+        # Jump to first result, unless we are already showing its segment
+        if (self.search_results and
+                self.search_results[0].segment.id != self._last_jumped_segment_id):
             self._jump_to_current()
     
+    def _scan_range(self, regex: "re.Pattern", start: int, end: int) -> List[SearchResult]:
+        """Find all matches within a slice of the joined text.
+        
+        Args:
+            regex: Compiled search pattern
+            start: Start offset in the joined text
+            end: End offset in the joined text
+            
+        Returns:
+            Search results in transcript order
+        """
+        segments = self.transcript.segments
+        offsets = self._offsets
+        return [
+            SearchResult(i, segments[i], match.start() - offsets[i], match.end() - match.start())
+            for match in regex.finditer(self._joined, start, end)
+            for i in (bisect_right(offsets, match.start()) - 1,)
+        ]
+    
     def _update_ui(self):
         """Update UI based on search results."""
         has_results = len(self.search_results) > 0
@@ -206,12 +294,31 @@ class FindReplaceDialog(QDialog):
     
     def _jump_to_current(self):
         """Jump to current search result."""
+        if self._suppress_jump:
+            return
         if 0 <= self.current_result_index < len(self.search_results):
             result = self.search_results[self.current_result_index]
+            self._last_jumped_segment_id = result.segment.id
             self.jump_to_segment.emit(result.segment)
     
+    def _flush_pending_search(self) -> bool:
+        """Run the debounced search now if one is still waiting.
+        
+        Returns:
+            True if a pending search was run
+        """
+        if not self._search_timer.isActive():
+            return False
+        self._search_timer.stop()
+        self._perform_search()
+        return True
+    
     def find_next(self):
         """Find next occurrence."""
+        if self._flush_pending_search():
+            # Enter pressed before the debounced search ran; land on the first match
+            return
+        
         if not self.search_results:
             return
         
@@ -221,6 +328,9 @@ class FindReplaceDialog(QDialog):
     
     def find_previous(self):
         """Find previous occurrence."""
+        if self._flush_pending_search():
+            return
+        
         if not self.search_results:
             return
         
@@ -230,6 +340,9 @@ class FindReplaceDialog(QDialog):
     
     def replace_current(self):
         """Replace current occurrence."""
+        # Don't replace a match of the previous pattern
+        self._flush_pending_search()
+        
         if not self.search_results or self.current_result_index < 0:
             return
         
@@ -237,21 +350,43 @@ class FindReplaceDialog(QDialog):
         segment = result.segment
         
         # Perform replacement
+        replace_text = self.replace_input.text()
         old_text = segment.text
         new_text = (
             old_text[:result.position] +
-            self.replace_input.text() +
+            replace_text +
             old_text[result.position + result.length:]
         )
         segment.update_text(new_text)
+        self._invalidate_cache()
         
-        self.text_replaced.emit()
+        self.text_replaced.emit([segment.id])
         
-        # Re-search to update results
-        self._perform_search()
+        delta = len(replace_text) - result.length
+        if self.whole_word_cb.isChecked() and delta != 0:
+            # Word boundaries around later matches may have moved
+            self._perform_search()
+            return
+        
+        # Drop the replaced hit and shift later hits in the same segment
+        index = self.current_result_index
+        del self.search_results[index]
+        if delta:
+            for later in self.search_results[index:]:
+                if later.segment_index != result.segment_index:
+                    break
+                later.position += delta
+        
+        if index >= len(self.search_results):
+            index = 0 if self.search_results else -1
+        self.current_result_index = index
+        self._update_ui()
+        self._jump_to_current()
     
     def replace_all(self):
         """Replace all occurrences."""
+        self._flush_pending_search()
+        
         if not self.search_results:
             return
         
@@ -259,32 +394,39 @@ class FindReplaceDialog(QDialog):
         replace_text = self.replace_input.text()
         case_sensitive = self.case_sensitive_cb.isChecked()
         
-        count = 0
+        flags = 0 if case_sensitive else re.IGNORECASE
+        pattern = re.compile(re.escape(search_text), flags)
+        # Callable replacement keeps the text literal (no backslash escapes)
+        replacement = lambda match: replace_text
         
-        # Process each segment
-        for segment in self.transcript.segments:
-            old_text = segment.text
-            
-            if case_sensitive:
-                new_text = old_text.replace(search_text, replace_text)
-            else:
-                # Case-insensitive replace
-                import re
-                pattern = re.compile(re.escape(search_text), re.IGNORECASE)
-                new_text = pattern.sub(replace_text, old_text)
+        count = 0
+        changed_ids = []
+        
+        # Nothing should scroll the editor while segments are rewritten
+        self._search_timer.stop()
+        self._suppress_jump = True
+        try:
+            # Process each segment
+            for segment in self.transcript.segments:
+                old_text = segment.text
+                if case_sensitive and search_text not in old_text:
+                    # Plain substring test is cheaper than a regex pass
+                    continue
+                new_text, n = pattern.subn(replacement, old_text)
+                if n:
+                    count += n
+                    segment.update_text(new_text)
+                    changed_ids.append(segment.id)
+            if count:
+                self._invalidate_cache()
+                self.text_replaced.emit(changed_ids)
             
-            if new_text != old_text:
-                count += old_text.count(search_text) if case_sensitive else len(
-                    re.findall(re.escape(search_text), old_text, re.IGNORECASE)
-                )
-                segment.update_text(new_text)
-        
-        self.text_replaced.emit()
-        
-        # Clear results
-        self.search_results = []
-        self.current_result_index = -1
-        self._update_ui()
+            # Clear results
+            self.search_results = []
+            self.current_result_index = -1
+            self._update_ui()
+        finally:
+            self._suppress_jump = False
         
         QMessageBox.information(
             self,
@@ -295,6 +437,8 @@ class FindReplaceDialog(QDialog):
     def set_transcript(self, transcript: Transcript):
         """Update the transcript reference."""
         self.transcript = transcript
+        self._invalidate_cache()
+        self._last_jumped_segment_id = None
         self.search_results = []
         self.current_result_index = -1
         self._update_ui()
@@ -3,8 +3,15 @@ Main window for PersonalTranscribe application.
 """
 
 import os
+import re
 import time
-from typing import Optional
+import heapq
+from datetime import datetime
+from contextlib import contextmanager
+from dataclasses import replace
+from concurrent.futures import ThreadPoolExecutor
+from bisect import bisect_left, bisect_right, insort
+from typing import Optional, TYPE_CHECKING
 from pathlib import Path
 
 from PyQt6.QtWidgets import (
@@ -17,27 +24,93 @@ from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer
 from PyQt6.QtGui import QAction, QKeySequence, QUndoStack, QActionGroup, QIcon
 
 from src.config.settings import get_settings, get_settings_manager
-from src.config.shortcuts import Shortcuts
-from src.models.transcript import Transcript
+from src.config.shortcuts import Shortcut, Shortcuts
+from src.models.transcript import Transcript, format_timestamp
 from src.models.project import Project, ProjectManager
 from src.models.undo_commands import EditSegmentTextCommand, ToggleBookmarkCommand
 from src.ui.audio_player import AudioPlayer
 from src.ui.transcript_editor import TranscriptEditor
-from src.ui.vocab_dialog import VocabularyDialog
-from src.ui.export_dialog import ExportDialog
-from src.ui.find_replace import FindReplaceDialog
-from src.ui.statistics_panel import StatisticsPanel
-from src.ui.metadata_dialog import MetadataDialog
 from src.models.metadata import RecordingMetadata
-from src.ui.transcription_dialog import TranscriptionProgressDialog, TranscriptionWorkerV2
-from src.ui.transcription_subprocess_dialog import SubprocessTranscriptionDialog
-from src.ui.ai_settings_dialog import AISettingsDialog
-from src.ui.ai_polish_dialog import AIPolishDialog
-from src.utils.logger import get_logger, get_log_file_path, clear_logs, get_log_size, format_size
+from src.utils.logger import get_logger
+
+# Dialogs and panels are imported where they are first opened, to keep
+# start-up fast; these imports are only for type annotations
+if TYPE_CHECKING:
+    from src.ui.ai_settings_dialog import AISettingsDialog
+    from src.ui.export_dialog import ExportDialog
+    from src.ui.metadata_dialog import MetadataDialog
+    from src.ui.vocab_dialog import VocabularyDialog
+    from src.ui.find_replace import FindReplaceDialog
+    from src.ui.statistics_panel import StatisticsPanel
+    from src.ui.transcription_dialog import TranscriptionProgressDialog
 
 # Module logger
 logger = get_logger("main_window")
 
+# Minimum seconds between playback position UI updates (~15 Hz)
+POSITION_UPDATE_INTERVAL = 0.066
+
+# Jump-to-time input: [HH:]MM:SS[.fff] or plain seconds
+_TIME_RE = re.compile(r"^(?:(\d+):)?(\d+):(\d+(?:\.\d*)?)$|^(\d+(?:\.\d*)?)$")
+
+# Theme name -> stylesheet text, read once per session
+_QSS_CACHE: dict = {}
+
+# Shortcuts dialog text; shortcuts are fixed, so it is built once
+_SHORTCUTS_HTML_CACHE: Optional[str] = None
+
+
+def _build_shortcuts_html() -> str:
+    """Build the HTML listing for the keyboard shortcuts dialog."""
+    parts = ["<h2>Keyboard Shortcuts</h2>"]
+    
+    # Known categories first, in a fixed order, then any others
+    category_order = ["File", "Playback", "Navigation", "Edit", "Transcription", "View"]
+    categories = Shortcuts.by_category()
+    ordered = [c for c in category_order if c in categories]
+    ordered += [c for c in categories if c not in category_order]
+    
+    for category in ordered:
+        parts.append(f"<h3>{category}</h3><table>")
+        parts.extend(
+            f"<tr><td><b>{shortcut.key_sequence}</b></td>"
+            f"<td style='padding-left:20px'>{shortcut.description}</td></tr>"
+            for shortcut in categories[category]
+        )
+        parts.append("</table><br>")
+    
+    # Additional tips
+    parts.append("""
+    <h3>Tips</h3>
+    <ul>
+        <li>Double-click a segment to edit text</li>
+        <li>Right-click segments for context menu</li>
+        <li>Click waveform to seek to position</li>
+        <li>Drag on waveform to select loop region</li>
+        <li>Use pagination controls for large transcripts</li>
+    </ul>
+    """)
+    return "".join(parts)
+
+
+def _load_theme_qss(theme: str) -> Optional[str]:
+    """Get a theme's stylesheet, reading it from disk on first use.
+    
+    Args:
+        theme: Theme name, e.g. "dark"
+        
+    Returns:
+        The stylesheet text, or None if the theme file doesn't exist
+    """
+    qss = _QSS_CACHE.get(theme)
+    if qss is None:
+        try:
+            qss = Path(f"resources/themes/{theme}.qss").read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+        _QSS_CACHE[theme] = qss
+    return qss
+
 
 class MainWindow(QMainWindow):
     """Main application window."""
@@ -51,37 +124,133 @@ class MainWindow(QMainWindow):
         self.current_project: Optional[Project] = None
         self.current_audio_path: Optional[str] = None
         self.vocabulary: list = []
+        # Immutable copy of self.vocabulary shared with saved projects
+        self._vocab_snapshot: tuple = ()
         self.metadata: RecordingMetadata = RecordingMetadata()
-        self.transcription_dialog: Optional[TranscriptionProgressDialog] = None
+        self.transcription_dialog: Optional["TranscriptionProgressDialog"] = None
         self.is_modified = False
         
+        # File name shown in the title bar and the last title set, so
+        # unchanged titles aren't pushed to the window system again
+        self._title_name: str = ""
+        self._current_title: str = ""
+        self._title_modified = False
+        
+        # Per-user folders for autosave and streaming recovery files
+        app_data = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+        self._app_data_dir = os.path.join(app_data, "PersonalTranscribe")
+        self._autosave_dir = os.path.join(self._app_data_dir, "autosave")
+        self._streaming_dir = os.path.join(self._app_data_dir, "streaming")
+        
         # Undo/Redo stack
         self.undo_stack = QUndoStack(self)
+        self.undo_stack.setUndoLimit(max(0, self.settings.undo_limit))
+        
+        # Coalesces statistics refreshes after edits, find/replace,
+        # bookmark toggles and AI polish into one recomputation
+        self._stats_refresh_timer = QTimer(self)
+        self._stats_refresh_timer.setSingleShot(True)
+        self._stats_refresh_timer.setInterval(150)
+        self._stats_refresh_timer.timeout.connect(self._refresh_stats_panel)
+        
+        # Playback position updates are throttled; the latest position
+        # seen while throttled is applied when the interval elapses
+        self._last_pos_update: float = 0.0
+        # Nesting depth of _paused_position_updates() blocks
+        self._position_updates_paused: int = 0
+        self._pending_position: Optional[float] = None
+        self._position_timer = QTimer(self)
+        self._position_timer.setSingleShot(True)
+        self._position_timer.timeout.connect(self._apply_pending_position)
+        
+        # Whole seconds shown in the position/duration labels, so the
+        # labels are only reformatted when the displayed second changes
+        self._last_pos_sec: int = -1
+        self._last_duration_sec: int = -1
+        
+        # Recent files menu contents as [(path, basename)], None until built
+        self._recent_menu_state: Optional[list] = None
+        
+        # Lookup tables over the segments of one transcript, built in one
+        # pass by _rebuild_segment_caches(): segment id -> index, start and
+        # end times (None if segments aren't in time order) and sorted
+        # bookmarked indices. Rebuilt when the transcript or its segment
+        # count changes.
+        self._segment_cache_owner: Optional[Transcript] = None
+        self._segment_cache_count: int = 0
+        self._id_to_idx: dict = {}
+        self._segment_starts: Optional[list] = None
+        self._segment_ends: Optional[list] = None
+        self._bookmark_indices: list = []
+        # Segment currently highlighted for playback
+        self._playing_segment = None
+        
+        # Running OpenPathWorker threads
+        self._open_path_workers: list = []
+        
+        # Open/save file dialogs by role, reused so they keep their folder
+        self._file_dialogs: dict = {}
         
         # Find/Replace dialog (persistent)
-        self.find_replace_dialog: Optional[FindReplaceDialog] = None
+        self.find_replace_dialog: Optional["FindReplaceDialog"] = None
+        
+        # Other dialogs, built on first use and refreshed via setters
+        self._export_dialog: Optional["ExportDialog"] = None
+        self._metadata_dialog: Optional["MetadataDialog"] = None
+        self._vocab_dialog: Optional["VocabularyDialog"] = None
+        self._ai_settings_dialog: Optional["AISettingsDialog"] = None
         
         # Auto-save timer
+        # Single-shot: restarted by each edit so the save happens once
+        # editing pauses, but no later than twice the interval after the
+        # first unsaved edit
         self.autosave_timer = QTimer(self)
+        self.autosave_timer.setSingleShot(True)
         self.autosave_timer.timeout.connect(self._autosave)
-        
-        self._init_ui()
-        self._create_menus()
-        self._create_toolbar()
-        self._create_statusbar()
-        self._create_dock_widgets()
-        self._connect_signals()
-        self._load_vocabulary()
+        self._autosave_pending_since: float = 0.0
+        
+        # Content hash and time of the last project save, used to skip
+        # autosave ticks that would rewrite an unchanged project
+        self._last_save_hash: int = 0
+        self._last_save_ts: float = 0.0
+        
+        # Background autosave state: one save at a time, with a follow-up
+        # save queued if the timer fires while one is running
+        self._project_autosave_worker = None
+        self._project_save_workers: list = []  # every save worker still running
+        self._autosave_in_flight = False
+        self._autosave_dirty_again = False
+        
+        # Read the vocabulary file and warm the theme stylesheets while the
+        # widgets are built
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            vocab_future = pool.submit(self._read_vocabulary_file, self.settings.vocabulary_file)
+            for theme in ("light", "dark"):
+                pool.submit(_load_theme_qss, theme)
+            
+            self._init_ui()
+            self._create_menus()
+            self._create_toolbar()
+            self._create_statusbar()
+            self._create_dock_widgets()
+            self._connect_signals()
+            
+            # Recent files come from settings only, no disk access
+            try:
+                recent = self.settings_manager.get_recent_files()
+            except Exception:
+                logger.exception("Recent files load failed")
+                recent = []
+            self._update_recent_menu(recent)
+            self._load_vocabulary(vocab_future)
         self._setup_autosave()
         
         # Restore window state
-        self.resize(self.settings.window_width, self.settings.window_height)
-        if self.settings.window_maximized:
-            self.showMaximized()
+        self._restore_window_state()
     
     def _init_ui(self):
         """Initialize the user interface."""
-        self.setWindowTitle("PersonalTranscribe")
+        self._update_window_title()
         self.setMinimumSize(800, 600)
         
         # Central widget with splitter
@@ -102,81 +271,149 @@ class MainWindow(QMainWindow):
         self.transcript_editor = TranscriptEditor()
         self.main_splitter.addWidget(self.transcript_editor)
         
-        # Set splitter sizes
-        self.main_splitter.setSizes(self.settings.splitter_sizes)
+        # Default splitter sizes; saved sizes are restored in _restore_window_state
+        self.main_splitter.setSizes([300, 600])
         
         layout.addWidget(self.main_splitter)
     
+    def _add_action(
+        self,
+        menu,
+        text: str,
+        slot=None,
+        shortcut=None,
+        status_tip: Optional[str] = None,
+        enabled: bool = True,
+        checkable: bool = False,
+        checked: bool = False,
+        icon: Optional[QIcon] = None
+    ) -> QAction:
+        """Create a QAction, configure it and add it to a menu.
+        
+        Args:
+            menu: Menu to add the action to
+            text: Action text
+            slot: Callable connected to triggered, if any
+            shortcut: Shortcut definition or key sequence string
+            status_tip: Status bar tip
+            enabled: Initial enabled state
+            checkable: Whether the action is checkable
+            checked: Initial checked state (checkable actions only)
+            icon: Action icon, if any
+            
+        Returns:
+            The new action
+        """
+        action = QAction(icon, text, self) if icon is not None else QAction(text, self)
+        if shortcut is not None:
+            action.setShortcut(
+                shortcut.key_sequence if isinstance(shortcut, Shortcut) else shortcut
+            )
+        if status_tip:
+            action.setStatusTip(status_tip)
+        if checkable:
+            action.setCheckable(True)
+            action.setChecked(checked)
+        if slot is not None:
+            action.triggered.connect(slot)
+        action.setEnabled(enabled)
+        menu.addAction(action)
+        return action
+    
+    def _add_choice_actions(self, menu, items, current, handler) -> dict:
+        """Add an exclusive group of checkable actions to a menu.
+        
+        The group's triggered(QAction) signal goes to one handler, which
+        reads the choice from action.data().
+        
+        Args:
+            menu: Menu to add the actions to
+            items: (id, text) or (id, text, status tip) tuples
+            current: Id of the action to check
+            handler: Slot receiving the triggered action
+            
+        Returns:
+            Dict mapping ids to actions
+        """
+        group = QActionGroup(self)
+        actions = {}
+        for item_id, text, *tip in items:
+            action = QAction(text, self)
+            action.setCheckable(True)
+            action.setData(item_id)
+            if tip:
+                action.setStatusTip(tip[0])
+            menu.addAction(action)
+            group.addAction(action)
+            actions[item_id] = action
+        
+        if current in actions:
+            actions[current].setChecked(True)
+        group.triggered.connect(handler)
+        return actions
+    
     def _create_menus(self):
         """Create menu bar and menus."""
         menubar = self.menuBar()
+        settings = self.settings
         
         # File menu
         file_menu = menubar.addMenu("&File")
         
-        self.open_audio_action = QAction("Open &Audio...", self)
-        self.open_audio_action.setShortcut(Shortcuts.OPEN_AUDIO.key_sequence)
-        self.open_audio_action.triggered.connect(self.open_audio)
-        file_menu.addAction(self.open_audio_action)
-        
-        self.open_project_action = QAction("Open &Project...", self)
-        self.open_project_action.setShortcut(Shortcuts.OPEN_PROJECT.key_sequence)
-        self.open_project_action.triggered.connect(self.open_project)
-        file_menu.addAction(self.open_project_action)
-        
-        self.recover_action = QAction("&Recover Transcription...", self)
-        self.recover_action.triggered.connect(self.recover_transcription)
-        file_menu.addAction(self.recover_action)
+        self.open_audio_action = self._add_action(
+            file_menu, "Open &Audio...", self.open_audio, Shortcuts.OPEN_AUDIO)
+        self.open_project_action = self._add_action(
+            file_menu, "Open &Project...", self.open_project, Shortcuts.OPEN_PROJECT)
+        self.recover_action = self._add_action(
+            file_menu, "&Recover Transcription...", self.recover_transcription)
         
         file_menu.addSeparator()
         
-        self.save_action = QAction("&Save Project", self)
-        self.save_action.setShortcut(Shortcuts.SAVE_PROJECT.key_sequence)
-        self.save_action.triggered.connect(self.save_project)
-        self.save_action.setEnabled(False)
-        file_menu.addAction(self.save_action)
-        
-        self.save_as_action = QAction("Save Project &As...", self)
-        self.save_as_action.setShortcut(Shortcuts.SAVE_PROJECT_AS.key_sequence)
-        self.save_as_action.triggered.connect(self.save_project_as)
-        self.save_as_action.setEnabled(False)
-        file_menu.addAction(self.save_as_action)
+        self.save_action = self._add_action(
+            file_menu, "&Save Project", self.save_project, Shortcuts.SAVE_PROJECT,
+            enabled=False)
+        self.save_as_action = self._add_action(
+            file_menu, "Save Project &As...", self.save_project_as, Shortcuts.SAVE_PROJECT_AS,
+            enabled=False)
         
         file_menu.addSeparator()
         # Batch Action
-        self.action_batch_transcribe = QAction(QIcon(), "Batch Transcribe...", self)
-        self.action_batch_transcribe.setStatusTip("Transcribe multiple files sequentially")
-        self.action_batch_transcribe.triggered.connect(self.batch_transcribe)
-        file_menu.addAction(self.action_batch_transcribe)
+        self.action_batch_transcribe = self._add_action(
+            file_menu, "Batch Transcribe...", self.batch_transcribe,
+            status_tip="Transcribe multiple files sequentially")
         
         file_menu.addSeparator()
-
+        
         # Export Action
-        self.action_export_transcript = QAction(QIcon(), "Export &Transcript...", self)
-        self.action_export_transcript.setStatusTip("Export transcript to PDF, Word, SRT, or VTT")
-        self.action_export_transcript.triggered.connect(self.export_transcript)
-        self.action_export_transcript.setEnabled(True)
-        file_menu.addAction(self.action_export_transcript)
+        self.action_export_transcript = self._add_action(
+            file_menu, "Export &Transcript...", self.export_transcript,
+            status_tip="Export transcript to PDF, Word, SRT, or VTT")
         
         file_menu.addSeparator()
         
-        self.metadata_action = QAction("Recording &Metadata...", self)
-        self.metadata_action.setShortcut("Ctrl+M")
-        self.metadata_action.triggered.connect(self.edit_metadata)
-        file_menu.addAction(self.metadata_action)
+        self.metadata_action = self._add_action(
+            file_menu, "Recording &Metadata...", self.edit_metadata, "Ctrl+M")
         
         file_menu.addSeparator()
         
         # Recent files submenu
         self.recent_menu = file_menu.addMenu("Recent Files")
-        self._update_recent_menu()
+        self.recent_menu.triggered.connect(self._on_recent_action_triggered)
+        
+        # Fixed pool of entries; _update_recent_menu only retitles/hides them
+        self.recent_placeholder_action = QAction("(No recent files)", self.recent_menu)
+        self.recent_placeholder_action.setEnabled(False)
+        self.recent_menu.addAction(self.recent_placeholder_action)
+        self.recent_actions = []
+        for _ in range(settings.max_recent_files):
+            action = QAction(self.recent_menu)
+            action.setVisible(False)
+            self.recent_menu.addAction(action)
+            self.recent_actions.append(action)
         
         file_menu.addSeparator()
         
-        exit_action = QAction("E&xit", self)
-        exit_action.setShortcut("Alt+F4")
-        exit_action.triggered.connect(self.close)
-        file_menu.addAction(exit_action)
+        self._add_action(file_menu, "E&xit", self.close, "Alt+F4")
         
         # Edit menu
         edit_menu = menubar.addMenu("&Edit")
@@ -189,54 +426,41 @@ class MainWindow(QMainWindow):
         self.redo_action.setShortcut(Shortcuts.REDO.key_sequence)
         edit_menu.addAction(self.redo_action)
         
+        self._add_action(
+            edit_menu, "Clear Undo &History", self.clear_undo_history,
+            status_tip="Discard undo/redo steps to free memory")
+        
         edit_menu.addSeparator()
         
         # Speaker Editor
-        self.action_edit_speakers = QAction("Edit &Speakers...", self)
-        self.action_edit_speakers.setStatusTip("Manage and rename speakers")
-        self.action_edit_speakers.triggered.connect(self.edit_speakers)
-        self.action_edit_speakers.setEnabled(False)
-        edit_menu.addAction(self.action_edit_speakers)
+        self.action_edit_speakers = self._add_action(
+            edit_menu, "Edit &Speakers...", self.edit_speakers,
+            status_tip="Manage and rename speakers", enabled=False)
         
         edit_menu.addSeparator()
         
-        self.find_action = QAction("&Find...", self)
-        self.find_action.setShortcut(Shortcuts.FIND.key_sequence)
-        self.find_action.setEnabled(False)
-        edit_menu.addAction(self.find_action)
-        
-        self.find_replace_action = QAction("Find && &Replace...", self)
-        self.find_replace_action.setShortcut(Shortcuts.FIND_REPLACE.key_sequence)
-        self.find_replace_action.triggered.connect(self.open_find_replace)
-        self.find_replace_action.setEnabled(False)
-        edit_menu.addAction(self.find_replace_action)
+        self.find_action = self._add_action(
+            edit_menu, "&Find...", shortcut=Shortcuts.FIND, enabled=False)
+        self.find_replace_action = self._add_action(
+            edit_menu, "Find && &Replace...", self.open_find_replace, Shortcuts.FIND_REPLACE,
+            enabled=False)
         
         edit_menu.addSeparator()
         
-        self.toggle_bookmark_action = QAction("Toggle &Bookmark", self)
-        self.toggle_bookmark_action.setShortcut(Shortcuts.TOGGLE_BOOKMARK.key_sequence)
-        self.toggle_bookmark_action.triggered.connect(self.toggle_bookmark)
-        self.toggle_bookmark_action.setEnabled(False)
-        edit_menu.addAction(self.toggle_bookmark_action)
-        
-        self.next_bookmark_action = QAction("Next Bookmark", self)
-        self.next_bookmark_action.setShortcut(Shortcuts.NEXT_BOOKMARK.key_sequence)
-        self.next_bookmark_action.triggered.connect(self.jump_to_next_bookmark)
-        self.next_bookmark_action.setEnabled(False)
-        edit_menu.addAction(self.next_bookmark_action)
-        
-        self.prev_bookmark_action = QAction("Previous Bookmark", self)
-        self.prev_bookmark_action.setShortcut(Shortcuts.PREV_BOOKMARK.key_sequence)
-        self.prev_bookmark_action.triggered.connect(self.jump_to_prev_bookmark)
-        self.prev_bookmark_action.setEnabled(False)
-        edit_menu.addAction(self.prev_bookmark_action)
+        self.toggle_bookmark_action = self._add_action(
+            edit_menu, "Toggle &Bookmark", self.toggle_bookmark, Shortcuts.TOGGLE_BOOKMARK,
+            enabled=False)
+        self.next_bookmark_action = self._add_action(
+            edit_menu, "Next Bookmark", self.jump_to_next_bookmark, Shortcuts.NEXT_BOOKMARK,
+            enabled=False)
+        self.prev_bookmark_action = self._add_action(
+            edit_menu, "Previous Bookmark", self.jump_to_prev_bookmark, Shortcuts.PREV_BOOKMARK,
+            enabled=False)
         
         edit_menu.addSeparator()
         
-        self.set_speaker_label_action = QAction("Set &Speaker Label...", self)
-        self.set_speaker_label_action.triggered.connect(self.set_speaker_label)
-        self.set_speaker_label_action.setEnabled(False)
-        edit_menu.addAction(self.set_speaker_label_action)
+        self.set_speaker_label_action = self._add_action(
+            edit_menu, "Set &Speaker Label...", self.set_speaker_label, enabled=False)
         
         # Transcription menu
         transcription_menu = menubar.addMenu("&Transcription")
@@ -253,7 +477,6 @@ class MainWindow(QMainWindow):
         model_menu = transcription_menu.addMenu("Whisper &Model")
         
         # Model options with descriptions
-        self.model_actions = {}
         models = [
             ("tiny", "Tiny (~75MB) - Fastest, lowest accuracy"),
             ("base", "Base (~140MB) - Fast, basic accuracy"),
@@ -262,217 +485,143 @@ class MainWindow(QMainWindow):
             ("large-v3", "Large-v3 (~3GB) - Best accuracy (recommended)")
         ]
         
-        model_group = QActionGroup(self)
-        for model_id, description in models:
-            action = QAction(description, self)
-            action.setCheckable(True)
-            action.setData(model_id)
-            action.triggered.connect(lambda checked, m=model_id: self._set_whisper_model(m))
-            model_menu.addAction(action)
-            model_group.addAction(action)
-            self.model_actions[model_id] = action
-            
-            # Check current model
-            if model_id == self.settings.whisper_model:
-                action.setChecked(True)
+        self.model_actions = self._add_choice_actions(
+            model_menu, models, settings.whisper_model, self._on_model_action_triggered)
         
         transcription_menu.addSeparator()
         
         # Device selection submenu
         device_menu = transcription_menu.addMenu("&Device")
         
-        self.device_actions = {}
         devices = [
             ("auto", "Auto (GPU if available, else CPU)"),
             ("cuda", "GPU (CUDA) - Fast, requires NVIDIA GPU"),
             ("cpu", "CPU Only - Slower, works everywhere")
         ]
         
-        device_group = QActionGroup(self)
-        for device_id, description in devices:
-            action = QAction(description, self)
-            action.setCheckable(True)
-            action.setData(device_id)
-            action.triggered.connect(lambda checked, d=device_id: self._set_whisper_device(d))
-            device_menu.addAction(action)
-            device_group.addAction(action)
-            self.device_actions[device_id] = action
-            
-            if device_id == self.settings.whisper_device:
-                action.setChecked(True)
+        self.device_actions = self._add_choice_actions(
+            device_menu, devices, settings.whisper_device, self._on_device_action_triggered)
         
         transcription_menu.addSeparator()
         
         # Segment mode submenu
         segment_mode_menu = transcription_menu.addMenu("Segment Mode")
-        segment_mode_group = QActionGroup(self)
-        segment_mode_group.setExclusive(True)
-        self.segment_mode_actions = {}
         
         segment_modes = [
             ("natural", "Natural (Short Segments)", "Split on brief pauses - more segments"),
             ("sentence", "Sentence (Complete Sentences)", "Split only on long pauses - fewer, complete segments")
         ]
         
-        for mode_id, mode_name, mode_tip in segment_modes:
-            action = QAction(mode_name, self)
-            action.setStatusTip(mode_tip)
-            action.setCheckable(True)
-            action.setData(mode_id)
-            action.triggered.connect(lambda checked, m=mode_id: self._set_segment_mode(m))
-            segment_mode_menu.addAction(action)
-            segment_mode_group.addAction(action)
-            self.segment_mode_actions[mode_id] = action
-            
-            if mode_id == self.settings.whisper_segment_mode:
-                action.setChecked(True)
+        self.segment_mode_actions = self._add_choice_actions(
+            segment_mode_menu, segment_modes, settings.whisper_segment_mode,
+            self._on_segment_mode_action_triggered)
         
         transcription_menu.addSeparator()
         
-        self.vocabulary_action = QAction("&Vocabulary Manager...", self)
-        self.vocabulary_action.triggered.connect(self.open_vocabulary_manager)
-        transcription_menu.addAction(self.vocabulary_action)
+        self.vocabulary_action = self._add_action(
+            transcription_menu, "&Vocabulary Manager...", self.open_vocabulary_manager)
         
         # Playback menu
         playback_menu = menubar.addMenu("&Playback")
         
-        self.play_pause_action = QAction("Play/Pause", self)
-        self.play_pause_action.setShortcut(Shortcuts.PLAY_PAUSE.key_sequence)
-        self.play_pause_action.triggered.connect(self.audio_player.toggle_play)
-        playback_menu.addAction(self.play_pause_action)
-        
-        self.replay_action = QAction("Replay Last 5 Seconds", self)
-        self.replay_action.setShortcut(Shortcuts.REPLAY_5SEC.key_sequence)
-        self.replay_action.triggered.connect(lambda: self.audio_player.replay_last_seconds(5))
-        playback_menu.addAction(self.replay_action)
+        self.play_pause_action = self._add_action(
+            playback_menu, "Play/Pause", self.audio_player.toggle_play, Shortcuts.PLAY_PAUSE)
+        self.replay_action = self._add_action(
+            playback_menu, "Replay Last 5 Seconds",
+            self._replay_last_5s, Shortcuts.REPLAY_5SEC)
         
         playback_menu.addSeparator()
         
-        self.skip_back_action = QAction("Skip Back 5s", self)
-        self.skip_back_action.setShortcut(Shortcuts.SKIP_BACKWARD.key_sequence)
-        self.skip_back_action.triggered.connect(lambda: self.audio_player.skip(-5))
-        playback_menu.addAction(self.skip_back_action)
-        
-        self.skip_forward_action = QAction("Skip Forward 5s", self)
-        self.skip_forward_action.setShortcut(Shortcuts.SKIP_FORWARD.key_sequence)
-        self.skip_forward_action.triggered.connect(lambda: self.audio_player.skip(5))
-        playback_menu.addAction(self.skip_forward_action)
+        self.skip_back_action = self._add_action(
+            playback_menu, "Skip Back 5s", self._skip_back_5s,
+            Shortcuts.SKIP_BACKWARD)
+        self.skip_forward_action = self._add_action(
+            playback_menu, "Skip Forward 5s", self._skip_forward_5s,
+            Shortcuts.SKIP_FORWARD)
         
         playback_menu.addSeparator()
         
-        self.loop_action = QAction("Toggle Loop Mode", self)
-        self.loop_action.setShortcut(Shortcuts.LOOP_SEGMENT.key_sequence)
-        self.loop_action.triggered.connect(lambda: self.audio_player.loop_button.click())
-        playback_menu.addAction(self.loop_action)
+        self.loop_action = self._add_action(
+            playback_menu, "Toggle Loop Mode", self._toggle_loop_mode,
+            Shortcuts.LOOP_SEGMENT)
         
         playback_menu.addSeparator()
         
-        self.jump_to_time_action = QAction("Jump to Time...", self)
-        self.jump_to_time_action.setShortcut(Shortcuts.GO_TO_TIME.key_sequence)
-        self.jump_to_time_action.triggered.connect(self.jump_to_time)
-        playback_menu.addAction(self.jump_to_time_action)
+        self.jump_to_time_action = self._add_action(
+            playback_menu, "Jump to Time...", self.jump_to_time, Shortcuts.GO_TO_TIME)
         
         # View menu
         view_menu = menubar.addMenu("&View")
         
-        self.toggle_waveform_action = QAction("Toggle &Waveform", self)
-        self.toggle_waveform_action.setShortcut(Shortcuts.TOGGLE_WAVEFORM.key_sequence)
-        self.toggle_waveform_action.setCheckable(True)
-        self.toggle_waveform_action.setChecked(True)
-        self.toggle_waveform_action.triggered.connect(self.toggle_waveform)
-        view_menu.addAction(self.toggle_waveform_action)
-        
-        self.toggle_stats_action = QAction("Toggle &Statistics Panel", self)
-        self.toggle_stats_action.setCheckable(True)
-        self.toggle_stats_action.setChecked(False)
-        self.toggle_stats_action.triggered.connect(self.toggle_statistics_panel)
-        view_menu.addAction(self.toggle_stats_action)
+        self.toggle_waveform_action = self._add_action(
+            view_menu, "Toggle &Waveform", self.toggle_waveform, Shortcuts.TOGGLE_WAVEFORM,
+            checkable=True, checked=True)
+        self.toggle_stats_action = self._add_action(
+            view_menu, "Toggle &Statistics Panel", self.toggle_statistics_panel,
+            checkable=True, checked=False)
         
         view_menu.addSeparator()
         
-        self.toggle_confidence_action = QAction("Show &Confidence Highlighting", self)
-        self.toggle_confidence_action.setCheckable(True)
-        self.toggle_confidence_action.setChecked(True)
-        self.toggle_confidence_action.triggered.connect(self.toggle_confidence_highlighting)
-        view_menu.addAction(self.toggle_confidence_action)
-        
-        self.next_low_conf_action = QAction("Next Low Confidence", self)
-        self.next_low_conf_action.setShortcut(Shortcuts.NEXT_LOW_CONFIDENCE.key_sequence)
-        self.next_low_conf_action.triggered.connect(self.jump_to_next_low_confidence)
-        self.next_low_conf_action.setEnabled(False)
-        view_menu.addAction(self.next_low_conf_action)
-        
-        self.prev_low_conf_action = QAction("Previous Low Confidence", self)
-        self.prev_low_conf_action.setShortcut(Shortcuts.PREV_LOW_CONFIDENCE.key_sequence)
-        self.prev_low_conf_action.triggered.connect(self.jump_to_prev_low_confidence)
-        self.prev_low_conf_action.setEnabled(False)
-        view_menu.addAction(self.prev_low_conf_action)
+        self.toggle_confidence_action = self._add_action(
+            view_menu, "Show &Confidence Highlighting", self.toggle_confidence_highlighting,
+            checkable=True, checked=True)
+        self.next_low_conf_action = self._add_action(
+            view_menu, "Next Low Confidence", self.jump_to_next_low_confidence,
+            Shortcuts.NEXT_LOW_CONFIDENCE, enabled=False)
+        self.prev_low_conf_action = self._add_action(
+            view_menu, "Previous Low Confidence", self.jump_to_prev_low_confidence,
+            Shortcuts.PREV_LOW_CONFIDENCE, enabled=False)
         
         view_menu.addSeparator()
         
-        self.toggle_dark_mode_action = QAction("&Dark Mode", self)
-        self.toggle_dark_mode_action.setShortcut(Shortcuts.TOGGLE_DARK_MODE.key_sequence)
-        self.toggle_dark_mode_action.setCheckable(True)
-        self.toggle_dark_mode_action.setChecked(self.settings.theme == "dark")
-        self.toggle_dark_mode_action.triggered.connect(self.toggle_dark_mode)
-        view_menu.addAction(self.toggle_dark_mode_action)
+        self.toggle_dark_mode_action = self._add_action(
+            view_menu, "&Dark Mode", self.toggle_dark_mode, Shortcuts.TOGGLE_DARK_MODE,
+            checkable=True, checked=settings.theme == "dark")
+        self.native_file_dialogs_action = self._add_action(
+            view_menu, "Use &Native File Dialogs", self.toggle_native_file_dialogs,
+            status_tip="Turn off if opening or saving files is slow on large or network folders",
+            checkable=True, checked=self.settings.file_dialog_use_native)
         
         # AI menu (top-level for visibility)
         ai_menu = menubar.addMenu("&AI")
         
-        self.ai_settings_action = QAction("AI &Settings...", self)
-        self.ai_settings_action.triggered.connect(self.open_ai_settings)
-        ai_menu.addAction(self.ai_settings_action)
+        self.ai_settings_action = self._add_action(
+            ai_menu, "AI &Settings...", self.open_ai_settings)
         
         ai_menu.addSeparator()
         
-        self.ai_polish_all_action = QAction("Polish &Entire Transcript...", self)
-        self.ai_polish_all_action.setShortcut("Ctrl+Shift+P")
-        self.ai_polish_all_action.triggered.connect(lambda: self.open_ai_polish("all"))
-        self.ai_polish_all_action.setEnabled(False)
-        ai_menu.addAction(self.ai_polish_all_action)
-        
-        self.ai_polish_selected_action = QAction("Polish &Selected Lines...", self)
-        self.ai_polish_selected_action.triggered.connect(lambda: self.open_ai_polish("selected"))
-        self.ai_polish_selected_action.setEnabled(False)
-        ai_menu.addAction(self.ai_polish_selected_action)
-        
-        self.ai_polish_range_action = QAction("Polish Time &Range...", self)
-        self.ai_polish_range_action.triggered.connect(lambda: self.open_ai_polish("range"))
-        self.ai_polish_range_action.setEnabled(False)
-        ai_menu.addAction(self.ai_polish_range_action)
+        # Polish actions carry their mode as data and share one dispatcher
+        self.ai_polish_all_action = self._add_action(
+            ai_menu, "Polish &Entire Transcript...", shortcut="Ctrl+Shift+P", enabled=False)
+        self.ai_polish_all_action.setData("all")
+        self.ai_polish_selected_action = self._add_action(
+            ai_menu, "Polish &Selected Lines...", enabled=False)
+        self.ai_polish_selected_action.setData("selected")
+        self.ai_polish_range_action = self._add_action(
+            ai_menu, "Polish Time &Range...", enabled=False)
+        self.ai_polish_range_action.setData("range")
+        ai_menu.triggered.connect(self._on_ai_polish_triggered)
         
         # Help menu
         help_menu = menubar.addMenu("&Help")
         
-        shortcuts_action = QAction("&Keyboard Shortcuts", self)
-        shortcuts_action.triggered.connect(self.show_shortcuts)
-        help_menu.addAction(shortcuts_action)
+        self._add_action(help_menu, "&Keyboard Shortcuts", self.show_shortcuts)
         
         help_menu.addSeparator()
         
         # Log management
-        view_logs_action = QAction("&View Log File", self)
-        view_logs_action.triggered.connect(self.view_logs)
-        help_menu.addAction(view_logs_action)
-        
-        open_log_folder_action = QAction("Open Log &Folder", self)
-        open_log_folder_action.triggered.connect(self.open_log_folder)
-        help_menu.addAction(open_log_folder_action)
-        
-        clear_logs_action = QAction("&Clear Logs", self)
-        clear_logs_action.triggered.connect(self.clear_application_logs)
-        help_menu.addAction(clear_logs_action)
+        self._add_action(help_menu, "&View Log File", self.view_logs)
+        self._add_action(help_menu, "Open Log &Folder", self.open_log_folder)
+        self._add_action(help_menu, "&Clear Logs", self.clear_application_logs)
         
         help_menu.addSeparator()
         
-        about_action = QAction("&About", self)
-        about_action.triggered.connect(self.show_about)
-        help_menu.addAction(about_action)
+        self._add_action(help_menu, "&About", self.show_about)
     
     def _create_toolbar(self):
         """Create main toolbar."""
         toolbar = QToolBar("Main Toolbar")
+        toolbar.setObjectName("main_toolbar")
         toolbar.setMovable(False)
         self.addToolBar(toolbar)
         
@@ -503,10 +652,10 @@ class MainWindow(QMainWindow):
     
     def _create_dock_widgets(self):
         """Create dock widgets for statistics, etc."""
-        # Statistics panel dock
-        self.statistics_panel = StatisticsPanel()
+        # Statistics panel dock (panel is built the first time it is shown)
+        self.statistics_panel: Optional["StatisticsPanel"] = None
         self.stats_dock = QDockWidget("Statistics", self)
-        self.stats_dock.setWidget(self.statistics_panel)
+        self.stats_dock.setObjectName("stats_dock")
         self.stats_dock.setAllowedAreas(
             Qt.DockWidgetArea.RightDockWidgetArea | 
             Qt.DockWidgetArea.LeftDockWidgetArea
@@ -514,24 +663,186 @@ class MainWindow(QMainWindow):
         self.addDockWidget(Qt.DockWidgetArea.RightDockWidgetArea, self.stats_dock)
         self.stats_dock.hide()  # Hidden by default
     
+    def _restore_window_state(self):
+        """Restore geometry, dock/toolbar layout and splitter sizes."""
+        geometry = self.settings_manager.get_bytes("window_geometry")
+        if geometry:
+            self.restoreGeometry(geometry)
+        else:
+            self.resize(self.settings.window_width, self.settings.window_height)
+            if self.settings.window_maximized:
+                self.showMaximized()
+        
+        state = self.settings_manager.get_bytes("window_state")
+        if state and self.restoreState(state) and not self.stats_dock.isHidden():
+            # Dock came back visible; build its panel and sync the menu
+            self.toggle_stats_action.setChecked(True)
+            self.toggle_statistics_panel(True)
+        
+        splitter_state = self.settings_manager.get_bytes("splitter_state")
+        if splitter_state:
+            self.main_splitter.restoreState(splitter_state)
+    
     def _setup_autosave(self):
         """Configure autosave based on settings."""
         if self.settings.auto_save_enabled:
-            interval_ms = self.settings.auto_save_interval * 1000
-            self.autosave_timer.start(interval_ms)
+            # Started by _mark_modified() after each edit
+            self.autosave_timer.setInterval(self.settings.auto_save_interval * 1000)
             self.autosave_label.setText("Autosave: ON")
         else:
             self.autosave_timer.stop()
             self.autosave_label.setText("")
     
-    def _autosave(self):
-        """Perform autosave if project has been saved before."""
+    def _project_content_hash(self, transcript: Optional[Transcript]) -> int:
+        """Cheap hash of everything that ends up in the project file."""
+        segments = ()
+        if transcript:
+            segments = tuple(
+                (s.start_time, s.end_time, s.text, s.speaker_label, s.is_bookmarked)
+                for s in transcript.segments
+            )
+        return hash((
+            self.current_audio_path,
+            segments,
+            self._vocab_snapshot,
+            repr(self.metadata.to_dict())
+        ))
+    
+    def _autosave(self, respect_interval: bool = True):
+        """Perform autosave if project has been saved before.
+        
+        The project is snapshotted here and written by an AutosaveWorker
+        so serialization and disk I/O stay off the GUI thread.
+        
+        Args:
+            respect_interval: If False, don't skip because of a recent save
+        """
+        if self._autosave_in_flight:
+            self._autosave_dirty_again = True
+            return
+        
         if self.is_modified and self.current_project and self.current_project.file_path:
+            # Don't rewrite right after a save (e.g. a manual Ctrl+S)
+            min_interval = self.settings.auto_save_interval * 0.9
+            if respect_interval and time.monotonic() - self._last_save_ts < min_interval:
+                # Try again later rather than dropping the pending edits
+                self.autosave_timer.start()
+                return
+            
+            # Skip if the content matches what was last written
+            transcript = self.transcript_editor.get_transcript()
+            content_hash = self._project_content_hash(transcript)
+            if content_hash == self._last_save_hash:
+                return
+            
             try:
-                self._save_project_to(self.current_project.file_path)
+                # Periodic saves skip fsync unless asked to; the atomic
+                # rename keeps the file intact either way
+                self._start_project_save(
+                    self.current_project, transcript, self.current_project.file_path,
+                    content_hash, fsync=self.settings.auto_save_fsync
+                )
+            except Exception:
+                logger.exception("Autosave failed")
+    
+    def _start_project_save(
+        self,
+        project: Project,
+        transcript: Optional[Transcript],
+        file_path: str,
+        content_hash: int,
+        fsync: bool,
+        manual: bool = False
+    ):
+        """Write a snapshot of a project from an AutosaveWorker.
+        
+        Only the in-memory copy happens here; JSON serialization and disk
+        I/O run on the worker thread, so large transcripts don't stall
+        the UI while saving.
+        
+        Args:
+            project: Project whose fields are saved
+            transcript: Current transcript, copied before handing it over
+            file_path: Path to save to
+            content_hash: Content hash of what is being saved
+            fsync: Flush the file to disk before the worker finishes
+            manual: True for an explicit save, which reports errors to the user
+                and makes the project current (at file_path) once written
+        """
+        from src.ui.autosave_worker import AutosaveWorker
+        
+        snapshot = replace(
+            project,
+            audio_file=self.current_audio_path or "",
+            transcript=transcript.snapshot() if transcript else None,
+            vocabulary=self._vocab_snapshot,
+            file_path=file_path
+        )
+        worker = AutosaveWorker(snapshot, file_path, fsync=fsync)
+        worker.finished.connect(
+            lambda success, result, w=worker, h=content_hash, m=manual, p=project:
+                self._on_project_autosaved(w, success, result, h, m, p)
+        )
+        self._project_autosave_worker = worker
+        self._project_save_workers.append(worker)
+        self._autosave_in_flight = True
+        worker.start()
+    
+    def _on_project_autosaved(
+        self,
+        worker,
+        success: bool,
+        result: str,
+        content_hash: int,
+        manual: bool = False,
+        project: Optional[Project] = None
+    ):
+        """Handle completion of a background project save.
+        
+        Only the most recently started worker updates the save state; a
+        superseded one finishing late must not clear the in-flight flag.
+        A manual save only adopts its project and path once written, so a
+        failed Save As leaves the previous file in place for later saves.
+        """
+        if worker in self._project_save_workers:
+            self._project_save_workers.remove(worker)
+        if success and manual and project is not None:
+            # Adopted even if superseded; callbacks arrive in start order
+            project.file_path = result
+            self.current_project = project
+            self.save_action.setEnabled(True)
+        if worker is not self._project_autosave_worker:
+            return
+        self._autosave_in_flight = False
+        
+        if success:
+            self._last_save_hash = content_hash
+            self._last_save_ts = time.monotonic()
+            
+            # Edits made while saving keep the project marked as modified
+            transcript = self.transcript_editor.get_transcript()
+            if self._project_content_hash(transcript) == content_hash:
+                self.is_modified = False
+                self.undo_stack.setClean()
+            if manual:
+                self.status_label.setText(f"Saved: {os.path.basename(result)}")
+                self._update_window_title(os.path.basename(result))
+            else:
+                self._update_window_title()
                 self.status_label.setText("Auto-saved")
-            except Exception as e:
-                print(f"Autosave failed: {e}")
+        elif manual:
+            QMessageBox.critical(self, "Error", f"Failed to save project:\n{result}")
+        else:
+            logger.error(f"Autosave failed: {result}")
+        
+        if self._autosave_dirty_again:
+            self._autosave_dirty_again = False
+            QTimer.singleShot(0, lambda: self._autosave(respect_interval=False))
+    
+    def _wait_for_autosave(self):
+        """Block until running background saves (manual or timed) have finished writing."""
+        for worker in list(self._project_save_workers):
+            worker.wait()
     
     def _connect_signals(self):
         """Connect widget signals."""
@@ -542,52 +853,187 @@ class MainWindow(QMainWindow):
         # Transcript editor signals
         self.transcript_editor.segment_clicked.connect(self._on_segment_clicked)
         self.transcript_editor.segment_edited.connect(self._on_segment_edited)
+        self.transcript_editor.segments_changed.connect(self._invalidate_segment_caches)
+        
+        # Undo/redo changes the transcript too
+        self.undo_stack.indexChanged.connect(self._mark_modified)
+        self.undo_stack.cleanChanged.connect(self._on_undo_clean_changed)
     
-    def _load_vocabulary(self):
-        """Load vocabulary from file."""
-        vocab_path = Path(self.settings.vocabulary_file)
-        if vocab_path.exists():
-            try:
-                with open(vocab_path, "r", encoding="utf-8") as f:
-                    lines = f.readlines()
-                self.vocabulary = [
-                    line.strip() for line in lines
-                    if line.strip() and not line.strip().startswith("#")
-                ]
-            except Exception as e:
-                print(f"Error loading vocabulary: {e}")
+    def clear_undo_history(self):
+        """Discard all undo/redo steps without touching the transcript."""
+        was_modified = self.is_modified
+        self.undo_stack.clear()
+        
+        # clear() reports an index change, which isn't an edit
+        if not was_modified and self.is_modified:
+            self.is_modified = False
+            self.autosave_timer.stop()
+            self._update_window_title()
     
-    def _update_recent_menu(self):
-        """Update recent files menu."""
-        self.recent_menu.clear()
-        recent_files = self.settings_manager.get_recent_files()
+    def _on_undo_clean_changed(self, clean: bool):
+        """Drop the modified flag when undo/redo returns to the saved state.
         
-        if not recent_files:
-            action = QAction("(No recent files)", self)
-            action.setEnabled(False)
-            self.recent_menu.addAction(action)
-        else:
-            for path in recent_files:
-                action = QAction(os.path.basename(path), self)
-                action.setData(path)
-                action.triggered.connect(lambda checked, p=path: self._open_recent_file(p))
-                self.recent_menu.addAction(action)
+        Metadata, vocabulary and transcription results are not on the undo
+        stack, so the content hash decides whether there is anything to save.
+        
+        Args:
+            clean: Whether the undo stack is at its clean index
+        """
+        if not clean or not self.is_modified:
+            return
+        
+        transcript = self.transcript_editor.get_transcript()
+        if self._project_content_hash(transcript) == self._last_save_hash:
+            self.is_modified = False
+            self.autosave_timer.stop()
+            self._update_window_title()
+    
+    @staticmethod
+    def _read_vocabulary_file(file_path: str) -> Optional[list]:
+        """Read unique, non-comment words from a vocabulary file.
+        
+        Safe to call off the GUI thread.
+        
+        Args:
+            file_path: Path to the vocabulary file
+            
+        Returns:
+            The words in file order, or None if the file doesn't exist
+        """
+        vocab_path = Path(file_path)
+        if not vocab_path.exists():
+            return None
+        
+        vocabulary = []
+        seen = set()
+        with open(vocab_path, "r", encoding="utf-8") as f:
+            for line in f:
+                word = line.strip()
+                if word and not word.startswith("#") and word not in seen:
+                    seen.add(word)
+                    vocabulary.append(word)
+        return vocabulary
+    
+    def _load_vocabulary(self, future=None):
+        """Load vocabulary from file.
+        
+        Args:
+            future: Pending _read_vocabulary_file() result to use instead
+                of reading the file here
+        """
+        try:
+            if future is not None:
+                vocabulary = future.result()
+            else:
+                vocabulary = self._read_vocabulary_file(self.settings.vocabulary_file)
+            if vocabulary is not None:
+                self.vocabulary = vocabulary
+                self._vocab_snapshot = tuple(vocabulary)
+        except Exception:
+            logger.exception("Vocabulary load failed")
+    
+    def _update_recent_menu(self, recent_files: Optional[list] = None):
+        """Update recent files menu from the fixed pool of actions.
+        
+        Args:
+            recent_files: (path, name) tuples already fetched from the
+                settings manager, if any
+        """
+        if recent_files is None:
+            recent_files = self.settings_manager.get_recent_files()
+        
+        state = list(recent_files)
+        if state == self._recent_menu_state:
+            return
+        
+        self.recent_placeholder_action.setVisible(not state)
+        for i, action in enumerate(self.recent_actions):
+            if i < len(state):
+                path, name = state[i]
+                if action.data() != path:
+                    action.setText(name)
+                    action.setData(path)
+                action.setVisible(True)
+            else:
+                action.setVisible(False)
+        
+        self._recent_menu_state = state
+    
+    def _on_recent_action_triggered(self, action: QAction):
+        """Open the file behind a recent files menu entry."""
+        path = action.data()
+        if path:
+            self._open_recent_file(path)
     
     def _open_recent_file(self, path: str):
         """Open a file from recent files."""
+        # The menu is built without touching the disk; check now
+        if not os.path.exists(path):
+            QMessageBox.warning(
+                self, "File Not Found",
+                f"The file no longer exists and was removed from recent files:\n{path}"
+            )
+            self.settings_manager.remove_recent_file(path)
+            self._update_recent_menu()
+            return
+        
         if path.endswith(".ptproj"):
             self._load_project(path)
         else:
             self._load_audio(path)
     
+    def _file_dialog_options(self) -> QFileDialog.Option:
+        """Options for open/save file dialogs, based on settings."""
+        options = QFileDialog.Option(0)
+        if not self.settings.file_dialog_use_native:
+            options |= (
+                QFileDialog.Option.DontUseNativeDialog |
+                QFileDialog.Option.DontResolveSymlinks |
+                QFileDialog.Option.DontUseCustomDirectoryIcons
+            )
+        return options
+    
+    def _get_file_dialog(self, role: str, title: str, name_filters: list, save: bool = False) -> QFileDialog:
+        """Get the file dialog for a role, creating it on first use.
+        
+        Args:
+            role: Cache key, e.g. "open_audio"
+            title: Dialog title
+            name_filters: Name filters, e.g. ["All Files (*)"]
+            save: Whether the dialog saves rather than opens a file
+            
+        Returns:
+            The dialog for the role
+        """
+        dialog = self._file_dialogs.get(role)
+        if dialog is None:
+            dialog = QFileDialog(self, title)
+            dialog.setNameFilters(name_filters)
+            dialog.setOptions(self._file_dialog_options())
+            if save:
+                dialog.setAcceptMode(QFileDialog.AcceptMode.AcceptSave)
+                dialog.setFileMode(QFileDialog.FileMode.AnyFile)
+            else:
+                dialog.setFileMode(QFileDialog.FileMode.ExistingFile)
+            self._file_dialogs[role] = dialog
+        return dialog
+    
+    def _run_file_dialog(self, dialog: QFileDialog) -> str:
+        """Show a file dialog and return the chosen path, or "" if cancelled."""
+        if dialog.exec() == QDialog.DialogCode.Accepted:
+            files = dialog.selectedFiles()
+            if files:
+                return files[0]
+        return ""
+    
     def open_audio(self):
         """Open audio file dialog."""
-        file_path, _ = QFileDialog.getOpenFileName(
-            self,
+        dialog = self._get_file_dialog(
+            "open_audio",
             "Open Audio File",
-            "",
-            "Audio Files (*.mp3 *.wav *.m4a *.flac *.ogg *.wma);;All Files (*)"
+            ["Audio Files (*.mp3 *.wav *.m4a *.flac *.ogg *.wma)", "All Files (*)"]
         )
+        file_path = self._run_file_dialog(dialog)
         
         if file_path:
             self._load_audio(file_path)
@@ -601,18 +1047,18 @@ class MainWindow(QMainWindow):
             self.settings_manager.add_recent_file(file_path)
             self._update_recent_menu()
             self.status_label.setText(f"Loaded: {os.path.basename(file_path)}")
-            self.setWindowTitle(f"PersonalTranscribe - {os.path.basename(file_path)}")
+            self._update_window_title(os.path.basename(file_path))
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to load audio:\n{e}")
     
     def open_project(self):
         """Open project file dialog."""
-        file_path, _ = QFileDialog.getOpenFileName(
-            self,
+        dialog = self._get_file_dialog(
+            "open_project",
             "Open Project",
-            "",
-            "PersonalTranscribe Projects (*.ptproj);;All Files (*)"
+            ["PersonalTranscribe Projects (*.ptproj)", "All Files (*)"]
         )
+        file_path = self._run_file_dialog(dialog)
         
         if file_path:
             self._load_project(file_path)
@@ -623,19 +1069,24 @@ class MainWindow(QMainWindow):
             project = ProjectManager.load(file_path)
             self.current_project = project
             
-            # Load audio if exists
-            if project.audio_file and os.path.exists(project.audio_file):
+            # Load audio if exists and differs from the one already loaded
+            if (
+                project.audio_file
+                and project.audio_file != self.current_audio_path
+                and os.path.exists(project.audio_file)
+            ):
                 self.audio_player.load_audio(project.audio_file)
                 self.current_audio_path = project.audio_file
             
             # Load transcript
             if project.transcript:
                 self.transcript_editor.load_transcript(project.transcript)
-                self.statistics_panel.set_transcript(project.transcript)
+                self._set_stats_transcript(project.transcript)
                 self._enable_edit_actions(True)
             
             # Load vocabulary
-            self.vocabulary = project.vocabulary.copy()
+            self.vocabulary = list(project.vocabulary)
+            self._vocab_snapshot = tuple(self.vocabulary)
             
             self.transcribe_action.setEnabled(bool(self.current_audio_path))
             self.save_action.setEnabled(True)
@@ -645,60 +1096,85 @@ class MainWindow(QMainWindow):
             self.settings_manager.add_recent_file(file_path)
             self._update_recent_menu()
             self.status_label.setText(f"Loaded project: {os.path.basename(file_path)}")
-            self.setWindowTitle(f"PersonalTranscribe - {os.path.basename(file_path)}")
             self.is_modified = False
+            self._last_save_hash = self._project_content_hash(project.transcript)
+            self.undo_stack.setClean()
+            self._update_window_title(os.path.basename(file_path))
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to load project:\n{e}")
     
-    def _update_window_title(self):
-        """Update window title to show modified state."""
-        title = self.windowTitle()
+    def _mark_modified(self):
+        """Flag unsaved changes and schedule an autosave.
         
-        # Remove existing modified indicator if present
-        if title.endswith(" *"):
-            title = title[:-2]
+        The title is only touched on the first change.
+        """
+        self.is_modified = True
+        if not self._title_modified:
+            self._update_window_title()
         
-        # Add modified indicator if needed
-        if self.is_modified and not title.endswith(" *"):
-            self.setWindowTitle(title + " *")
-        else:
+        if self.settings.auto_save_enabled:
+            now = time.monotonic()
+            if not self.autosave_timer.isActive():
+                self._autosave_pending_since = now
+                self.autosave_timer.start()
+            elif now - self._autosave_pending_since < self.settings.auto_save_interval:
+                # Push the save back until editing pauses
+                self.autosave_timer.start()
+    
+    def _update_window_title(self, name: Optional[str] = None):
+        """Update window title to show the open file and modified state.
+        
+        The modified marker is Qt's [*] placeholder, driven by
+        setWindowModified(), and the title itself is only set when it changes.
+        
+        Args:
+            name: New file name to show, or None to keep the current one
+        """
+        if name is not None:
+            self._title_name = name
+        
+        title = f"PersonalTranscribe - {self._title_name}[*]" if self._title_name else "PersonalTranscribe[*]"
+        if title != self._current_title:
+            self._current_title = title
             self.setWindowTitle(title)
+        if self.is_modified != self._title_modified:
+            self._title_modified = self.is_modified
+            self.setWindowModified(self.is_modified)
+    
+    @staticmethod
+    def _scan_recovery_dir(directory: str, suffix: str, file_type: str, out: list):
+        """Collect recovery files from one directory.
+        
+        Uses os.scandir so file type and mtime come from the directory
+        listing instead of a separate stat per file (on Windows).
+        
+        Args:
+            directory: Directory to scan; missing directories are skipped
+            suffix: File extension to match
+            file_type: Label stored with each entry
+            out: List to append (file_type, path, name, mtime) tuples to
+        """
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name.endswith(suffix) and entry.is_file():
+                        out.append((file_type, entry.path, entry.name, entry.stat().st_mtime))
+        except FileNotFoundError:
+            pass
     
     def recover_transcription(self):
         """Recover transcription from streaming/autosave files."""
-        import os
-        
         # Check for streaming files
-        stream_dir = os.path.join(
-            os.environ.get("LOCALAPPDATA", os.path.expanduser("~")),
-            "PersonalTranscribe",
-            "streaming"
-        )
+        stream_dir = self._streaming_dir
         
-        autosave_dir = os.path.join(
-            os.environ.get("LOCALAPPDATA", os.path.expanduser("~")),
-            "PersonalTranscribe",
-            "autosave"
-        )
+        autosave_dir = self._autosave_dir
         
         # Collect all recovery files
         recovery_files = []
         
-        # Check streaming directory
-        if os.path.exists(stream_dir):
-            for f in os.listdir(stream_dir):
-                if f.endswith('.json'):
-                    full_path = os.path.join(stream_dir, f)
-                    mtime = os.path.getmtime(full_path)
-                    recovery_files.append(("stream", full_path, f, mtime))
-        
-        # Check autosave directory
-        if os.path.exists(autosave_dir):
-            for f in os.listdir(autosave_dir):
-                if f.endswith('.ptproj'):
-                    full_path = os.path.join(autosave_dir, f)
-                    mtime = os.path.getmtime(full_path)
-                    recovery_files.append(("autosave", full_path, f, mtime))
+        # Check streaming and autosave directories
+        self._scan_recovery_dir(stream_dir, ".json", "stream", recovery_files)
+        self._scan_recovery_dir(autosave_dir, ".ptproj", "autosave", recovery_files)
         
         if not recovery_files:
             QMessageBox.information(
@@ -709,13 +1185,12 @@ class MainWindow(QMainWindow):
             )
             return
         
-        # Sort by modification time (newest first)
-        recovery_files.sort(key=lambda x: x[3], reverse=True)
+        # Newest 20 by modification time, without sorting the whole list
+        recovery_files = heapq.nlargest(20, recovery_files, key=lambda x: x[3])
         
         # Show selection dialog
-        from datetime import datetime
         items = []
-        for file_type, path, name, mtime in recovery_files[:20]:  # Show max 20
+        for file_type, path, name, mtime in recovery_files:
             dt = datetime.fromtimestamp(mtime)
             time_str = dt.strftime("%Y-%m-%d %H:%M")
             type_label = "[STREAM]" if file_type == "stream" else "[AUTOSAVE]"
@@ -746,7 +1221,7 @@ class MainWindow(QMainWindow):
                 
                 if transcript:
                     self.transcript_editor.load_transcript(transcript)
-                    self.statistics_panel.set_transcript(transcript)
+                    self._set_stats_transcript(transcript)
                     self._enable_edit_actions(True)
                     self.save_action.setEnabled(True)
                     self.save_as_action.setEnabled(True)
@@ -778,41 +1253,81 @@ class MainWindow(QMainWindow):
     def save_project(self):
         """Save current project."""
         if self.current_project and self.current_project.file_path:
-            self._save_project_to(self.current_project.file_path)
+            self._save_project_to(self.current_project.file_path, background=True)
         else:
             self.save_project_as()
     
     def save_project_as(self):
         """Save project with new name."""
-        file_path, _ = QFileDialog.getSaveFileName(
-            self,
+        file_path = self._choose_project_save_path()
+        if file_path:
+            self._save_project_to(file_path, background=True)
+    
+    def _choose_project_save_path(self) -> Optional[str]:
+        """Ask for a project file to save to.
+        
+        Returns:
+            Path ending in .ptproj, or None if cancelled
+        """
+        dialog = self._get_file_dialog(
+            "save_project",
             "Save Project As",
-            "",
-            "PersonalTranscribe Projects (*.ptproj)"
+            ["PersonalTranscribe Projects (*.ptproj)"],
+            save=True
         )
+        file_path = self._run_file_dialog(dialog)
         
-        if file_path:
-            if not file_path.endswith(".ptproj"):
-                file_path += ".ptproj"
-            self._save_project_to(file_path)
+        if file_path and not file_path.endswith(".ptproj"):
+            file_path += ".ptproj"
+        return file_path or None
     
-    def _save_project_to(self, file_path: str):
-        """Save project to file."""
+    def _save_project_to(self, file_path: str, fsync: bool = True, background: bool = False):
+        """Save project to file.
+        
+        Args:
+            file_path: Path to save to
+            fsync: Flush the file to disk before the save completes
+            background: Write from a worker thread instead of blocking until
+                the file is on disk
+        """
+        # Never write the file while an autosave is still writing it
+        self._wait_for_autosave()
+        
         try:
             transcript = self.transcript_editor.get_transcript()
             
-            project = Project(
-                audio_file=self.current_audio_path or "",
-                transcript=transcript,
-                vocabulary=self.vocabulary.copy(),
-                file_path=file_path
-            )
+            # Reuse the open project when it already wraps this transcript
+            project = self.current_project
+            if project is not None and project.transcript is transcript:
+                project.audio_file = self.current_audio_path or ""
+                project.vocabulary = self._vocab_snapshot
+            else:
+                project = Project(
+                    audio_file=self.current_audio_path or "",
+                    transcript=transcript,
+                    vocabulary=self._vocab_snapshot,
+                    file_path=file_path
+                )
             
-            ProjectManager.save(project, file_path)
+            if background:
+                # The project and path are adopted once the worker has written them
+                self.status_label.setText(f"Saving: {os.path.basename(file_path)}...")
+                self._start_project_save(
+                    project, transcript, file_path,
+                    self._project_content_hash(transcript),
+                    fsync=fsync, manual=True
+                )
+                return
+            
+            ProjectManager.save(project, file_path, fsync=fsync)
             self.current_project = project
             self.save_action.setEnabled(True)
             self.is_modified = False
+            self._last_save_hash = self._project_content_hash(transcript)
+            self._last_save_ts = time.monotonic()
+            self.undo_stack.setClean()
             self.status_label.setText(f"Saved: {os.path.basename(file_path)}")
+            self._update_window_title(os.path.basename(file_path))
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to save project:\n{e}")
     
@@ -833,6 +1348,8 @@ class MainWindow(QMainWindow):
         # When that process exits, ALL GPU resources are freed by the OS
         # This completely eliminates the crash-on-load issue
         
+        from src.ui.transcription_subprocess_dialog import SubprocessTranscriptionDialog
+        
         dialog = SubprocessTranscriptionDialog(
             audio_path=self.current_audio_path,
             vocabulary=self.vocabulary,
@@ -887,6 +1404,7 @@ class MainWindow(QMainWindow):
         logger.info(f"Loading transcript: {file_path}")
         try:
             # Load from JSON file
+            from src.ui.transcription_dialog import TranscriptionWorkerV2
             transcript = TranscriptionWorkerV2.load_from_stream_file(file_path)
             
             if transcript:
@@ -894,7 +1412,7 @@ class MainWindow(QMainWindow):
                 
                 # Load into editor
                 self.transcript_editor.load_transcript(transcript)
-                self.statistics_panel.set_transcript(transcript)
+                self._set_stats_transcript(transcript)
                 
                 # Enable actions
                 self._enable_edit_actions(True)
@@ -950,7 +1468,7 @@ class MainWindow(QMainWindow):
             if transcript:
                 logger.info(f"[RECOVER] Loaded: {transcript.segment_count} segments")
                 self.transcript_editor.load_transcript(transcript)
-                self.statistics_panel.set_transcript(transcript)
+                self._set_stats_transcript(transcript)
                 self._enable_edit_actions(True)
                 self.save_action.setEnabled(True)
                 self.save_as_action.setEnabled(True)
@@ -1013,7 +1531,7 @@ class MainWindow(QMainWindow):
                 
                 # Update statistics panel
                 logger.debug("[LOAD 7] Updating statistics panel...")
-                self.statistics_panel.set_transcript(transcript)
+                self._set_stats_transcript(transcript)
                 logger.debug("[LOAD 7] Statistics panel updated")
                 
                 # Enable actions
@@ -1066,16 +1584,9 @@ class MainWindow(QMainWindow):
         """Start background autosave (non-blocking, fire-and-forget)."""
         logger.debug("[AUTOSAVE] Starting background autosave setup...")
         try:
-            import os
-            from datetime import datetime
-            from src.models.project import Project
             from src.ui.autosave_worker import AutosaveWorker
             
-            autosave_dir = os.path.join(
-                os.environ.get("LOCALAPPDATA", os.path.expanduser("~")),
-                "PersonalTranscribe",
-                "autosave"
-            )
+            autosave_dir = self._autosave_dir
             os.makedirs(autosave_dir, exist_ok=True)
             logger.debug(f"[AUTOSAVE] Directory: {autosave_dir}")
             
@@ -1123,16 +1634,8 @@ class MainWindow(QMainWindow):
     
     def _try_load_recent_transcription(self):
         """Try to find and load the most recent transcription file."""
-        autosave_dir = os.path.join(
-            os.environ.get("LOCALAPPDATA", os.path.expanduser("~")),
-            "PersonalTranscribe",
-            "autosave"
-        )
-        streaming_dir = os.path.join(
-            os.environ.get("LOCALAPPDATA", os.path.expanduser("~")),
-            "PersonalTranscribe", 
-            "streaming"
-        )
+        autosave_dir = self._autosave_dir
+        streaming_dir = self._streaming_dir
         
         latest_file = None
         latest_time = 0
@@ -1177,16 +1680,8 @@ class MainWindow(QMainWindow):
             # CRITICAL: Auto-save transcript in BACKGROUND to ensure we don't block the UI
             try:
                 # Prepare autosave path and project (lightweight operations)
-                import os
-                from datetime import datetime
-                from src.models.project import Project
-                
                 # Ensure directory
-                autosave_dir = os.path.join(
-                    os.environ.get("LOCALAPPDATA", os.path.expanduser("~")),
-                    "PersonalTranscribe",
-                    "autosave"
-                )
+                autosave_dir = self._autosave_dir
                 os.makedirs(autosave_dir, exist_ok=True)
                 
                 # Name file
@@ -1319,7 +1814,7 @@ class MainWindow(QMainWindow):
         try:
             transcript = getattr(self, '_current_transcript_for_stats', None)
             if transcript:
-                self.statistics_panel.set_transcript(transcript)
+                self._set_stats_transcript(transcript)
                 self._current_transcript_for_stats = None
         except Exception as e:
             from src.utils.logger import get_logger
@@ -1332,17 +1827,10 @@ class MainWindow(QMainWindow):
         Returns:
             Path to the saved file, or None if save failed
         """
-        import os
-        from datetime import datetime
-        from src.models.project import Project, ProjectManager
         
         try:
             # Create autosave directory
-            autosave_dir = os.path.join(
-                os.environ.get("LOCALAPPDATA", os.path.expanduser("~")),
-                "PersonalTranscribe",
-                "autosave"
-            )
+            autosave_dir = self._autosave_dir
             os.makedirs(autosave_dir, exist_ok=True)
             
             # Generate filename from audio file and timestamp
@@ -1382,9 +1870,19 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Warning", "No transcript to export.")
             return
         
-        # Pass metadata to export dialog
-        dialog = ExportDialog(transcript, self.current_audio_path, self.metadata, self)
-        dialog.exec()
+        self._get_export_dialog(transcript).exec()
+    
+    def _get_export_dialog(self, transcript: Transcript) -> "ExportDialog":
+        """Get the export dialog for a transcript, creating it on first use."""
+        if self._export_dialog is None:
+            from src.ui.export_dialog import ExportDialog
+            self._export_dialog = ExportDialog(
+                transcript, self.current_audio_path, self.metadata, self)
+        else:
+            self._export_dialog.set_transcript(transcript)
+            self._export_dialog.set_audio_path(self.current_audio_path)
+            self._export_dialog.set_metadata(self.metadata)
+        return self._export_dialog
     
     def edit_metadata(self):
         """Open metadata editor dialog."""
@@ -1394,14 +1892,18 @@ class MainWindow(QMainWindow):
         
         # Pre-populate with audio file info
         if self.current_audio_path:
-            import os
             self.metadata.original_filename = os.path.basename(self.current_audio_path)
         
         # Get audio duration from player
         if self.audio_player.duration_seconds > 0:
             self.metadata.audio_duration = self.audio_player.duration_seconds
         
-        dialog = MetadataDialog(self.metadata, self)
+        if self._metadata_dialog is None:
+            from src.ui.metadata_dialog import MetadataDialog
+            self._metadata_dialog = MetadataDialog(self.metadata, self)
+        else:
+            self._metadata_dialog.set_metadata(self.metadata)
+        dialog = self._metadata_dialog
         if dialog.exec():
             self.metadata = dialog.get_metadata()
             
@@ -1409,10 +1911,21 @@ class MainWindow(QMainWindow):
             if self.current_project:
                 self.current_project.metadata = self.metadata
             
-            self.is_modified = True
-            self._update_window_title()
+            self._mark_modified()
             logger.info("Metadata updated")
     
+    def _on_model_action_triggered(self, action: QAction):
+        """Apply the Whisper model selected in the model menu."""
+        self._set_whisper_model(action.data())
+    
+    def _on_device_action_triggered(self, action: QAction):
+        """Apply the device selected in the device menu."""
+        self._set_whisper_device(action.data())
+    
+    def _on_segment_mode_action_triggered(self, action: QAction):
+        """Apply the segment mode selected in the segment mode menu."""
+        self._set_segment_mode(action.data())
+    
     def _set_whisper_model(self, model: str):
         """Set the Whisper model to use for transcription."""
         self.settings.whisper_model = model
@@ -1449,9 +1962,15 @@ class MainWindow(QMainWindow):
     
     def open_vocabulary_manager(self):
         """Open vocabulary manager dialog."""
-        dialog = VocabularyDialog(self.vocabulary, self)
+        if self._vocab_dialog is None:
+            from src.ui.vocab_dialog import VocabularyDialog
+            self._vocab_dialog = VocabularyDialog(self.vocabulary, self)
+        else:
+            self._vocab_dialog.set_vocabulary(self.vocabulary)
+        dialog = self._vocab_dialog
         if dialog.exec():
             self.vocabulary = dialog.get_vocabulary()
+            self._vocab_snapshot = tuple(self.vocabulary)
             self._save_vocabulary()
     
     def _save_vocabulary(self):
@@ -1459,17 +1978,20 @@ class MainWindow(QMainWindow):
         vocab_path = Path(self.settings.vocabulary_file)
         try:
             vocab_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(vocab_path, "w", encoding="utf-8") as f:
-                f.write("# Custom Vocabulary for PersonalTranscribe\n")
-                for word in self.vocabulary:
-                    f.write(f"{word}\n")
-        except Exception as e:
-            print(f"Error saving vocabulary: {e}")
+            body = "# Custom Vocabulary for PersonalTranscribe\n"
+            if self.vocabulary:
+                body += "\n".join(self.vocabulary) + "\n"
+            
+            # Write next to the target and swap in, so a crash can't truncate it
+            tmp_path = vocab_path.with_name(vocab_path.name + ".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(body)
+            os.replace(tmp_path, vocab_path)
+        except Exception:
+            logger.exception("Vocabulary save failed")
     
     def jump_to_time(self):
         """Open dialog to jump to a specific time."""
-        from src.models.transcript import format_timestamp
-        
         current_pos = self.audio_player.get_current_position()
         duration = self.audio_player.duration_seconds
         
@@ -1480,43 +2002,55 @@ class MainWindow(QMainWindow):
         # Format hint
         hint = f"Current: {format_timestamp(current_pos)} / Duration: {format_timestamp(duration)}"
         
-        text, ok = QInputDialog.getText(
-            self,
-            "Jump to Time",
-            f"Enter time (MM:SS or HH:MM:SS):\n{hint}",
-            text=format_timestamp(current_pos)
-        )
+        with self._paused_position_updates():
+            text, ok = QInputDialog.getText(
+                self,
+                "Jump to Time",
+                f"Enter time (MM:SS or HH:MM:SS):\n{hint}",
+                text=format_timestamp(current_pos)
+            )
         
         if ok and text:
-            # Parse time input
-            try:
-                parts = text.strip().split(":")
-                if len(parts) == 2:
-                    # MM:SS
-                    minutes, seconds = map(float, parts)
-                    target_time = minutes * 60 + seconds
-                elif len(parts) == 3:
-                    # HH:MM:SS
-                    hours, minutes, seconds = map(float, parts)
-                    target_time = hours * 3600 + minutes * 60 + seconds
-                else:
-                    # Try as seconds
-                    target_time = float(text)
-                
-                if 0 <= target_time <= duration:
-                    self.audio_player.jump_to_time(target_time)
-                else:
-                    QMessageBox.warning(
-                        self,
-                        "Invalid Time",
-                        f"Time must be between 00:00 and {format_timestamp(duration)}"
-                    )
-            except ValueError:
+            # Parse time input; the regex is the validator
+            match = _TIME_RE.match(text.strip())
+            if not match:
                 QMessageBox.warning(
                     self,
                     "Invalid Format",
                     "Please enter time as MM:SS or HH:MM:SS"
                 )
+                return
+            
+            hours, minutes, seconds, bare_seconds = match.groups()
+            if seconds is not None:
+                target_time = int(hours or 0) * 3600 + int(minutes) * 60 + float(seconds)
+            else:
+                target_time = float(bare_seconds)
+            
+            if 0 <= target_time <= duration:
+                self.audio_player.jump_to_time(target_time)
+            else:
+                QMessageBox.warning(
+                    self,
+                    "Invalid Time",
+                    f"Time must be between 00:00 and {format_timestamp(duration)}"
+                )
+    
+    def _replay_last_5s(self):
+        """Replay the last 5 seconds of audio."""
+        self.audio_player.replay_last_seconds(5)
+    
+    def _skip_back_5s(self):
+        """Skip playback back 5 seconds."""
+        self.audio_player.skip(-5)
+    
+    def _skip_forward_5s(self):
+        """Skip playback forward 5 seconds."""
+        self.audio_player.skip(5)
+    
+    def _toggle_loop_mode(self):
+        """Toggle the audio player's loop mode."""
+        self.audio_player.loop_button.click()
     
     def toggle_waveform(self, checked: bool):
         """Toggle waveform visibility."""
@@ -1524,46 +2058,18 @@ class MainWindow(QMainWindow):
     
     def show_shortcuts(self):
         """Show keyboard shortcuts dialog."""
-        # Build HTML formatted shortcuts
-        shortcuts_html = """<h2>Keyboard Shortcuts</h2>"""
-        
-        # Define category order for better organization
-        category_order = ["File", "Playback", "Navigation", "Edit", "Transcription", "View"]
-        categories = Shortcuts.by_category()
-        
-        for category in category_order:
-            if category in categories:
-                shortcuts_html += f"<h3>{category}</h3><table>"
-                for shortcut in categories[category]:
-                    shortcuts_html += f"<tr><td><b>{shortcut.key_sequence}</b></td><td style='padding-left:20px'>{shortcut.description}</td></tr>"
-                shortcuts_html += "</table><br>"
-        
-        # Add any remaining categories not in the order list
-        for category, shortcuts in categories.items():
-            if category not in category_order:
-                shortcuts_html += f"<h3>{category}</h3><table>"
-                for shortcut in shortcuts:
-                    shortcuts_html += f"<tr><td><b>{shortcut.key_sequence}</b></td><td style='padding-left:20px'>{shortcut.description}</td></tr>"
-                shortcuts_html += "</table><br>"
-        
-        # Additional tips
-        shortcuts_html += """
-        <h3>Tips</h3>
-        <ul>
-            <li>Double-click a segment to edit text</li>
-            <li>Right-click segments for context menu</li>
-            <li>Click waveform to seek to position</li>
-            <li>Drag on waveform to select loop region</li>
-            <li>Use pagination controls for large transcripts</li>
-        </ul>
-        """
+        global _SHORTCUTS_HTML_CACHE
+        if _SHORTCUTS_HTML_CACHE is None:
+            _SHORTCUTS_HTML_CACHE = _build_shortcuts_html()
+        shortcuts_html = _SHORTCUTS_HTML_CACHE
         
         msg = QMessageBox(self)
         msg.setWindowTitle("Keyboard Shortcuts")
         msg.setTextFormat(Qt.TextFormat.RichText)
         msg.setText(shortcuts_html)
         msg.setIcon(QMessageBox.Icon.Information)
-        msg.exec()
+        with self._paused_position_updates():
+            msg.exec()
     
     def show_about(self):
         """Show about dialog."""
@@ -1622,48 +2128,66 @@ class MainWindow(QMainWindow):
         msg.setIcon(QMessageBox.Icon.Information)
         msg.exec()
     
+    def _open_path_in_background(self, path: str, on_missing, on_failed):
+        """Open a file or folder with the system shell on a worker thread.
+        
+        Args:
+            path: File or folder to open
+            on_missing: Slot called with the path if it doesn't exist
+            on_failed: Slot called with the path and error if the launch fails
+        """
+        from src.ui.open_path_worker import OpenPathWorker
+        worker = OpenPathWorker(path)
+        worker.missing.connect(on_missing)
+        worker.failed.connect(on_failed)
+        # Keep a reference until the thread is done so it isn't collected
+        self._open_path_workers.append(worker)
+        worker.finished.connect(lambda: self._open_path_workers.remove(worker))
+        worker.start()
+    
     def view_logs(self):
         """Open the log file in the default text editor."""
-        import subprocess
-        log_file = get_log_file_path()
-        
-        if log_file.exists():
-            log_size = format_size(get_log_size())
-            logger.info(f"Opening log file: {log_file}")
-            
-            # Open with default application
-            try:
-                os.startfile(str(log_file))
-            except Exception as e:
-                QMessageBox.warning(
-                    self, 
-                    "Could not open log file",
-                    f"Log file: {log_file}\nSize: {log_size}\n\nError: {e}"
-                )
-        else:
-            QMessageBox.information(
-                self,
-                "No Logs",
-                "No log file exists yet."
-            )
+        from src.utils.logger import get_log_file_path
+        self._open_path_in_background(
+            str(get_log_file_path()), self._on_log_file_missing, self._on_log_file_open_failed)
+    
+    def _on_log_file_missing(self, path: str):
+        """Report that there is no log file to open."""
+        QMessageBox.information(
+            self,
+            "No Logs",
+            "No log file exists yet."
+        )
+    
+    def _on_log_file_open_failed(self, path: str, error: str):
+        """Report that the log file couldn't be opened."""
+        from src.utils.logger import get_log_size, format_size
+        log_size = format_size(get_log_size())
+        QMessageBox.warning(
+            self, 
+            "Could not open log file",
+            f"Log file: {path}\nSize: {log_size}\n\nError: {error}"
+        )
     
     def open_log_folder(self):
         """Open the log folder in file explorer."""
-        log_file = get_log_file_path()
-        log_dir = log_file.parent
-        
-        if log_dir.exists():
-            logger.info(f"Opening log folder: {log_dir}")
-            try:
-                os.startfile(str(log_dir))
-            except Exception as e:
-                QMessageBox.warning(self, "Error", f"Could not open folder: {e}")
-        else:
-            QMessageBox.information(self, "No Logs", "Log folder does not exist yet.")
+        from src.utils.logger import get_log_file_path
+        self._open_path_in_background(
+            str(get_log_file_path().parent),
+            self._on_log_folder_missing, self._on_log_folder_open_failed)
+    
+    def _on_log_folder_missing(self, path: str):
+        """Report that there is no log folder to open."""
+        QMessageBox.information(self, "No Logs", "Log folder does not exist yet.")
+    
+    def _on_log_folder_open_failed(self, path: str, error: str):
+        """Report that the log folder couldn't be opened."""
+        QMessageBox.warning(self, "Error", f"Could not open folder: {error}")
     
     def clear_application_logs(self):
         """Clear all log files."""
-        log_size = get_log_size()
+        from src.utils.logger import clear_logs, scan_logs, format_size
+        log_files, log_size = scan_logs()
         
         reply = QMessageBox.question(
             self,
@@ -1674,7 +2198,7 @@ class MainWindow(QMainWindow):
         )
         
         if reply == QMessageBox.StandardButton.Yes:
-            files_deleted, bytes_freed = clear_logs()
+            files_deleted, bytes_freed = clear_logs(log_files)
             logger.info(f"Logs cleared: {files_deleted} files, {format_size(bytes_freed)}")
             QMessageBox.information(
                 self,
@@ -1682,22 +2206,145 @@ class MainWindow(QMainWindow):
                 f"Deleted {files_deleted} file(s), freed {format_size(bytes_freed)}"
             )
     
+    @contextmanager
+    def _paused_position_updates(self):
+        """Skip playback position updates while a modal dialog is open.
+        
+        The position display is brought up to date when the block exits.
+        """
+        self._position_updates_paused += 1
+        try:
+            yield
+        finally:
+            self._position_updates_paused -= 1
+            if not self._position_updates_paused and self.current_audio_path:
+                self._on_audio_position_changed(self.audio_player.get_current_position())
+    
     def _on_audio_position_changed(self, position_seconds: float):
-        """Handle audio position change."""
-        from src.models.transcript import format_timestamp
-        self.position_label.setText(format_timestamp(position_seconds))
+        """Handle audio position change, at most POSITION_UPDATE_INTERVAL apart."""
+        if self._position_updates_paused:
+            return
+        now = time.monotonic()
+        elapsed = now - self._last_pos_update
+        if elapsed < POSITION_UPDATE_INTERVAL:
+            self._pending_position = position_seconds
+            if not self._position_timer.isActive():
+                self._position_timer.start(int((POSITION_UPDATE_INTERVAL - elapsed) * 1000) + 1)
+            return
+        
+        self._last_pos_update = now
+        self._pending_position = None
+        self._update_position_display(position_seconds)
+    
+    def _apply_pending_position(self):
+        """Apply the last position received while updates were throttled."""
+        if self._pending_position is not None and not self._position_updates_paused:
+            position_seconds = self._pending_position
+            self._pending_position = None
+            self._last_pos_update = time.monotonic()
+            self._update_position_display(position_seconds)
+    
+    def _update_position_display(self, position_seconds: float):
+        """Update the position label and highlight the segment being played."""
+        sec = int(position_seconds)
+        if sec != self._last_pos_sec:
+            self._last_pos_sec = sec
+            self.position_label.setText(format_timestamp(sec))
         
         # Highlight corresponding segment
         transcript = self.transcript_editor.get_transcript()
         if transcript:
-            segment = transcript.get_segment_at_time(position_seconds)
+            # Usually still inside the segment highlighted last time
+            playing = self._playing_segment
+            if (
+                playing is not None
+                and self._segment_caches_valid(transcript)
+                and playing.start_time <= position_seconds <= playing.end_time
+            ):
+                return
+            
+            segment = self._segment_at_time(transcript, position_seconds)
             if segment:
+                self._playing_segment = segment
                 self.transcript_editor.highlight_segment(segment.id)
     
+    def _segment_at_time(self, transcript: Transcript, time_seconds: float):
+        """Find the segment containing a time using cached start times.
+        
+        Args:
+            transcript: Transcript to search
+            time_seconds: Playback position in seconds
+            
+        Returns:
+            The segment, or None if the time falls in a gap
+        """
+        self._ensure_segment_caches(transcript)
+        starts = self._segment_starts
+        if starts is None:
+            return transcript.get_segment_at_time(time_seconds)
+        
+        index = bisect_right(starts, time_seconds) - 1
+        if index >= 0:
+            segment = transcript.segments[index]
+            if time_seconds <= segment.end_time:
+                return segment
+        return None
+    
+    def _segment_caches_valid(self, transcript: Transcript) -> bool:
+        """Whether the segment lookup tables describe the given transcript.
+        
+        Text edits keep them valid. Merges, splits, inserts and deletes
+        drop them through the editor's segments_changed signal; the count
+        check only catches changes made outside the editor.
+        """
+        return (
+            self._segment_cache_owner is transcript
+            and self._segment_cache_count == len(transcript.segments)
+        )
+    
+    def _ensure_segment_caches(self, transcript: Transcript):
+        """Rebuild the segment lookup tables if they are stale."""
+        if not self._segment_caches_valid(transcript):
+            self._rebuild_segment_caches(transcript)
+    
+    def _rebuild_segment_caches(self, transcript: Transcript):
+        """Build the segment id map, start times and bookmark indices in one pass."""
+        id_to_idx = {}
+        starts = []
+        ends = []
+        bookmarks = []
+        in_order = True
+        previous_start = previous_end = float("-inf")
+        for i, seg in enumerate(transcript.segments):
+            id_to_idx[seg.id] = i
+            starts.append(seg.start_time)
+            ends.append(seg.end_time)
+            if seg.start_time < previous_start or seg.end_time < previous_end:
+                in_order = False
+            previous_start = seg.start_time
+            previous_end = seg.end_time
+            if seg.is_bookmarked:
+                bookmarks.append(i)
+        
+        self._segment_cache_owner = transcript
+        self._segment_cache_count = len(transcript.segments)
+        self._id_to_idx = id_to_idx
+        self._segment_starts = starts if in_order else None
+        self._segment_ends = ends if in_order else None
+        self._bookmark_indices = bookmarks
+        self._playing_segment = None
+    
+    def _invalidate_segment_caches(self):
+        """Drop the segment lookup tables so they are rebuilt on next use."""
+        self._segment_cache_owner = None
+        self._playing_segment = None
+    
     def _on_audio_duration_changed(self, duration_seconds: float):
         """Handle audio duration change."""
-        from src.models.transcript import format_timestamp
-        self.duration_label.setText(f"/ {format_timestamp(duration_seconds)}")
+        sec = int(duration_seconds)
+        if sec != self._last_duration_sec:
+            self._last_duration_sec = sec
+            self.duration_label.setText(f"/ {format_timestamp(sec)}")
     
     def _on_segment_clicked(self, segment):
         """Handle segment click - play that segment."""
@@ -1705,12 +2352,30 @@ class MainWindow(QMainWindow):
     
     def _on_segment_edited(self, segment):
         """Handle segment edit."""
-        self.is_modified = True
-        if not self.windowTitle().endswith("*"):
-            self.setWindowTitle(self.windowTitle() + " *")
+        self._mark_modified()
+        
+        # Update statistics panel once typing pauses
+        self._stats_refresh_timer.start()
+    
+    def _set_stats_transcript(self, transcript: Optional[Transcript]):
+        """Hand a new transcript to the statistics panel if it is on screen.
+        
+        The panel is only built when first shown, and a hidden panel picks
+        up the current transcript in toggle_statistics_panel() instead.
+        
+        Args:
+            transcript: Newly loaded transcript
+        """
+        if self.statistics_panel is not None and not self.stats_dock.isHidden():
+            self.statistics_panel.set_transcript(transcript)
+    
+    def _refresh_stats_panel(self):
+        """Recompute statistics if the panel is on screen.
         
-        # Update statistics panel
-        self.statistics_panel.update_statistics()
+        A hidden panel is refreshed by set_transcript() when it is shown.
+        """
+        if self.statistics_panel is not None and not self.stats_dock.isHidden():
+            self.statistics_panel.update_statistics()
     
     def _enable_edit_actions(self, enabled: bool):
         """Enable or disable edit-related actions."""
@@ -1728,8 +2393,19 @@ class MainWindow(QMainWindow):
     
     def open_ai_settings(self):
         """Open AI settings dialog."""
-        dialog = AISettingsDialog(self)
-        dialog.exec()
+        if self._ai_settings_dialog is None:
+            from src.ui.ai_settings_dialog import AISettingsDialog
+            self._ai_settings_dialog = AISettingsDialog(self)
+        else:
+            self._ai_settings_dialog.reload_settings()
+        with self._paused_position_updates():
+            self._ai_settings_dialog.exec()
+    
+    def _on_ai_polish_triggered(self, action: QAction):
+        """Open AI polish for the mode stored on the triggered AI menu action."""
+        mode = action.data()
+        if mode:
+            self.open_ai_polish(mode)
     
     def open_ai_polish(self, mode: str = "all"):
         """Open AI polish dialog with specified mode.
@@ -1770,12 +2446,22 @@ class MainWindow(QMainWindow):
                 audio_duration=self.audio_player.get_duration() if self.audio_player else 0,
                 parent=self
             )
-            if range_dialog.exec() != QDialog.DialogCode.Accepted:
+            with self._paused_position_updates():
+                accepted = range_dialog.exec() == QDialog.DialogCode.Accepted
+            if not accepted:
                 return
             start_time, end_time = range_dialog.get_range()
             
-            # Find segments in range
-            for i, seg in enumerate(transcript.segments):
+            # Find segments in range; with segments in time order only those
+            # ending at or after the range start and starting at or before
+            # its end can match
+            self._ensure_segment_caches(transcript)
+            lo, hi = 0, len(transcript.segments)
+            if self._segment_starts is not None:
+                lo = bisect_left(self._segment_ends, start_time)
+                hi = bisect_right(self._segment_starts, end_time)
+            for i in range(lo, hi):
+                seg = transcript.segments[i]
                 if seg.start_time >= start_time and seg.end_time <= end_time:
                     segments_to_polish.append(seg)
                     segment_indices.append(i)
@@ -1795,6 +2481,7 @@ class MainWindow(QMainWindow):
             segments_to_polish = transcript.segments
             segment_indices = list(range(len(transcript.segments)))
         
+        from src.ui.ai_polish_dialog import AIPolishDialog
         dialog = AIPolishDialog(
             transcript=transcript,
             segments_to_polish=segments_to_polish,
@@ -1802,21 +2489,16 @@ class MainWindow(QMainWindow):
             parent=self
         )
         dialog.changes_applied.connect(self._on_ai_polish_applied)
-        dialog.exec()
+        with self._paused_position_updates():
+            dialog.exec()
     
     def export_transcript(self):
         """Export the transcript to various formats."""
-        if not self.transcript_editor.get_transcript(): # Use transcript_editor to get transcript
+        transcript = self.transcript_editor.get_transcript()
+        if not transcript:
             return
-            
-        from src.ui.export_dialog import ExportDialog
-        dialog = ExportDialog(
-            transcript=self.transcript_editor.get_transcript(), # Use transcript_editor to get transcript
-            audio_file=self.current_audio_path,
-            metadata=self.metadata,
-            parent=self
-        )
-        dialog.exec()
+        
+        self._get_export_dialog(transcript).exec()
     
     def batch_transcribe(self):
         """Open batch transcription dialog."""
@@ -1866,9 +2548,9 @@ class MainWindow(QMainWindow):
         transcript = self.transcript_editor.get_transcript()
         if transcript:
             self.transcript_editor.set_transcript(transcript)
-            self.is_modified = True
-            self._update_window_title()
-            self.stats_panel.update_stats(transcript)
+            self._invalidate_segment_caches()
+            self._mark_modified()
+            self._stats_refresh_timer.start()
             logger.info("AI polish changes applied to transcript")
     
     def open_find_replace(self):
@@ -1878,9 +2560,13 @@ class MainWindow(QMainWindow):
             return
         
         if self.find_replace_dialog is None:
+            from src.ui.find_replace import FindReplaceDialog
             self.find_replace_dialog = FindReplaceDialog(transcript, self)
             self.find_replace_dialog.jump_to_segment.connect(self._on_segment_clicked)
-            self.find_replace_dialog.text_replaced.connect(self._on_find_replace_changed)
+            # Queued so the editor refresh runs after the dialog's slot returns
+            self.find_replace_dialog.text_replaced.connect(
+                self._on_find_replace_changed, Qt.ConnectionType.QueuedConnection
+            )
         else:
             self.find_replace_dialog.set_transcript(transcript)
         
@@ -1888,15 +2574,17 @@ class MainWindow(QMainWindow):
         self.find_replace_dialog.raise_()
         self.find_replace_dialog.activateWindow()
     
-    def _on_find_replace_changed(self):
-        """Handle changes from find/replace dialog."""
-        self.is_modified = True
-        if not self.windowTitle().endswith("*"):
-            self.setWindowTitle(self.windowTitle() + " *")
+    def _on_find_replace_changed(self, segment_ids: list):
+        """Handle changes from find/replace dialog.
         
-        # Refresh the table view
-        self.transcript_editor.model.layoutChanged.emit()
-        self.statistics_panel.update_statistics()
+        Args:
+            segment_ids: IDs of the segments whose text was replaced
+        """
+        self._mark_modified()
+        
+        # Repaint only the changed rows
+        self.transcript_editor.model.refresh_segments(segment_ids)
+        self._stats_refresh_timer.start()
     
     def toggle_bookmark(self):
         """Toggle bookmark on selected segment."""
@@ -1904,10 +2592,39 @@ class MainWindow(QMainWindow):
         if segment:
             transcript = self.transcript_editor.get_transcript()
             if transcript:
-                transcript.toggle_bookmark(segment.id)
-                self.transcript_editor.model.layoutChanged.emit()
-                self.is_modified = True
-                self.statistics_panel.update_statistics()
+                bookmarked = transcript.toggle_bookmark(segment.id)
+                if self._segment_caches_valid(transcript):
+                    # Patch the sorted bookmark indices in place
+                    indices = self._bookmark_indices
+                    index = self._id_to_idx.get(segment.id, -1)
+                    if index < 0:
+                        self._invalidate_segment_caches()
+                    elif bookmarked:
+                        insort(indices, index)
+                    else:
+                        pos = bisect_left(indices, index)
+                        if pos < len(indices) and indices[pos] == index:
+                            del indices[pos]
+                self.transcript_editor.model.refresh_segments([segment.id])
+                self._mark_modified()
+                self._stats_refresh_timer.start()
+    
+    def _get_segment_index(self, transcript: Transcript, segment_id: str) -> int:
+        """Get a segment's index via the cached id map. Returns -1 if not found."""
+        self._ensure_segment_caches(transcript)
+        return self._id_to_idx.get(segment_id, -1)
+    
+    def _get_bookmark_indices(self, transcript: Transcript) -> list:
+        """Get sorted indices of bookmarked segments."""
+        self._ensure_segment_caches(transcript)
+        return self._bookmark_indices
+    
+    def _jump_to_bookmark_index(self, transcript: Transcript, index: int):
+        """Select and play the bookmarked segment at the given index."""
+        seg = transcript.segments[index]
+        self.transcript_editor.highlight_segment(seg.id)
+        self.transcript_editor.table_view.selectRow(index)
+        self._on_segment_clicked(seg)
     
     def jump_to_next_bookmark(self):
         """Jump to next bookmarked segment."""
@@ -1915,7 +2632,7 @@ class MainWindow(QMainWindow):
         if not transcript:
             return
         
-        bookmarked = transcript.get_bookmarked_segments()
+        bookmarked = self._get_bookmark_indices(transcript)
         if not bookmarked:
             self.status_label.setText("No bookmarks found")
             return
@@ -1924,25 +2641,11 @@ class MainWindow(QMainWindow):
         current_segment = self.transcript_editor.get_selected_segment()
         current_idx = -1
         if current_segment:
-            current_idx = transcript.get_segment_index(current_segment.id)
-        
-        # Find next bookmark after current position
-        for seg in transcript.segments[current_idx + 1:]:
-            if seg.is_bookmarked:
-                self.transcript_editor.highlight_segment(seg.id)
-                row = transcript.get_segment_index(seg.id)
-                self.transcript_editor.table_view.selectRow(row)
-                self._on_segment_clicked(seg)
-                return
+            current_idx = self._get_segment_index(transcript, current_segment.id)
         
-        # Wrap around
-        for seg in transcript.segments[:current_idx + 1]:
-            if seg.is_bookmarked:
-                self.transcript_editor.highlight_segment(seg.id)
-                row = transcript.get_segment_index(seg.id)
-                self.transcript_editor.table_view.selectRow(row)
-                self._on_segment_clicked(seg)
-                return
+        # Next bookmark after current position, wrapping around
+        pos = bisect_right(bookmarked, current_idx)
+        self._jump_to_bookmark_index(transcript, bookmarked[pos] if pos < len(bookmarked) else bookmarked[0])
     
     def jump_to_prev_bookmark(self):
         """Jump to previous bookmarked segment."""
@@ -1950,7 +2653,7 @@ class MainWindow(QMainWindow):
         if not transcript:
             return
         
-        bookmarked = transcript.get_bookmarked_segments()
+        bookmarked = self._get_bookmark_indices(transcript)
         if not bookmarked:
             self.status_label.setText("No bookmarks found")
             return
@@ -1959,25 +2662,11 @@ class MainWindow(QMainWindow):
         current_segment = self.transcript_editor.get_selected_segment()
         current_idx = len(transcript.segments)
         if current_segment:
-            current_idx = transcript.get_segment_index(current_segment.id)
+            current_idx = self._get_segment_index(transcript, current_segment.id)
         
-        # Find prev bookmark before current position
-        for seg in reversed(transcript.segments[:current_idx]):
-            if seg.is_bookmarked:
-                self.transcript_editor.highlight_segment(seg.id)
-                row = transcript.get_segment_index(seg.id)
-                self.transcript_editor.table_view.selectRow(row)
-                self._on_segment_clicked(seg)
-                return
-        
-        # Wrap around
-        for seg in reversed(transcript.segments[current_idx:]):
-            if seg.is_bookmarked:
-                self.transcript_editor.highlight_segment(seg.id)
-                row = transcript.get_segment_index(seg.id)
-                self.transcript_editor.table_view.selectRow(row)
-                self._on_segment_clicked(seg)
-                return
+        # Previous bookmark before current position, wrapping around
+        pos = bisect_left(bookmarked, current_idx)
+        self._jump_to_bookmark_index(transcript, bookmarked[pos - 1] if pos > 0 else bookmarked[-1])
     
     def set_speaker_label(self):
         """Set speaker label for selected segment."""
@@ -1986,17 +2675,18 @@ class MainWindow(QMainWindow):
             QMessageBox.information(self, "Speaker Label", "Please select a segment first.")
             return
         
-        label, ok = QInputDialog.getText(
-            self,
-            "Set Speaker Label",
-            "Enter speaker label (e.g., 'ME', 'SPEAKER 1'):",
-            text=segment.speaker_label
-        )
+        with self._paused_position_updates():
+            label, ok = QInputDialog.getText(
+                self,
+                "Set Speaker Label",
+                "Enter speaker label (e.g., 'ME', 'SPEAKER 1'):",
+                text=segment.speaker_label
+            )
         
         if ok:
             segment.speaker_label = label.strip()
-            self.transcript_editor.model.layoutChanged.emit()
-            self.is_modified = True
+            self.transcript_editor.model.refresh_segments([segment.id])
+            self._mark_modified()
     
     def toggle_confidence_highlighting(self, checked: bool):
         """Toggle confidence highlighting in transcript."""
@@ -2021,6 +2711,10 @@ class MainWindow(QMainWindow):
     def toggle_statistics_panel(self, checked: bool):
         """Show or hide statistics panel."""
         if checked:
+            if self.statistics_panel is None:
+                from src.ui.statistics_panel import StatisticsPanel
+                self.statistics_panel = StatisticsPanel()
+                self.stats_dock.setWidget(self.statistics_panel)
             self.stats_dock.show()
             transcript = self.transcript_editor.get_transcript()
             if transcript:
@@ -2028,17 +2722,29 @@ class MainWindow(QMainWindow):
         else:
             self.stats_dock.hide()
     
+    def toggle_native_file_dialogs(self, checked: bool):
+        """Toggle between native and Qt file dialogs."""
+        self.settings.file_dialog_use_native = checked
+        self.settings_manager.save()
+        
+        # Recreate dialogs with the new options when next opened
+        for dialog in self._file_dialogs.values():
+            dialog.deleteLater()
+        self._file_dialogs.clear()
+    
     def toggle_dark_mode(self, checked: bool):
         """Toggle dark mode theme."""
         theme = "dark" if checked else "light"
         self.settings.theme = theme
         
-        try:
-            theme_path = f"resources/themes/{theme}.qss"
-            with open(theme_path, "r") as f:
-                QApplication.instance().setStyleSheet(f.read())
-        except FileNotFoundError:
-            print(f"Theme file not found: {theme_path}")
+        qss = _load_theme_qss(theme)
+        if qss is None:
+            logger.warning(f"Theme file not found: resources/themes/{theme}.qss")
+        else:
+            # Restyling every widget is expensive; skip it if nothing changes
+            app = QApplication.instance()
+            if app.styleSheet() != qss:
+                app.setStyleSheet(qss)
         
         self.settings_manager.save()
     
@@ -2055,16 +2761,28 @@ class MainWindow(QMainWindow):
             )
             
             if reply == QMessageBox.StandardButton.Save:
-                self.save_project()
+                # Save synchronously so errors are reported before closing
+                if self.current_project and self.current_project.file_path:
+                    file_path = self.current_project.file_path
+                else:
+                    file_path = self._choose_project_save_path()
+                if file_path:
+                    self._save_project_to(file_path)
             elif reply == QMessageBox.StandardButton.Cancel:
                 event.ignore()
                 return
         
+        # Unsaved edits were handled by the prompt above
+        self.autosave_timer.stop()
+        self._wait_for_autosave()
+        
         # Save window state
         self.settings.window_width = self.width()
         self.settings.window_height = self.height()
         self.settings.window_maximized = self.isMaximized()
-        self.settings.splitter_sizes = self.main_splitter.sizes()
+        self.settings_manager.set_bytes("window_geometry", self.saveGeometry())
+        self.settings_manager.set_bytes("window_state", self.saveState())
+        self.settings_manager.set_bytes("splitter_state", self.main_splitter.saveState())
         self.settings_manager.save()
         
         event.accept()
@@ -163,6 +163,23 @@ class MetadataDialog(QDialog):
         buttons.rejected.connect(self.reject)
         layout.addWidget(buttons)
     
+    def set_metadata(self, metadata: Optional[RecordingMetadata]):
+        """Replace the metadata being edited when the dialog is reused."""
+        self.metadata = metadata or RecordingMetadata()
+        
+        for edit in (
+            self.case_name_edit, self.case_number_edit, self.client_name_edit,
+            self.location_edit, self.source_edit, self.new_participant_edit,
+            self.transcriptionist_edit
+        ):
+            edit.clear()
+        self.recording_time_edit.setTime(QTime(0, 0))
+        self.participants_list.clear()
+        self.transcription_date_edit.setDate(QDate.currentDate())
+        self.notes_edit.clear()
+        
+        self._load_metadata()
+    
     def _load_metadata(self):
         """Load metadata into the form fields."""
         m = self.metadata
@@ -0,0 +1,35 @@
+"""
+Background worker for opening files and folders with the system shell.
+"""
+
+import os
+
+from PyQt6.QtCore import QThread, pyqtSignal
+from src.utils.logger import get_logger
+
+logger = get_logger("open_path_worker")
+
+class OpenPathWorker(QThread):
+    """Worker thread that checks a path and opens it with its default application.
+    
+    Shell launches can block for hundreds of milliseconds while Explorer or
+    an editor starts, so they are kept off the GUI thread.
+    """
+    
+    missing = pyqtSignal(str)  # path
+    failed = pyqtSignal(str, str)  # path, error
+    
+    def __init__(self, path: str):
+        super().__init__()
+        self.path = path
+        
+    def run(self):
+        if not os.path.exists(self.path):
+            self.missing.emit(self.path)
+            return
+        try:
+            logger.info(f"Opening: {self.path}")
+            os.startfile(self.path)
+        except Exception as e:
+            logger.error(f"Could not open {self.path}: {e}")
+            self.failed.emit(self.path, str(e))
@@ -3,6 +3,7 @@ Transcript editor widget for PersonalTranscribe.
 Provides line-by-line editing with timestamp display and confidence highlighting.
 """
 
+from bisect import bisect_left, bisect_right
 from typing import Optional, List
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QTableView, QHeaderView,
@@ -100,13 +101,29 @@ class TranscriptTableModel(QAbstractTableModel):
         self.highlighted_segment_id: Optional[str] = None
         self.show_confidence_highlighting: bool = True
         self.show_gaps: bool = True  # Show gap indicators
+        # Sorted rows of low confidence segments, built on first use
+        self._low_confidence_rows: Optional[List[int]] = None
     
     def set_transcript(self, transcript: Transcript):
         """Set the transcript data."""
         self.beginResetModel()
         self.transcript = transcript
+        self._low_confidence_rows = None
         self.endResetModel()
     
+    def get_low_confidence_rows(self) -> List[int]:
+        """Get sorted rows whose segment confidence is below CONFIDENCE_MEDIUM.
+        
+        Word confidences don't change on text edits, so the rows are only
+        recomputed when the transcript is replaced.
+        """
+        if self._low_confidence_rows is None:
+            segments = self.transcript.segments if self.transcript else []
+            self._low_confidence_rows = [
+                i for i, s in enumerate(segments) if s.average_confidence < CONFIDENCE_MEDIUM
+            ]
+        return self._low_confidence_rows
+    
     def get_transcript(self) -> Optional[Transcript]:
         """Get the current transcript."""
         return self.transcript
@@ -271,6 +288,25 @@ class TranscriptTableModel(QAbstractTableModel):
                     idx2 = self.index(i, self.columnCount() - 1)
                     self.dataChanged.emit(idx, idx2)
     
+    def refresh_segments(self, segment_ids):
+        """Repaint the rows of the given segments with a single dataChanged.
+        
+        The range starts at the time column, so it isn't mistaken for a
+        text edit by TranscriptEditor._on_data_changed.
+        
+        Args:
+            segment_ids: IDs of segments whose display changed
+        """
+        if self.transcript is None:
+            return
+        ids = set(segment_ids)
+        rows = [i for i, seg in enumerate(self.transcript.segments) if seg.id in ids]
+        if rows:
+            self.dataChanged.emit(
+                self.index(rows[0], 0),
+                self.index(rows[-1], self.columnCount() - 1)
+            )
+    
     def get_segment_at_row(self, row: int) -> Optional[Segment]:
         """Get segment at a specific row."""
         if self.transcript and 0 <= row < len(self.transcript.segments):
@@ -488,6 +524,7 @@ class TranscriptEditor(QWidget):
     
     segment_clicked = pyqtSignal(object)  # Segment
     segment_edited = pyqtSignal(object)   # Segment
+    segments_changed = pyqtSignal()       # Segments merged, split, inserted or deleted
     
     # Pagination settings
     SEGMENTS_PER_PAGE = 100
@@ -602,7 +639,10 @@ class TranscriptEditor(QWidget):
         
         For large transcripts (>100 segments), uses pagination and 
         simplified display mode to prevent crashes and improve performance.
+        Repaints are suspended until the load finishes, so switching display
+        mode, pagination and row sizing are drawn once.
         """
+        self.setUpdatesEnabled(False)
         try:
             segment_count = len(transcript.segments)
             logger.info(f"Loading transcript with {segment_count} segments")
@@ -655,6 +695,8 @@ class TranscriptEditor(QWidget):
             logger.error(f"CRITICAL ERROR in load_transcript: {e}", exc_info=True)
             # Re-raise to ensure main_window sees it too
             raise
+        finally:
+            self.setUpdatesEnabled(True)
     
     def _enable_simple_mode(self):
         """Enable simplified display mode for large transcripts."""
@@ -889,6 +931,16 @@ class TranscriptEditor(QWidget):
             return []
         return [s for s in transcript.segments if s.average_confidence < threshold]
     
+    def _jump_to_row(self, row: int) -> Optional[Segment]:
+        """Select, scroll to and announce the segment at a row."""
+        segment = self.model.get_segment_at_row(row)
+        if segment:
+            index = self.model.index(row, 0)
+            self.table_view.selectRow(row)
+            self.table_view.scrollTo(index)
+            self.segment_clicked.emit(segment)
+        return segment
+    
     def jump_to_next_low_confidence(self, from_row: int = -1) -> Optional[Segment]:
         """Jump to next segment with low confidence words.
         
@@ -898,8 +950,8 @@ class TranscriptEditor(QWidget):
         Returns:
             Segment jumped to, or None if not found
         """
-        transcript = self.model.get_transcript()
-        if not transcript:
+        rows = self.model.get_low_confidence_rows()
+        if not rows:
             return None
         
         # Get starting row
@@ -907,28 +959,9 @@ class TranscriptEditor(QWidget):
             selected = self.table_view.selectedIndexes()
             from_row = selected[0].row() if selected else -1
         
-        # Search from next row
-        for i in range(from_row + 1, len(transcript.segments)):
-            segment = transcript.segments[i]
-            if segment.average_confidence < CONFIDENCE_MEDIUM:
-                # Select and scroll to this row
-                index = self.model.index(i, 0)
-                self.table_view.selectRow(i)
-                self.table_view.scrollTo(index)
-                self.segment_clicked.emit(segment)
-                return segment
-        
-        # Wrap around to beginning
-        for i in range(0, from_row + 1):
-            segment = transcript.segments[i]
-            if segment.average_confidence < CONFIDENCE_MEDIUM:
-                index = self.model.index(i, 0)
-                self.table_view.selectRow(i)
-                self.table_view.scrollTo(index)
-                self.segment_clicked.emit(segment)
-                return segment
-        
-        return None
+        # Next row after from_row, wrapping around to the beginning
+        pos = bisect_right(rows, from_row)
+        return self._jump_to_row(rows[pos] if pos < len(rows) else rows[0])
     
     def jump_to_prev_low_confidence(self, from_row: int = -1) -> Optional[Segment]:
         """Jump to previous segment with low confidence words.
@@ -939,36 +972,18 @@ class TranscriptEditor(QWidget):
         Returns:
             Segment jumped to, or None if not found
         """
-        transcript = self.model.get_transcript()
-        if not transcript:
+        rows = self.model.get_low_confidence_rows()
+        if not rows:
             return None
         
         # Get starting row
         if from_row < 0:
             selected = self.table_view.selectedIndexes()
-            from_row = selected[0].row() if selected else len(transcript.segments)
-        
-        # Search backwards from previous row
-        for i in range(from_row - 1, -1, -1):
-            segment = transcript.segments[i]
-            if segment.average_confidence < CONFIDENCE_MEDIUM:
-                index = self.model.index(i, 0)
-                self.table_view.selectRow(i)
-                self.table_view.scrollTo(index)
-                self.segment_clicked.emit(segment)
-                return segment
-        
-        # Wrap around to end
-        for i in range(len(transcript.segments) - 1, from_row - 1, -1):
-            segment = transcript.segments[i]
-            if segment.average_confidence < CONFIDENCE_MEDIUM:
-                index = self.model.index(i, 0)
-                self.table_view.selectRow(i)
-                self.table_view.scrollTo(index)
-                self.segment_clicked.emit(segment)
-                return segment
+            from_row = selected[0].row() if selected else self.model.rowCount()
         
-        return None
+        # Previous row before from_row, wrapping around to the end
+        pos = bisect_left(rows, from_row)
+        return self._jump_to_row(rows[pos - 1] if pos > 0 else rows[-1])
     
     def get_selected_segment_indices(self) -> List[int]:
         """Get indices of all selected segments.
@@ -1253,6 +1268,7 @@ class TranscriptEditor(QWidget):
     
     def _refresh_after_edit(self):
         """Refresh the display after editing segments."""
+        self.segments_changed.emit()
         transcript = self.get_transcript()
         if transcript:
             # Update pagination if needed
@@ -44,7 +44,9 @@ class TranscriptionWorkerV2(QThread):
         vocabulary: list,
         model_size: str = "large-v3",
         device: str = "auto",
-        segment_mode: str = "natural"  # "natural" or "sentence"
+        segment_mode: str = "natural",  # "natural" or "sentence"
+        language: Optional[str] = None,  # None = auto-detect
+        engine=None  # Optional preloaded WhisperEngine to reuse
     ):
         super().__init__()
         self.audio_path = audio_path
@@ -52,11 +54,24 @@ class TranscriptionWorkerV2(QThread):
         self.model_size = model_size
         self.device = device
         self.segment_mode = segment_mode
+        self.language = language
+        self.engine = engine
         self._cancelled = False
         self._model = None  # Keep reference for cleanup
         self._temp_audio_path: Optional[str] = None  # For preprocessed audio
         self._stream_file_path: Optional[str] = None  # For streaming transcription to disk
     
+    def reset(self, audio_path: str):
+        """Prepare the worker to process another file.
+        
+        Lets a pooled thread drive one worker through several files instead
+        of constructing a new worker per file.
+        """
+        self.audio_path = audio_path
+        self._cancelled = False
+        self._temp_audio_path = None
+        self._stream_file_path = None
+    
     def cancel(self):
         """Request cancellation."""
         self._cancelled = True
@@ -103,7 +118,8 @@ class TranscriptionWorkerV2(QThread):
             
             # Export to temp WAV file
             temp_dir = tempfile.gettempdir()
-            temp_path = os.path.join(temp_dir, f"whisper_preprocessed_{os.getpid()}.wav")
+            # Include the worker id so concurrent workers don't share a temp file
+            temp_path = os.path.join(temp_dir, f"whisper_preprocessed_{os.getpid()}_{id(self)}.wav")
             
             audio.export(temp_path, format="wav")
             self._temp_audio_path = temp_path
@@ -299,62 +315,70 @@ class TranscriptionWorkerV2(QThread):
             from faster_whisper import WhisperModel
             from src.models.transcript import Transcript, Segment, Word
             
-            # Stage 1: Detect device
-            self.stage_changed.emit("Detecting GPU/CUDA support...")
-            self.log_message.emit("Checking CUDA availability...", "info")
-            logger.debug("Checking CUDA availability...")
-            
-            device, compute_type = self._determine_device()
-            self.device_detected.emit(device, compute_type)
-            logger.info(f"Device detected: {device}, compute_type: {compute_type}")
-            
-            if device == "cuda":
-                self.log_message.emit(f"CUDA available! Using GPU with {compute_type}", "success")
-            else:
-                self.log_message.emit("CUDA not available. Using CPU (this will be slower)", "warning")
-            
-            if self._cancelled:
-                return
-            
-            # Stage 2: Check model cache
-            self.stage_changed.emit("Checking model cache...")
-            cache_path = self._get_model_cache_path()
-            
-            if cache_path and cache_path.exists():
-                self.log_message.emit(f"Model found in cache: {cache_path}", "info")
+            if self.engine is not None and self.engine.is_loaded():
+                # Reuse the caller's preloaded model instead of loading per file
+                model = self.engine.model
+                device = self.engine.actual_device
+                compute_type = self.engine.actual_compute_type
+                self.device_detected.emit(device, compute_type)
+                self.log_message.emit(f"Using preloaded {self.model_size} model on {device.upper()}", "info")
             else:
-                self.log_message.emit(f"Model not cached. Will download {self.model_size} (~3GB)...", "warning")
-            
-            if self._cancelled:
-                return
-            
-            # Stage 3: Load model
-            self.stage_changed.emit("Loading Whisper model...")
-            self.log_message.emit(f"Loading {self.model_size} model on {device.upper()}...", "info")
-            self.progress.emit(5)
-            
-            start_load = time.time()
-            
-            try:
-                model = WhisperModel(
-                    self.model_size,
-                    device=device,
-                    compute_type=compute_type
-                )
-                load_time = time.time() - start_load
-                self.log_message.emit(f"Model loaded in {load_time:.1f} seconds", "success")
-            except Exception as e:
-                error_msg = str(e)
-                if "cudnn" in error_msg.lower() or "cuda" in error_msg.lower():
-                    self.log_message.emit(f"GPU failed: {error_msg}", "error")
-                    self.log_message.emit("Falling back to CPU...", "warning")
-                    device = "cpu"
-                    compute_type = "int8"
-                    self.device_detected.emit(device, compute_type)
-                    model = WhisperModel(self.model_size, device="cpu", compute_type="int8")
-                    self.log_message.emit("Model loaded on CPU (fallback)", "warning")
+                # Stage 1: Detect device
+                self.stage_changed.emit("Detecting GPU/CUDA support...")
+                self.log_message.emit("Checking CUDA availability...", "info")
+                logger.debug("Checking CUDA availability...")
+                
+                device, compute_type = self._determine_device()
+                self.device_detected.emit(device, compute_type)
+                logger.info(f"Device detected: {device}, compute_type: {compute_type}")
+                
+                if device == "cuda":
+                    self.log_message.emit(f"CUDA available! Using GPU with {compute_type}", "success")
                 else:
-                    raise
+                    self.log_message.emit("CUDA not available. Using CPU (this will be slower)", "warning")
+                
+                if self._cancelled:
+                    return
+                
+                # Stage 2: Check model cache
+                self.stage_changed.emit("Checking model cache...")
+                cache_path = self._get_model_cache_path()
+                
+                if cache_path and cache_path.exists():
+                    self.log_message.emit(f"Model found in cache: {cache_path}", "info")
+                else:
+                    self.log_message.emit(f"Model not cached. Will download {self.model_size} (~3GB)...", "warning")
+                
+                if self._cancelled:
+                    return
+                
+                # Stage 3: Load model
+                self.stage_changed.emit("Loading Whisper model...")
+                self.log_message.emit(f"Loading {self.model_size} model on {device.upper()}...", "info")
+                self.progress.emit(5)
+                
+                start_load = time.time()
+                
+                try:
+                    model = WhisperModel(
+                        self.model_size,
+                        device=device,
+                        compute_type=compute_type
+                    )
+                    load_time = time.time() - start_load
+                    self.log_message.emit(f"Model loaded in {load_time:.1f} seconds", "success")
+                except Exception as e:
+                    error_msg = str(e)
+                    if "cudnn" in error_msg.lower() or "cuda" in error_msg.lower():
+                        self.log_message.emit(f"GPU failed: {error_msg}", "error")
+                        self.log_message.emit("Falling back to CPU...", "warning")
+                        device = "cpu"
+                        compute_type = "int8"
+                        self.device_detected.emit(device, compute_type)
+                        model = WhisperModel(self.model_size, device="cpu", compute_type="int8")
+                        self.log_message.emit("Model loaded on CPU (fallback)", "warning")
+                    else:
+                        raise
             
             if self._cancelled:
                 self._cleanup_temp_files()
@@ -410,7 +434,7 @@ class TranscriptionWorkerV2(QThread):
                 beam_size=5,
                 word_timestamps=True,
                 initial_prompt=initial_prompt,
-                language=None,  # Auto-detect
+                language=self.language,  # None = auto-detect
                 vad_filter=True,
                 vad_parameters=vad_params
             )
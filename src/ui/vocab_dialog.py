@@ -107,6 +107,12 @@ class VocabularyDialog(QDialog):
         button_box.rejected.connect(self.reject)
         layout.addWidget(button_box)
     
+    def set_vocabulary(self, vocabulary: List[str]):
+        """Replace the vocabulary being edited when the dialog is reused."""
+        self.vocabulary = list(vocabulary)
+        self.word_input.clear()
+        self._load_vocabulary()
+    
     def _load_vocabulary(self):
         """Load vocabulary into list widget."""
         self.word_list.clear()
@@ -180,21 +186,22 @@ class VocabularyDialog(QDialog):
             return
         
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                lines = f.readlines()
-            
-            imported = 0
             existing_words = set(
                 self.word_list.item(i).text().lower()
                 for i in range(self.word_list.count())
             )
             
-            for line in lines:
-                word = line.strip()
-                if word and not word.startswith("#") and word.lower() not in existing_words:
-                    self.word_list.addItem(word)
-                    existing_words.add(word.lower())
-                    imported += 1
+            # Stream the file, stripping each line once
+            new_words = []
+            with open(file_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    word = line.strip()
+                    if word and not word.startswith("#") and word.lower() not in existing_words:
+                        new_words.append(word)
+                        existing_words.add(word.lower())
+            
+            self.word_list.addItems(new_words)
+            imported = len(new_words)
             
             self._update_count()
             QMessageBox.information(
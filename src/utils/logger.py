@@ -5,16 +5,20 @@ Provides file and console logging with rotation and clear functionality.
 
 import os
 import sys
+import queue
+import atexit
+import fnmatch
 import logging
 from datetime import datetime
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
-from typing import Optional
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
+from typing import List, Optional, Tuple
 
 
 # Global logger instance
 _logger: Optional[logging.Logger] = None
 _log_file_path: Optional[Path] = None
+_listener: Optional[QueueListener] = None
 
 
 def get_log_directory() -> Path:
@@ -42,13 +46,16 @@ def get_log_file_path() -> Path:
 def setup_logging(level: int = logging.DEBUG) -> logging.Logger:
     """Setup application logging.
     
+    Records are queued and written by a background listener thread, so
+    logging from the GUI thread never waits on the console or the disk.
+    
     Args:
         level: Logging level (default DEBUG for development)
         
     Returns:
         Configured logger instance
     """
-    global _logger
+    global _logger, _listener
     
     if _logger is not None:
         return _logger
@@ -71,7 +78,6 @@ def setup_logging(level: int = logging.DEBUG) -> logging.Logger:
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(log_format)
-    _logger.addHandler(console_handler)
     
     # File handler with rotation (5 MB max, keep 3 backups)
     log_file = get_log_file_path()
@@ -83,7 +89,14 @@ def setup_logging(level: int = logging.DEBUG) -> logging.Logger:
     )
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(log_format)
-    _logger.addHandler(file_handler)
+    
+    # Hand records to a background thread that owns the real handlers
+    log_queue = queue.SimpleQueue()
+    _logger.addHandler(QueueHandler(log_queue))
+    _listener = QueueListener(
+        log_queue, console_handler, file_handler, respect_handler_level=True
+    )
+    _listener.start()
     
     # Log startup
     _logger.info("=" * 60)
@@ -96,6 +109,26 @@ def setup_logging(level: int = logging.DEBUG) -> logging.Logger:
     return _logger
 
 
+def shutdown_logging() -> None:
+    """Flush queued records and close the log handlers."""
+    global _logger, _listener
+    
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+    
+    if _logger is not None:
+        for handler in _logger.handlers[:]:
+            handler.close()
+            _logger.removeHandler(handler)
+        _logger = None
+
+
+atexit.register(shutdown_logging)
+
+
 def get_logger(name: Optional[str] = None) -> logging.Logger:
     """Get a logger instance.
     
@@ -115,52 +148,68 @@ def get_logger(name: Optional[str] = None) -> logging.Logger:
     return _logger
 
 
-def clear_logs() -> tuple:
+def scan_logs() -> Tuple[List[Tuple[Path, int]], int]:
+    """List log files and their sizes in one directory pass.
+    
+    Returns:
+        Tuple of ([(path, size_bytes), ...], total_bytes)
+    """
+    files = []
+    total_size = 0
+    
+    with os.scandir(get_log_directory()) as entries:
+        for entry in entries:
+            if not fnmatch.fnmatch(entry.name, "*.log*"):
+                continue
+            try:
+                size = entry.stat().st_size
+            except OSError:
+                continue
+            files.append((Path(entry.path), size))
+            total_size += size
+    
+    return files, total_size
+
+
+def clear_logs(files: Optional[List[Tuple[Path, int]]] = None) -> tuple:
     """Clear all log files.
     
+    Args:
+        files: Log files from scan_logs(), to avoid listing the directory again
+    
     Returns:
         Tuple of (files_deleted, bytes_freed)
     """
-    log_dir = get_log_directory()
+    if files is None:
+        files, _ = scan_logs()
     files_deleted = 0
     bytes_freed = 0
+    failed = []
     
-    for log_file in log_dir.glob("*.log*"):
+    # Close the log file first so it can be deleted on Windows
+    shutdown_logging()
+    
+    for log_file, size in files:
         try:
-            size = log_file.stat().st_size
             log_file.unlink()
             files_deleted += 1
             bytes_freed += size
         except Exception as e:
-            print(f"Could not delete {log_file}: {e}")
-    
-    # Reinitialize logging after clearing
-    global _logger
-    if _logger:
-        for handler in _logger.handlers[:]:
-            handler.close()
-            _logger.removeHandler(handler)
-        _logger = None
+            failed.append((log_file, e))
     
-    # Setup fresh logger
+    # Setup fresh logger, then report what couldn't be deleted
     setup_logging()
-    get_logger().info("Logs cleared by user")
+    logger = get_logger()
+    logger.info("Logs cleared by user")
+    for log_file, e in failed:
+        logger.warning(f"Could not delete {log_file}: {e}")
     
     return files_deleted, bytes_freed
 
 
 def get_log_size() -> int:
     """Get total size of log files in bytes."""
-    log_dir = get_log_directory()
-    total_size = 0
-    
-    for log_file in log_dir.glob("*.log*"):
-        try:
-            total_size += log_file.stat().st_size
-        except Exception:
-            pass
-    
-    return total_size
+    return scan_logs()[1]
 
 
 def format_size(size_bytes: int) -> str: